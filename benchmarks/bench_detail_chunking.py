@@ -0,0 +1,96 @@
+# benchmarks/bench_detail_chunking.py
+"""
+직방 상세 정보 요청의 묶음 처리 방식별 처리 시간, 요청 수, 받은 매물 수를 로컬 목 서버로 비교합니다.
+
+- fixed: 100개씩 고정 묶음, 실패한 묶음은 통째로 버림 (기존 방식)
+- fixed+split: 100개씩 고정 묶음, 실패한 묶음은 반으로 나눠 다시 요청
+- adaptive: 묶음 크기 자동 조절 + 실패한 묶음 분할 (ZIGBANG_DETAIL_CHUNK_SIZING, 기본 동작)
+
+목 서버는 요청마다 --latency초, 매물 하나당 --item-latency초가 걸리고, 요청 하나에 --max-batch개보다 많은 ID가 있으면 413,
+--bad-ids개의 무작위 ID가 섞인 요청에는 400으로 응답합니다.
+
+이어서 모든 상세 요청이 --blanket-statuses 중 한 상태 코드로 실패하는 경우(권한 만료, 요청 제한 등)에
+--blanket-items개의 ID를 요청하며 보낸 요청 수와 걸린 시간을 출력합니다.
+묶음을 나눠도 해결되지 않는 상태 코드(401/403/429 등)에서는 묶음마다 요청 계층의 재시도 횟수만큼만 요청해야 합니다.
+
+실행: python -m benchmarks.bench_detail_chunking --items 20000 --bad-ids 5 --max-batch 300 --blanket-statuses 400 403 429
+"""
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.mock_server import MockApiServer
+from benchmarks.run_suite import _prepare_client, _unthrottle
+from platform_configs.zigbang_config import ZIGBANG_DETAIL_CHUNK_SIZE
+from platform_crawlers.zigbang.zigbang_api_client import ZigbangApiClient
+
+
+def fetch_without_split(client, item_ids, chunk_size=ZIGBANG_DETAIL_CHUNK_SIZE):
+    # 기존 방식: 고정 크기 묶음을 동시에 요청하고, 실패한 묶음(None)은 그대로 버림
+    chunks = [item_ids[i:i + chunk_size] for i in range(0, len(item_ids), chunk_size)]
+    with ThreadPoolExecutor(max_workers=client.max_concurrency) as executor:
+        results = list(executor.map(client._request_details_chunk, chunks))
+    return [item for data in results if data for item in data['items']]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare fixed and adaptive detail chunking")
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--latency", type=float, default=0.05, help="mock server latency per request (seconds)")
+    parser.add_argument("--item-latency", type=float, default=0.001, help="extra mock server latency per item (seconds)")
+    parser.add_argument("--max-batch", type=int, default=300, help="requests with more item IDs get 413")
+    parser.add_argument("--bad-ids", type=int, default=5, help="number of item IDs that make their whole request fail")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--blanket-items", type=int, default=32, help="item IDs to request while every detail request fails")
+    parser.add_argument("--blanket-statuses", type=int, nargs="*", default=[400, 403, 429],
+                        help="status codes to answer every detail request with (none to skip)")
+    args = parser.parse_args()
+
+    item_ids = list(range(1, args.items + 1))
+    bad_ids = random.Random(0).sample(item_ids, args.bad_ids)
+    expected = args.items - len(bad_ids)
+    modes = [
+        ("fixed", fetch_without_split),
+        ("fixed+split", lambda client, ids: client.get_item_details_by_ids_concurrent(ids, chunk_size=ZIGBANG_DETAIL_CHUNK_SIZE)),
+        ("adaptive", lambda client, ids: client.get_item_details_by_ids_concurrent(ids)),
+    ]
+
+    print(f"{args.items:,} items, {len(bad_ids)} bad IDs, max {args.max_batch} IDs per request")
+    print(f"{'mode':>12} {'seconds':>8} {'requests':>9} {'items':>8} {'missing':>8} {'final size':>11}")
+    for mode, fetch in modes:
+        with MockApiServer(latency=args.latency, item_latency=args.item_latency, max_batch_items=args.max_batch,
+                           bad_item_ids=bad_ids) as server:
+            _unthrottle(server.base_url)
+            client = ZigbangApiClient(log_level="CRITICAL", max_concurrency=args.concurrency)
+            _prepare_client(client, server.base_url)
+
+            started = time.perf_counter()
+            details = fetch(client, item_ids)
+            elapsed = time.perf_counter() - started
+            requests_sent = server.stats["responses"]
+
+        received = [item.get('item_id') for item in details]
+        assert received == sorted(received), "details must come back in input order"
+        final_size = client.chunk_sizer.size if mode == "adaptive" else ZIGBANG_DETAIL_CHUNK_SIZE
+        print(f"{mode:>12} {elapsed:8.2f} {requests_sent:9,} {len(received):8,} {expected - len(received):8,} {final_size:11}")
+
+    if args.blanket_statuses:
+        print()
+        print(f"every detail request fails: {args.blanket_items} items")
+        print(f"{'status':>12} {'seconds':>8} {'requests':>9} {'items':>8}")
+    for status in args.blanket_statuses:
+        with MockApiServer(latency=args.latency, error_rate=1.0, error_status=status) as server:
+            _unthrottle(server.base_url)
+            client = ZigbangApiClient(log_level="CRITICAL", max_concurrency=args.concurrency)
+            _prepare_client(client, server.base_url)
+
+            started = time.perf_counter()
+            details = client.get_item_details_by_ids_concurrent(list(range(1, args.blanket_items + 1)))
+            elapsed = time.perf_counter() - started
+            requests_sent = server.stats["responses"]
+        print(f"{status:>12} {elapsed:8.2f} {requests_sent:9,} {len(details):8,}")
+
+
+if __name__ == "__main__":
+    main()
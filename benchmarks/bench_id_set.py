@@ -0,0 +1,91 @@
+# benchmarks/bench_id_set.py
+"""
+매물 ID를 파이썬 set으로 들고 있을 때와 IdSet(정렬된 uint64 배열)으로 들고 있을 때의
+메모리와 실행 간 비교(새 매물/내려간 매물 계산) 시간을 비교합니다.
+
+지난 실행의 ID 중 --churn 비율이 내려가고 같은 수의 새 ID가 올라온 상황을 만들어
+차집합 두 번(새 매물, 내려간 매물), 합집합, 포함 여부 조회, .npy 저장/읽기 시간을 측정합니다.
+
+실행: python -m benchmarks.bench_id_set --sizes 1000000 5000000 --churn 0.02
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from common_utils.id_set import IdSet
+
+
+def make_runs(size, churn, seed=0):
+    """
+    직방 매물 ID처럼 듬성듬성한 정수 ID로 (지난 실행, 이번 실행) ID 목록을 만듭니다.
+    """
+    rng = np.random.default_rng(seed)
+    universe = rng.choice(60_000_000, size=int(size * (1 + churn)), replace=False) + 1
+    changed = int(size * churn)
+    previous = universe[:size]
+    current = np.concatenate([universe[changed:size], universe[size:]])
+    return previous.tolist(), rng.permutation(current).tolist()
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def traced_bytes(func):
+    tracemalloc.start()
+    result = func()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Python sets with IdSet for listing ID diffing")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000000, 5000000])
+    parser.add_argument("--churn", type=float, default=0.02)
+    args = parser.parse_args()
+
+    print(f"{'ids':>10} {'type':>6} {'MB':>8} {'build s':>8} {'new+removed ms':>15} {'union ms':>9} "
+          f"{'100k lookups ms':>16} {'save+load ms':>13}")
+    for size in args.sizes:
+        previous_ids, current_ids = make_runs(size, args.churn)
+        lookups = current_ids[:100000]
+
+        # 정수 객체까지 새로 만들어지도록 목록을 복사하며 측정
+        python_set, python_bytes = traced_bytes(lambda: {int(value) for value in previous_ids})
+        del python_set
+        id_set, id_set_bytes = traced_bytes(lambda: IdSet(previous_ids))
+
+        results = {}
+        for kind, build in (("set", set), ("IdSet", IdSet)):
+            (before, after), build_seconds = timed(lambda: (build(previous_ids), build(current_ids)))
+            (new_ids, removed_ids), diff_seconds = timed(lambda: (after - before, before - after))
+            _, union_seconds = timed(lambda: before | after)
+            if kind == "set":
+                _, lookup_seconds = timed(lambda: [value in before for value in lookups])
+            else:
+                _, lookup_seconds = timed(lambda: before.contains(lookups))
+            results[kind] = (build_seconds, diff_seconds, union_seconds, lookup_seconds, len(new_ids), len(removed_ids))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "ids.npy")
+            loaded, save_load_seconds = timed(lambda: IdSet.load(id_set.save(path)))
+        assert loaded == id_set
+        assert results["set"][4:] == results["IdSet"][4:], "set and IdSet disagree on the diff"
+
+        for kind, memory in (("set", python_bytes), ("IdSet", id_set_bytes)):
+            build_seconds, diff_seconds, union_seconds, lookup_seconds, new_count, removed_count = results[kind]
+            save_load = f"{save_load_seconds * 1e3:13.1f}" if kind == "IdSet" else f"{'-':>13}"
+            print(f"{size:>10,} {kind:>6} {memory / 1e6:8.1f} {build_seconds:8.2f} {diff_seconds * 1e3:15.1f} "
+                  f"{union_seconds * 1e3:9.1f} {lookup_seconds * 1e3:16.1f} {save_load}")
+        print(f"{'':>10} {'':>6} ({results['IdSet'][4]:,} new, {results['IdSet'][5]:,} removed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# benchmarks/bench_listing_dedup.py
+"""
+ListingDeduplicator를 정답(같은 매물 쌍)을 알고 있는 가짜 직방/다방 매물로 실행해
+규모별 실행 시간과 정밀도/재현율을 측정합니다. 실행 시간이 매물 수에 거의 비례하는지 확인하는 용도입니다.
+
+실행: python -m benchmarks.bench_listing_dedup --sizes 10000 100000 1000000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from platform_data_processors.listing_dedup import ListingDeduplicator
+
+# 서울 전체를 덮는 범위
+LAT_RANGE = (37.41, 37.70)
+LNG_RANGE = (126.76, 127.18)
+DONGS = ["역삼동", "삼성동", "논현동", "신사동", "대치동", "서초동", "방배동", "잠실동", "망원동", "연남동"]
+
+
+def make_listings(count, overlap=0.4, seed=0):
+    """
+    count개의 매물을 만들고, overlap 비율만큼은 두 플랫폼에 함께 올라온 것으로 만듭니다.
+    같은 매물은 좌표가 수십 미터 어긋나고 면적/가격이 조금씩 다르며, 주소 표기 방식도 다릅니다.
+    반환: (매물 DataFrame, 정답 (직방 매물ID, 다방 매물ID) 집합)
+    """
+    rng = np.random.default_rng(seed)
+    units = int(count / (1 + overlap))
+    shared = int(units * overlap)
+    lat = rng.uniform(*LAT_RANGE, size=units)
+    lng = rng.uniform(*LNG_RANGE, size=units)
+    area = rng.uniform(15, 120, size=units).round(1)
+    floor = rng.integers(1, 20, size=units)
+    deal_type = rng.choice(["월세", "전세", "매매"], size=units)
+    deposit = rng.integers(5, 500, size=units) * 100
+    rent = np.where(deal_type == "월세", rng.integers(30, 200, size=units), 0)
+    dong = rng.choice(DONGS, size=units)
+    lot = rng.integers(1, 999, size=units)
+
+    # 앞쪽 매물은 직방, 뒤쪽 매물은 다방에 올라오고 가운데 shared개는 두 곳 모두에 올라옴
+    zigbang_units = np.arange(0, (units + shared) // 2)
+    dabang_units = np.arange((units + shared) // 2 - shared, units)
+
+    def jitter(values, meters, size):
+        return values + rng.normal(0, meters / 111000, size=size)
+
+    zigbang = pd.DataFrame({
+        "platform": "zigbang",
+        "매물ID": zigbang_units,
+        "거래유형": deal_type[zigbang_units],
+        "보증금(만원)": deposit[zigbang_units],
+        "월세(만원)": rent[zigbang_units],
+        "매매가(만원)": 0,
+        "면적(m2)": area[zigbang_units],
+        "층수": floor[zigbang_units].astype(str),
+        "주소": "서울시 강남구 " + dong[zigbang_units],
+        "위도": jitter(lat[zigbang_units], 15, len(zigbang_units)),
+        "경도": jitter(lng[zigbang_units], 15, len(zigbang_units)),
+    })
+    dabang = pd.DataFrame({
+        "platform": "dabang",
+        "매물ID": dabang_units + 10_000_000,
+        "거래유형": deal_type[dabang_units],
+        "보증금(만원)": deposit[dabang_units],
+        "월세(만원)": rent[dabang_units],
+        "매매가(만원)": 0,
+        "면적(m2)": (area[dabang_units] * rng.uniform(0.97, 1.03, size=len(dabang_units))).round(1),
+        "층수": [f"{value}/20층" for value in floor[dabang_units]],
+        "주소": [f"서울특별시 강남구 {d} {n}" for d, n in zip(dong[dabang_units], lot[dabang_units])],
+        "위도": jitter(lat[dabang_units], 15, len(dabang_units)),
+        "경도": jitter(lng[dabang_units], 15, len(dabang_units)),
+    })
+    truth = {(unit, unit + 10_000_000) for unit in range((units + shared) // 2 - shared, (units + shared) // 2)}
+    return pd.concat([zigbang, dabang], ignore_index=True), truth
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cross-platform listing deduplication")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--overlap", type=float, default=0.4)
+    args = parser.parse_args()
+
+    deduplicator = ListingDeduplicator(log_level="WARNING")
+    for size in args.sizes:
+        listings, truth = make_listings(size, overlap=args.overlap)
+        started = time.perf_counter()
+        unified = deduplicator.deduplicate(listings)
+        elapsed = time.perf_counter() - started
+
+        clustered = unified[unified["cluster_size"] > 1]
+        found = {
+            tuple(sorted(group["매물ID"].tolist()))
+            for _, group in clustered.groupby("cluster_id")
+        }
+        true_positive = len(found & truth)
+        precision = true_positive / len(found) if found else 1.0
+        recall = true_positive / len(truth) if truth else 1.0
+        print(
+            f"{len(listings):>9,} listings: {elapsed:6.2f} s ({elapsed / len(listings) * 1e6:5.1f} us/listing), "
+            f"{len(found):,} matched pairs, precision {precision:.3f}, recall {recall:.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
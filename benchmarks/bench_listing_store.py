@@ -0,0 +1,97 @@
+# benchmarks/bench_listing_store.py
+"""
+SpatialListingStore에 가짜 매물을 채운 뒤 BBOX/반경/kNN 조회 시간을 측정합니다.
+반경 조회 결과는 전체 매물에 대해 거리를 직접 계산한 결과와 같은지 먼저 확인합니다.
+
+실행: python -m benchmarks.bench_listing_store --rows 1000000 --queries 50
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from platform_data_processors.listing_store import SpatialListingStore, haversine_m
+
+# 서울 전체를 덮는 범위
+LAT_RANGE = (37.41, 37.70)
+LNG_RANGE = (126.76, 127.18)
+
+
+def make_listings(start, count, rng):
+    return pd.DataFrame({
+        "매물ID": np.arange(start, start + count),
+        "거래유형": rng.choice(["월세", "전세", "매매"], size=count),
+        "보증금(만원)": rng.integers(100, 50000, size=count),
+        "월세(만원)": rng.integers(0, 300, size=count),
+        "면적(m2)": rng.uniform(15, 120, size=count).round(2),
+        "층수": rng.integers(1, 20, size=count).astype(str),
+        "주소": "서울시",
+        "위도": rng.uniform(*LAT_RANGE, size=count),
+        "경도": rng.uniform(*LNG_RANGE, size=count),
+    })
+
+
+def time_queries(label, func, points):
+    durations = []
+    sizes = []
+    for lat, lng in points:
+        started = time.perf_counter()
+        result = func(lat, lng)
+        durations.append((time.perf_counter() - started) * 1000)
+        sizes.append(len(result))
+    durations.sort()
+    print(
+        f"{label:<24} median {statistics.median(durations):7.2f} ms  "
+        f"p95 {durations[int(len(durations) * 0.95) - 1]:7.2f} ms  avg rows {statistics.mean(sizes):8.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SpatialListingStore queries")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--batch", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = SpatialListingStore(os.path.join(tmp_dir, "listing_store.sqlite3"))
+        started = time.perf_counter()
+        all_lats, all_lngs = [], []
+        for start in range(0, args.rows, args.batch):
+            batch = make_listings(start, min(args.batch, args.rows - start), rng)
+            all_lats.append(batch["위도"].to_numpy())
+            all_lngs.append(batch["경도"].to_numpy())
+            store.upsert_dataframe("bench", batch)
+        print(f"inserted {store.count():,} rows in {time.perf_counter() - started:.1f} s")
+
+        lats, lngs = np.concatenate(all_lats), np.concatenate(all_lngs)
+        point_rng = random.Random(args.seed)
+        points = [(point_rng.uniform(37.45, 37.65), point_rng.uniform(126.85, 127.10)) for _ in range(args.queries)]
+
+        # 반경 조회 결과가 전체 탐색 결과와 같은지 확인
+        lat, lng = points[0]
+        expected = int((haversine_m(lat, lng, lats, lngs) <= 500).sum())
+        actual = len(store.query_radius(lat, lng, 500))
+        assert actual == expected, f"radius query returned {actual} rows, expected {expected}"
+
+        time_queries("bbox (~1km x 1km)", lambda lat, lng: store.query_bbox(lat - 0.0045, lat + 0.0045, lng - 0.0057, lng + 0.0057), points)
+        time_queries("radius 500 m", lambda lat, lng: store.query_radius(lat, lng, 500), points)
+        time_queries("radius 2 km", lambda lat, lng: store.query_radius(lat, lng, 2000), points)
+        time_queries("knn k=10", lambda lat, lng: store.query_knn(lat, lng, 10), points)
+        time_queries("knn k=100", lambda lat, lng: store.query_knn(lat, lng, 100), points)
+
+        started = time.perf_counter()
+        full_scan = [(haversine_m(lat, lng, lats, lngs) <= 500).sum() for lat, lng in points[:5]]
+        print(f"{'full scan radius 500 m':<24} median {(time.perf_counter() - started) / len(full_scan) * 1000:7.2f} ms (numpy, in memory)")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
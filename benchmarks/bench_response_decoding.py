@@ -0,0 +1,108 @@
+# benchmarks/bench_response_decoding.py
+"""
+상세 응답(/v3/items/list)과 다방 목록 응답을 처리하는 두 방식의 CPU 시간과 메모리를 비교합니다.
+
+- dict: response.json()으로 응답 전체를 딕셔너리로 파싱한 뒤 변환기에 넘김 (기존 방식)
+- typed: 변환에 쓰는 필드만 __slots__ 레코드로 꺼내 변환기에 넘김 (TYPED_DECODING_ENABLED)
+
+응답 본문은 fixtures의 응답 예시로 만들며, --payload-bytes로 매물마다 쓰지 않는 설명 필드를 덧붙여
+실제 응답처럼 크게 만들 수 있습니다. 메모리는 디코딩한 청크를 모두 들고 있을 때(파이프라인 큐가 가득 찬 상태)의
+tracemalloc 현재/최대 사용량으로 측정합니다. 두 방식의 변환 결과가 같은지 먼저 확인합니다.
+
+실행: python -m benchmarks.bench_response_decoding --items 10000 100000 --payload-bytes 600
+"""
+import argparse
+import copy
+import json
+import time
+import tracemalloc
+
+import pandas as pd
+
+from benchmarks.mock_server import load_fixture
+from common_utils.response_records import orjson, decode_zigbang_item_list, decode_dabang_rooms
+from platform_configs.dabang_config import DABANG_CONVERT_CHUNK_SIZE
+from platform_configs.zigbang_config import ZIGBANG_DETAIL_CHUNK_SIZE
+from platform_data_processors.dabang.dabang_data_converter import DabangDataConverter
+from platform_data_processors.zigbang.zigbang_data_converter import ZigbangDataConverter
+
+
+def make_bodies(template_name, list_key, id_key, count, chunk_size, payload_bytes):
+    """
+    count개의 매물을 chunk_size개씩 담은 응답 본문(bytes) 목록을 만듭니다.
+    """
+    template = load_fixture(template_name)
+    if payload_bytes:
+        template["description"] = "가" * (payload_bytes // 3)
+    bodies = []
+    for start in range(0, count, chunk_size):
+        listings = []
+        for listing_id in range(start, min(count, start + chunk_size)):
+            listing = copy.deepcopy(template)
+            listing[id_key] = listing_id if isinstance(template[id_key], int) else str(listing_id)
+            listings.append(listing)
+        bodies.append(json.dumps({list_key: listings}, ensure_ascii=False).encode("utf-8"))
+    return bodies
+
+
+def decode_dict(list_key):
+    # requests의 response.json()과 같은 표준 json 파싱
+    return lambda body: json.loads(body.decode("utf-8"))[list_key]
+
+
+def run(bodies, decode, converter):
+    """
+    반환: (디코딩 CPU 초, 변환 CPU 초, 변환 결과 DataFrame)
+    """
+    started = time.process_time()
+    chunks = [decode(body) for body in bodies]
+    decoded = time.process_time()
+    frames = [converter.convert_raw_to_dataframe(chunk) for chunk in chunks]
+    converted = time.process_time()
+    return decoded - started, converted - decoded, pd.concat(frames, ignore_index=True)
+
+
+def measure_memory(bodies, decode):
+    """
+    모든 청크를 디코딩해 들고 있을 때의 (현재, 최대) 메모리 사용량(bytes)을 반환합니다.
+    """
+    tracemalloc.start()
+    chunks = [decode(body) for body in bodies]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del chunks
+    return current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare dict decoding with typed __slots__ record decoding")
+    parser.add_argument("--items", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--payload-bytes", type=int, default=600, help="unused description bytes added to every listing")
+    args = parser.parse_args()
+
+    print(f"JSON parser for typed decoding: {'orjson' if orjson is not None else 'json (orjson not installed)'}")
+    platforms = [
+        ("zigbang", "zigbang_item.json", "items", "item_id", ZIGBANG_DETAIL_CHUNK_SIZE,
+         ZigbangDataConverter(log_level="WARNING"), lambda body: decode_zigbang_item_list(body)["items"]),
+        ("dabang", "dabang_room.json", "rooms", "id", DABANG_CONVERT_CHUNK_SIZE,
+         DabangDataConverter(log_level="WARNING"), lambda body: decode_dabang_rooms(body)["rooms"]),
+    ]
+    for count in args.items:
+        for platform, template_name, list_key, id_key, chunk_size, converter, decode_typed in platforms:
+            bodies = make_bodies(template_name, list_key, id_key, count, chunk_size, args.payload_bytes)
+            results = {}
+            for mode, decode in (("dict", decode_dict(list_key)), ("typed", decode_typed)):
+                decode_seconds, convert_seconds, df = run(bodies, decode, converter)
+                current, peak = measure_memory(bodies, decode)
+                results[mode] = (decode_seconds, convert_seconds, df, current, peak)
+            pd.testing.assert_frame_equal(results["dict"][2], results["typed"][2])
+
+            print(f"\n{platform} {count:,} listings ({len(bodies)} responses, {sum(map(len, bodies)) / 1e6:.1f} MB)")
+            print(f"{'mode':>6} {'decode s':>9} {'convert s':>10} {'total s':>8} {'held MB':>8} {'peak MB':>8}")
+            for mode, (decode_seconds, convert_seconds, _, current, peak) in results.items():
+                print(f"{mode:>6} {decode_seconds:9.3f} {convert_seconds:10.3f} {decode_seconds + convert_seconds:8.3f} "
+                      f"{current / 1e6:8.1f} {peak / 1e6:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# benchmarks/bench_zigbang_converter.py
+"""
+ZigbangDataConverter의 튜플 기반 변환과 기존 행(딕셔너리) 단위 변환을 비교합니다.
+각 규모마다 두 결과가 (컬럼, dtype, 값까지) 같은지 먼저 확인한 뒤 시간을 측정합니다.
+
+실행: python -m benchmarks.bench_zigbang_converter --sizes 10000 100000 1000000
+"""
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from platform_data_processors.zigbang.zigbang_data_converter import ZigbangDataConverter
+
+
+def make_raw_items(count, seed=0):
+    """
+    실제 응답처럼 필드가 빠지거나 비어 있는 경우를 섞은 가짜 상세 데이터를 만듭니다.
+    """
+    rng = random.Random(seed)
+    items = []
+    for item_id in range(count):
+        item = {"item_id": item_id, "lat": 37.5 + rng.random() / 10, "lng": 127.0 + rng.random() / 10}
+        if rng.random() < 0.7:
+            item["title"] = f"매물 {item_id}"
+        else:
+            item["item_title"] = rng.choice(["", f"빌라 {item_id}"])
+        if rng.random() < 0.9:
+            item["address1"] = "서울시 강남구"
+        if rng.random() < 0.5:
+            item["address2"] = rng.choice(["역삼동", ""])
+        if rng.random() < 0.6:
+            item["sales_type_info"] = {"sales_type_text": "월세", "deposit": rng.choice([0, 1000, 5000]), "rent": rng.choice([0, 50, 70])}
+        else:
+            item.update({"sales_type": "전세", "deposit": rng.choice([None, 20000]), "rent": 0})
+        if rng.random() < 0.3:
+            item["sales_price"] = rng.choice([None, 35000, "협의"])
+        item["item_type_summary" if rng.random() < 0.5 else "room_type"] = "투룸"
+        item["floor_text" if rng.random() < 0.5 else "floor"] = rng.choice(["3층", "", None, 2])
+        item["space_m2" if rng.random() < 0.5 else "size_m2"] = rng.choice([33.5, 0, None, "49.5"])
+        if rng.random() < 0.4:
+            item["building_name"] = "OO빌라"
+        item["images"] = [{"url": f"https://img.example.com/{item_id}/{n}.jpg"} for n in range(rng.randint(0, 4))]
+        if rng.random() < 0.1:
+            item["images"].append({"url": None})
+        items.append(item)
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zigbang converter benchmark (tuple rows vs dict rows)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    converter = ZigbangDataConverter(log_level="WARNING")
+    print(f"{'rows':>9} {'row-wise s':>11} {'tuple s':>11} {'speedup':>8}")
+    for size in args.sizes:
+        raw_items = make_raw_items(size)
+
+        started = time.perf_counter()
+        expected = converter._convert_raw_to_dataframe_rowwise(raw_items)
+        rowwise_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        actual = converter.convert_raw_to_dataframe(raw_items)
+        tuple_seconds = time.perf_counter() - started
+
+        pd.testing.assert_frame_equal(actual, expected)
+        print(f"{size:>9} {rowwise_seconds:>11.3f} {tuple_seconds:>11.3f} {rowwise_seconds / tuple_seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# benchmarks/bench_zigbang_details.py
+"""
+ZigbangApiClient 상세 정보 수집의 동시성별 처리량을 로컬 목 서버로 측정합니다.
+
+실행: python -m benchmarks.bench_zigbang_details
+"""
+import argparse
+import time
+
+from urllib.parse import urlparse
+
+from benchmarks.mock_server import MockApiServer
+from common_utils.rate_limiter import get_rate_limiter
+from platform_crawlers.zigbang.zigbang_api_client import ZigbangApiClient
+
+
+def run_benchmark(item_count, latency, concurrency_levels):
+    item_ids = list(range(1, item_count + 1))
+    results = []
+    with MockApiServer(latency=latency) as server:
+        # 동시성 효과만 측정하도록 목 서버에는 사실상 요청 속도 제한을 두지 않음
+        get_rate_limiter(urlparse(server.base_url).netloc, {"initial_rate": 1e6, "max_rate": 1e6, "burst": 1000})
+        for concurrency in concurrency_levels:
+            client = ZigbangApiClient(log_level="WARNING", max_concurrency=concurrency)
+            client.base_url = server.base_url
+            # 매 실행이 실제로 네트워크를 타도록 응답 캐시는 끔
+            client.requester.response_cache = None
+
+            started = time.perf_counter()
+            details = client.get_item_details_by_ids(item_ids)
+            elapsed = time.perf_counter() - started
+
+            # 결과가 입력 순서대로 모두 돌아왔는지 확인
+            assert [item.get("item_id") for item in details] == item_ids
+            results.append((concurrency, elapsed, len(details) / elapsed))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zigbang detail fetch throughput benchmark")
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.05, help="mock server latency per request (seconds)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    args = parser.parse_args()
+
+    results = run_benchmark(args.items, args.latency, args.concurrency)
+    baseline = results[0][1]
+    print(f"{'concurrency':>11} {'seconds':>9} {'items/s':>10} {'speedup':>8}")
+    for concurrency, elapsed, throughput in results:
+        print(f"{concurrency:>11} {elapsed:>9.3f} {throughput:>10.0f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
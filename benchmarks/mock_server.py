@@ -0,0 +1,255 @@
+# benchmarks/mock_server.py
+"""
+실제 API 대신 사용할 로컬 목(mock) 서버입니다.
+
+- 직방 GET /v2/search: 요청한 Geohash 셀 안의 매물 ID (ZIGBANG_SEARCH_ITEM_CAP개까지만, 실제 API처럼 셀이 포화됨)
+- 직방 POST /v3/items/list: 요청한 매물 ID의 상세 정보
+- 다방 GET .../markers/category/one-two: BBOX 안의 방 목록 (페이지 단위, last_page 포함)
+
+응답 본문은 fixtures 디렉토리의 응답 예시(zigbang_item.json, dabang_room.json)를 틀로 삼아 매물마다 ID/좌표만 바꿔 만듭니다.
+실제 API에서 기록한 응답으로 파일을 바꾸면 그 구조 그대로 재생됩니다.
+
+지연 시간(latency, jitter), 오류 비율(error_rate, error_status), 매물당 추가 페이로드 크기(payload_bytes)를
+지정해 느린 서버, 불안정한 서버, 큰 응답을 흉내 낼 수 있습니다. 직방 상세 요청에는 매물 수에 비례하는 지연(item_latency),
+요청당 매물 수 상한(max_batch_items, 넘으면 413), 요청에 섞이면 묶음 전체가 실패하는 ID(bad_item_ids)도 지정할 수 있습니다.
+"""
+import copy
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import numpy as np
+
+from common_utils.geohash_utils import encode_geohashes
+from platform_configs.zigbang_config import ZIGBANG_SEARCH_ITEM_CAP, ZIGBANG_GEOHASH_MAX_PRECISION
+from platform_configs.dabang_config import DABANG_DEFAULT_MAX_PAGES
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+DABANG_MIN_PAGE_SIZE = 24
+
+
+def load_fixture(name, fixtures_dir=FIXTURES_DIR):
+    with open(os.path.join(fixtures_dir, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+class MockListingWorld:
+    """
+    BBOX 안에 무작위로 흩어 놓은 가짜 직방/다방 매물 집합입니다.
+    직방 매물은 Geohash 순으로 정렬해 두어 /v2/search의 셀 조회를 이진 탐색으로 처리합니다.
+    """
+    def __init__(self, bbox, zigbang_count=0, dabang_count=0, seed=0):
+        rng = np.random.default_rng(seed)
+        lat_min, lat_max, lng_min, lng_max = bbox
+        self.bbox = bbox
+
+        lats = rng.uniform(lat_min, lat_max, size=zigbang_count)
+        lngs = rng.uniform(lng_min, lng_max, size=zigbang_count)
+        geohashes = encode_geohashes(lats, lngs, ZIGBANG_GEOHASH_MAX_PRECISION)
+        order = np.argsort(geohashes, kind="stable")
+        self.zigbang_geohashes = geohashes[order]
+        self.zigbang_ids = (np.arange(zigbang_count, dtype=np.int64) + 1)[order]
+        # 상세 요청은 ID로 조회하므로 ID 순서의 좌표도 보관 (ID = 인덱스 + 1)
+        self.zigbang_lats = lats
+        self.zigbang_lngs = lngs
+
+        self.dabang_lats = rng.uniform(lat_min, lat_max, size=dabang_count)
+        self.dabang_lngs = rng.uniform(lng_min, lng_max, size=dabang_count)
+        # 다방 크롤러는 최대 DABANG_DEFAULT_MAX_PAGES 페이지까지만 읽으므로, 모든 방이 그 안에 들어오도록 페이지 크기를 정함
+        self.dabang_page_size = max(DABANG_MIN_PAGE_SIZE, -(-dabang_count // DABANG_DEFAULT_MAX_PAGES))
+        self._dabang_cache = {}
+        self._lock = threading.Lock()
+
+    def zigbang_ids_in_geohash(self, geohash_code, limit=ZIGBANG_SEARCH_ITEM_CAP):
+        start = np.searchsorted(self.zigbang_geohashes, geohash_code, side="left")
+        # geohash_code로 시작하는 문자열은 모두 geohash_code + "~"보다 작음 (base32 문자는 모두 "~"보다 작음)
+        end = np.searchsorted(self.zigbang_geohashes, geohash_code + "~", side="left")
+        return self.zigbang_ids[start:min(end, start + limit)].tolist()
+
+    def zigbang_location(self, item_id):
+        index = int(item_id) - 1
+        if 0 <= index < len(self.zigbang_lats):
+            return float(self.zigbang_lats[index]), float(self.zigbang_lngs[index])
+        return None
+
+    def dabang_rooms_in_bbox(self, lat_min, lat_max, lng_min, lng_max):
+        key = (lat_min, lat_max, lng_min, lng_max)
+        with self._lock:
+            indexes = self._dabang_cache.get(key)
+            if indexes is None:
+                inside = ((self.dabang_lats >= lat_min) & (self.dabang_lats <= lat_max)
+                          & (self.dabang_lngs >= lng_min) & (self.dabang_lngs <= lng_max))
+                indexes = np.flatnonzero(inside)
+                self._dabang_cache[key] = indexes
+        return indexes
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    # keep-alive 연결을 지원해야 클라이언트의 커넥션 재사용 효과가 측정됨
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        # 벤치마크 출력이 지저분해지지 않도록 접근 로그는 남기지 않음
+        pass
+
+    def _send_json(self, payload, status=200):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.record(len(body))
+
+    def _inject_latency_and_errors(self):
+        """
+        설정된 지연 시간만큼 기다리고, 오류 비율에 따라 오류 응답을 보냈으면 True를 반환합니다.
+        """
+        server = self.server
+        delay = server.latency + (server.random_uniform(-server.jitter, server.jitter) if server.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        if server.error_rate and server.random_uniform(0.0, 1.0) < server.error_rate:
+            server.record_error()
+            self._send_json({"error": "injected failure"}, status=server.error_status)
+            return True
+        return False
+
+    def _with_padding(self, payload):
+        if self.server.payload_bytes:
+            payload["description"] = "가" * (self.server.payload_bytes // 3) # UTF-8에서 한글 한 글자는 3바이트
+        return payload
+
+    def _zigbang_item(self, item_id):
+        item = copy.deepcopy(self.server.zigbang_template)
+        item["item_id"] = item_id
+        item["title"] = f"{item.get('title', '매물')} {item_id}"
+        location = self.server.world.zigbang_location(item_id) if self.server.world else None
+        if location:
+            item["lat"], item["lng"] = location
+        return self._with_padding(item)
+
+    def _dabang_room(self, index):
+        world = self.server.world
+        room = copy.deepcopy(self.server.dabang_template)
+        room["id"] = f"room{index + 1}"
+        room["lat"], room["lng"] = float(world.dabang_lats[index]), float(world.dabang_lngs[index])
+        return self._with_padding(room)
+
+    def do_GET(self):
+        if self._inject_latency_and_errors():
+            return
+        parsed = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        world = self.server.world
+
+        if parsed.path.startswith("/v2/search") and world is not None:
+            item_ids = world.zigbang_ids_in_geohash(params.get("geohash", ""))
+            self._send_json({"items": [{"itemIds": item_ids}] if item_ids else []})
+        elif parsed.path.endswith("/markers/category/one-two") and world is not None:
+            indexes = world.dabang_rooms_in_bbox(
+                float(params["sw_lat"]), float(params["ne_lat"]), float(params["sw_lng"]), float(params["ne_lng"])
+            )
+            page = int(params.get("page", 1))
+            page_size = world.dabang_page_size
+            page_indexes = indexes[(page - 1) * page_size:page * page_size]
+            self._send_json({
+                "rooms": [self._dabang_room(index) for index in page_indexes],
+                "last_page": max(1, -(-len(indexes) // page_size)),
+            })
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request_body = json.loads(self.rfile.read(length) or b"{}")
+        if self._inject_latency_and_errors():
+            return
+
+        if self.path.startswith("/v3/items/list"):
+            server = self.server
+            item_ids = request_body.get("itemIds", [])
+            if server.max_batch_items and len(item_ids) > server.max_batch_items:
+                server.record_error()
+                self._send_json({"error": "too many items"}, status=413)
+                return
+            if server.bad_item_ids and not server.bad_item_ids.isdisjoint(item_ids):
+                server.record_error()
+                self._send_json({"error": "invalid item id"}, status=server.bad_item_status)
+                return
+            if server.item_latency:
+                time.sleep(server.item_latency * len(item_ids))
+            self._send_json({"items": [self._zigbang_item(item_id) for item_id in item_ids]})
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+
+class MockApiServer:
+    """
+    백그라운드 스레드에서 동작하는 목 서버. with 문으로 사용합니다.
+
+    - latency/jitter: 요청마다 latency ± jitter초 대기
+    - error_rate/error_status: 이 비율의 요청에 error_status 상태 코드로 응답 (재시도/회로 차단기 동작 확인용)
+    - payload_bytes: 매물마다 이 크기의 설명 필드를 덧붙여 응답 크기를 키움
+    - item_latency: 직방 상세 요청에서 매물 하나당 추가로 대기할 시간(초)
+    - max_batch_items: 직방 상세 요청 하나에 이보다 많은 매물 ID가 있으면 413으로 응답
+    - bad_item_ids/bad_item_status: 이 ID가 섞인 직방 상세 요청에는 bad_item_status 상태 코드로 응답
+    - world: 목록/검색 요청에 사용할 MockListingWorld (없으면 상세 요청만 처리)
+    """
+    def __init__(self, latency=0.05, host="127.0.0.1", port=0, jitter=0.0, error_rate=0.0, error_status=503,
+                 payload_bytes=0, world=None, fixtures_dir=FIXTURES_DIR, seed=0, item_latency=0.0,
+                 max_batch_items=None, bad_item_ids=(), bad_item_status=400):
+        self.httpd = ThreadingHTTPServer((host, port), MockApiHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.latency = latency
+        self.httpd.jitter = jitter
+        self.httpd.error_rate = error_rate
+        self.httpd.error_status = error_status
+        self.httpd.payload_bytes = payload_bytes
+        self.httpd.item_latency = item_latency
+        self.httpd.max_batch_items = max_batch_items
+        self.httpd.bad_item_ids = frozenset(bad_item_ids)
+        self.httpd.bad_item_status = bad_item_status
+        self.httpd.world = world
+        self.httpd.zigbang_template = load_fixture("zigbang_item.json", fixtures_dir)
+        self.httpd.dabang_template = load_fixture("dabang_room.json", fixtures_dir)
+
+        # 요청/오류/응답 바이트 수 (여러 요청 스레드가 함께 갱신)
+        stats_lock = threading.Lock()
+        rng = random.Random(seed)
+        self.stats = {"responses": 0, "errors": 0, "bytes": 0}
+
+        def record(body_bytes):
+            with stats_lock:
+                self.stats["responses"] += 1
+                self.stats["bytes"] += body_bytes
+
+        def record_error():
+            with stats_lock:
+                self.stats["errors"] += 1
+
+        def random_uniform(low, high):
+            with stats_lock:
+                return rng.uniform(low, high)
+
+        self.httpd.record = record
+        self.httpd.record_error = record_error
+        self.httpd.random_uniform = random_uniform
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
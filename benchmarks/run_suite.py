@@ -0,0 +1,241 @@
+# benchmarks/run_suite.py
+"""
+로컬 목 서버로 수집기/변환기 전체 흐름을 정해진 규모(기본 1천/10만/100만 매물)로 실행하고 결과를 JSON으로 남깁니다.
+버전마다 결과 파일을 남겨 두고 --compare로 이전 결과와 비교하면 성능이 나빠진 시나리오를 바로 찾을 수 있습니다.
+
+시나리오 (규모마다 실행)
+- zigbang_crawl: ZigbangCollector로 /v2/search 타일링 → /v3/items/list 상세 수집 → ZigbangDataConverter 변환
+- dabang_crawl: DabangCollector로 목록 페이지 수집 → DabangDataConverter 변환
+- zigbang_convert / dabang_convert: 네트워크 없이 변환기만 실행
+
+실행: python -m benchmarks.run_suite --scales 1000 100000 1000000 --latency 0.01 --error-rate 0.01
+비교: python -m benchmarks.run_suite --scales 1000 --compare data/benchmarks/<이전 결과>.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from itertools import islice
+from urllib.parse import urlparse
+
+from benchmarks.bench_zigbang_converter import make_raw_items
+from benchmarks.mock_server import MockApiServer, MockListingWorld, load_fixture
+from common_utils.metrics import get_metrics
+from common_utils.rate_limiter import get_rate_limiter
+from platform_configs.general_config import OUTPUT_BASE_DIR, CRAWL_REGIONS
+from platform_configs.dabang_config import DABANG_CONVERT_CHUNK_SIZE
+from platform_crawlers.zigbang.zigbang_collector import ZigbangCollector
+from platform_crawlers.dabang.dabang_collector import DabangCollector
+from platform_data_processors.zigbang.zigbang_data_converter import ZigbangDataConverter
+from platform_data_processors.dabang.dabang_data_converter import DabangDataConverter
+
+DEFAULT_SCALES = [1000, 100000, 1000000]
+DEFAULT_OUTPUT_DIR = os.path.join(OUTPUT_BASE_DIR, "benchmarks")
+# 기본 수집 지역(강남, general_config.CRAWL_REGIONS)과 같은 BBOX
+BENCH_BBOX = CRAWL_REGIONS["gangnam"]
+SCENARIOS = ["zigbang_crawl", "dabang_crawl", "zigbang_convert", "dabang_convert"]
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _http_counts():
+    requests = errors = 0
+    for counter in get_metrics().snapshot()["counters"]:
+        if counter["name"] == "http_requests_total":
+            requests += counter["value"]
+            if not str(counter["labels"].get("status", "")).startswith("2"):
+                errors += counter["value"]
+    return requests, errors
+
+
+def _unthrottle(base_url):
+    # 처리량만 측정하도록 목 서버에는 사실상 요청 속도 제한을 두지 않음
+    get_rate_limiter(urlparse(base_url).netloc, {"initial_rate": 1e6, "max_rate": 1e6, "burst": 1000})
+
+
+def _prepare_client(api_client, base_url):
+    api_client.base_url = base_url
+    # 매 실행이 실제로 네트워크를 타도록 응답 캐시는 끔
+    api_client.requester.response_cache = None
+
+
+def run_zigbang_crawl(scale, server_options):
+    world = MockListingWorld(BENCH_BBOX, zigbang_count=scale)
+    collector = ZigbangCollector(log_level="WARNING")
+    converter = ZigbangDataConverter(log_level="WARNING")
+    with MockApiServer(world=world, **server_options) as server:
+        _unthrottle(server.base_url)
+        _prepare_client(collector.api_client, server.base_url)
+
+        started = time.perf_counter()
+        item_ids = collector.collect_item_ids_by_area(*BENCH_BBOX)
+        listed = time.perf_counter()
+        rows = sum(len(converter.convert_raw_to_dataframe(chunk)) for chunk in collector.iter_item_details(item_ids) if chunk)
+        finished = time.perf_counter()
+    return {
+        "items": rows,
+        "expected_items": scale,
+        "seconds": finished - started,
+        "list_seconds": listed - started,
+        "detail_seconds": finished - listed,
+        "search_requests": collector.last_tiling_stats.get("requests"),
+        "server": dict(server.stats),
+    }
+
+
+def run_dabang_crawl(scale, server_options):
+    world = MockListingWorld(BENCH_BBOX, dabang_count=scale)
+    collector = DabangCollector(log_level="WARNING")
+    converter = DabangDataConverter(log_level="WARNING")
+    with MockApiServer(world=world, **server_options) as server:
+        _unthrottle(server.base_url)
+        _prepare_client(collector.api_client, f"{server.base_url}/api/v1")
+
+        started = time.perf_counter()
+        rooms = collector.collect_rooms_by_area(*BENCH_BBOX)
+        listed = time.perf_counter()
+        remaining = iter(rooms.values())
+        rows = sum(len(converter.convert_raw_to_dataframe(chunk))
+                   for chunk in iter(lambda: list(islice(remaining, DABANG_CONVERT_CHUNK_SIZE)), []))
+        finished = time.perf_counter()
+    return {
+        "items": rows,
+        "expected_items": scale,
+        "seconds": finished - started,
+        "list_seconds": listed - started,
+        "convert_seconds": finished - listed,
+        "server": dict(server.stats),
+    }
+
+
+def run_zigbang_convert(scale, server_options):
+    raw_items = make_raw_items(scale)
+    converter = ZigbangDataConverter(log_level="WARNING")
+    started = time.perf_counter()
+    rows = len(converter.convert_raw_to_dataframe(raw_items))
+    return {"items": rows, "expected_items": scale, "seconds": time.perf_counter() - started}
+
+
+def run_dabang_convert(scale, server_options):
+    template = load_fixture("dabang_room.json")
+    raw_rooms = [{**template, "id": f"room{index}", "deposit": index % 5000} for index in range(scale)]
+    converter = DabangDataConverter(log_level="WARNING")
+    started = time.perf_counter()
+    rows = len(converter.convert_raw_to_dataframe(raw_rooms))
+    return {"items": rows, "expected_items": scale, "seconds": time.perf_counter() - started}
+
+
+SCENARIO_RUNNERS = {
+    "zigbang_crawl": run_zigbang_crawl,
+    "dabang_crawl": run_dabang_crawl,
+    "zigbang_convert": run_zigbang_convert,
+    "dabang_convert": run_dabang_convert,
+}
+
+
+def run_suite(scales, scenarios, server_options):
+    results = []
+    for scale in scales:
+        for scenario in scenarios:
+            # 시나리오마다 지표를 비워 단계별 처리량(stages)이 해당 시나리오만 반영하도록 함
+            get_metrics().reset()
+            result = SCENARIO_RUNNERS[scenario](scale, server_options)
+            http_requests, http_errors = _http_counts()
+            result.update({
+                "scenario": scenario,
+                "scale": scale,
+                "items_per_second": result["items"] / result["seconds"] if result["seconds"] > 0 else None,
+                "http_requests": http_requests,
+                "http_errors": http_errors,
+                "stages": get_metrics().stage_summary(),
+            })
+            results.append(result)
+            print(
+                f"{scenario:<16} {scale:>9,}: {result['seconds']:8.2f} s, {result['items']:>9,} items "
+                f"({result['items_per_second'] or 0:10.0f} items/s), {result['http_requests']:>6} requests, "
+                f"{result['http_errors']} errors"
+            )
+            if result["items"] != result["expected_items"]:
+                print(f"  warning: expected {result['expected_items']} items, got {result['items']}")
+    return results
+
+
+def compare_results(current, baseline, threshold, min_seconds=0.1):
+    """
+    같은 (시나리오, 규모)의 실행 시간을 이전 결과와 비교해 threshold 비율 이상 느려진 항목 수를 반환합니다.
+    min_seconds보다 짧게 끝난 실행은 측정 오차가 커서 회귀로 세지 않습니다.
+    """
+    previous = {(row["scenario"], row["scale"]): row for row in baseline["results"]}
+    regressions = 0
+    print(f"\nCompared with {baseline.get('git_commit') or 'baseline'} ({baseline.get('started_at')}):")
+    for row in current:
+        before = previous.get((row["scenario"], row["scale"]))
+        if not before or not before["seconds"]:
+            continue
+        ratio = row["seconds"] / before["seconds"]
+        regressed = ratio > 1 + threshold and row["seconds"] >= min_seconds
+        regressions += regressed
+        print(f"  {row['scenario']:<16} {row['scale']:>9,}: {before['seconds']:8.2f} s -> {row['seconds']:8.2f} s "
+              f"({ratio:5.2f}x){'  REGRESSION' if regressed else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline crawler benchmark suite against a local mock server")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--latency", type=float, default=0.0, help="mock server latency per request (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random latency added/subtracted per request (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with --error-status")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--payload-bytes", type=int, default=0, help="extra bytes added to every listing in responses")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--compare", help="previous result JSON to compare against")
+    parser.add_argument("--regression-threshold", type=float, default=0.1, help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    server_options = {
+        "latency": args.latency, "jitter": args.jitter, "error_rate": args.error_rate,
+        "error_status": args.error_status, "payload_bytes": args.payload_bytes,
+    }
+    started_at = datetime.now()
+    results = run_suite(args.scales, args.scenarios, server_options)
+
+    report = {
+        "started_at": started_at.isoformat(timespec="seconds"),
+        "git_commit": git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "server_options": server_options,
+        "results": results,
+    }
+    os.makedirs(args.output_dir, exist_ok=True)
+    output_path = os.path.join(
+        args.output_dir, f"bench_{started_at.strftime('%Y%m%d_%H%M%S')}_{report['git_commit'] or 'nogit'}.json"
+    )
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nResults written to {output_path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare_results(results, json.load(f), args.regression_threshold)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# common_utils/adaptive_batch.py
+import threading
+
+
+class AdaptiveBatchSizer:
+    """
+    여러 ID를 한 요청에 묶어 보내는 API의 묶음 크기를 응답 시간과 실패에 맞춰 조절합니다.
+
+    현재 크기 이상으로 묶은 요청이 target_latency초 안에 성공하면 additive_increase만큼 키우고,
+    target_latency보다 늦게 성공하면 응답 시간이 목표에 맞을 것으로 보이는 크기까지 줄이며(최대 multiplicative_decrease배),
+    묶음 크기 때문에 생길 수 있는 실패(타임아웃/연결 오류, 413, 504)가 record_failure()로 기록되면
+    실패한 묶음 크기의 multiplicative_decrease배로 줄입니다(AIMD).
+    잘못된 ID(400/404/422)나 그 밖의 5xx처럼 묶음 크기와 관계없는 실패는 기록하지 않습니다.
+    응답 시간은 요청 제한기에서 기다린 시간을 뺀 서버 응답 시간(response.elapsed)을 사용합니다.
+    여러 스레드가 동시에 사용해도 안전합니다.
+    """
+    def __init__(self, initial_size=100, min_size=10, max_size=500, target_latency=1.0,
+                 additive_increase=20, multiplicative_decrease=0.5):
+        self.min_size = max(1, int(min_size))
+        self.max_size = max(self.min_size, int(max_size))
+        self.target_latency = target_latency
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+        self._size = min(self.max_size, max(self.min_size, int(initial_size)))
+        self._lock = threading.Lock()
+
+    @property
+    def size(self):
+        with self._lock:
+            return self._size
+
+    def _set_size(self, size):
+        self._size = min(self.max_size, max(self.min_size, int(size)))
+
+    def record_success(self, batch_size, seconds):
+        with self._lock:
+            if seconds > self.target_latency:
+                shrink = max(self.multiplicative_decrease, self.target_latency / seconds)
+                self._set_size(min(self._size, batch_size * shrink))
+            elif batch_size >= self._size:
+                # 현재 크기보다 작은 묶음(분할 재시도 등)이 빨랐던 것은 현재 크기에 대한 근거가 되지 않음
+                self._set_size(self._size + self.additive_increase)
+
+    def record_failure(self, batch_size):
+        with self._lock:
+            self._set_size(min(self._size, batch_size * self.multiplicative_decrease))
@@ -0,0 +1,143 @@
+# common_utils/background_jobs.py
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from common_utils.logger_setup import setup_logger
+from platform_configs.general_config import DASHBOARD_JOBS_PATH, DASHBOARD_JOB_WORKERS
+
+
+class BackgroundJobRunner:
+    """
+    오래 걸리는 수집 작업을 백그라운드 스레드에서 실행하고, 상태/진행률/결과를 SQLite에 기록합니다.
+
+    - 같은 key(예: BBOX + 플랫폼 + 매물 유형)의 작업이 이미 대기 중이거나 실행 중이면 새로 만들지 않고
+      기존 작업 ID를 돌려주므로, 여러 사용자가 같은 수집을 동시에 요청해도 한 번만 실행됩니다.
+    - 상태는 디스크에 남으므로 화면을 새로 고치거나 다른 세션에서 봐도 같은 결과를 볼 수 있습니다.
+
+    submit()에 넘기는 함수는 report_progress(done, total, message) 콜백을 인자로 받고,
+    JSON으로 저장할 수 있는 결과를 반환해야 합니다.
+    """
+    def __init__(self, db_path=DASHBOARD_JOBS_PATH, max_workers=DASHBOARD_JOB_WORKERS, log_level="INFO", log_file=None):
+        self.logger = setup_logger(self.__class__.__name__, log_level, log_file)
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="background-job")
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                job_key TEXT NOT NULL,
+                params TEXT,
+                state TEXT NOT NULL,
+                progress_done INTEGER NOT NULL DEFAULT 0,
+                progress_total INTEGER NOT NULL DEFAULT 0,
+                message TEXT,
+                result TEXT,
+                error TEXT,
+                submitted_at REAL NOT NULL,
+                finished_at REAL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_key ON jobs (job_key, state)")
+        # 이전 서버 프로세스가 실행하던 작업은 이어서 실행할 수 없으므로 중단된 것으로 표시
+        self._conn.execute(
+            "UPDATE jobs SET state = 'interrupted', finished_at = ? WHERE state IN ('queued', 'running')", (time.time(),)
+        )
+        self._conn.commit()
+        self.logger.info("BackgroundJobRunner initialized.")
+
+    def submit(self, job_key, func, params=None):
+        """
+        작업을 제출하고 작업 ID를 반환합니다. 같은 job_key의 작업이 진행 중이면 그 작업의 ID를 반환합니다.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_id FROM jobs WHERE job_key = ? AND state IN ('queued', 'running') ORDER BY submitted_at DESC LIMIT 1",
+                (job_key,),
+            ).fetchone()
+            if row:
+                self.logger.info(f"Job for key {job_key} is already in progress ({row[0]}).")
+                return row[0]
+
+            job_id = uuid.uuid4().hex[:12]
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, job_key, params, state, submitted_at) VALUES (?, ?, ?, 'queued', ?)",
+                (job_id, job_key, json.dumps(params, ensure_ascii=False, default=str), time.time()),
+            )
+            self._conn.commit()
+
+        self._executor.submit(self._run, job_id, func)
+        self.logger.info(f"Submitted background job {job_id} for key {job_key}.")
+        return job_id
+
+    def _update(self, job_id, **fields):
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self._conn.execute(f"UPDATE jobs SET {assignments} WHERE job_id = ?", (*fields.values(), job_id))
+            self._conn.commit()
+
+    def _run(self, job_id, func):
+        self._update(job_id, state="running")
+
+        def report_progress(done, total, message=None):
+            self._update(job_id, progress_done=done, progress_total=total, message=message)
+
+        try:
+            result = func(report_progress)
+        except Exception as e:
+            self.logger.error(f"Background job {job_id} failed: {e}", exc_info=True)
+            self._update(job_id, state="failed", error=str(e), finished_at=time.time())
+            return
+        self._update(job_id, state="finished", result=json.dumps(result, ensure_ascii=False, default=str), finished_at=time.time())
+        self.logger.info(f"Background job {job_id} finished.")
+
+    @staticmethod
+    def _row_to_job(row):
+        if row is None:
+            return None
+        job_id, job_key, params, state, done, total, message, result, error, submitted_at, finished_at = row
+        return {
+            "job_id": job_id,
+            "job_key": job_key,
+            "params": json.loads(params) if params else None,
+            "state": state,
+            "progress_done": done,
+            "progress_total": total,
+            "message": message,
+            "result": json.loads(result) if result else None,
+            "error": error,
+            "submitted_at": submitted_at,
+            "finished_at": finished_at,
+        }
+
+    def get(self, job_id):
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row)
+
+    def latest(self, job_key=None, state=None):
+        """
+        가장 최근에 제출된 작업을 반환합니다. job_key/state로 범위를 좁힐 수 있습니다.
+        """
+        query = "SELECT * FROM jobs WHERE 1 = 1"
+        params = []
+        if job_key is not None:
+            query += " AND job_key = ?"
+            params.append(job_key)
+        if state is not None:
+            query += " AND state = ?"
+            params.append(state)
+        with self._lock:
+            row = self._conn.execute(query + " ORDER BY submitted_at DESC LIMIT 1", params).fetchone()
+        return self._row_to_job(row)
@@ -0,0 +1,103 @@
+# common_utils/crawl_checkpoint.py
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from common_utils.response_records import record_to_json
+from platform_configs.general_config import CHECKPOINT_PATH, CHECKPOINT_FLUSH_SECONDS, CHECKPOINT_FLUSH_UNITS
+
+
+class CrawlCheckpoint:
+    """
+    수집 도중 끝난 작업 단위(Geohash 셀, 다방 페이지, 저장된 상세 정보 청크)와 그 결과를 기록하는 SQLite 체크포인트입니다.
+
+    기록은 메모리에 모았다가 CHECKPOINT_FLUSH_UNITS개가 쌓이거나 마지막 기록 후
+    CHECKPOINT_FLUSH_SECONDS초가 지나면 한 번에 씁니다. 수집이 중단되어도 잃는 작업은
+    마지막 기록 이후의 일부뿐이며, --resume으로 다시 실행하면 기록된 단위는 요청하지 않고 건너뜁니다.
+    """
+    def __init__(self, db_path=CHECKPOINT_PATH, flush_seconds=CHECKPOINT_FLUSH_SECONDS, flush_units=CHECKPOINT_FLUSH_UNITS):
+        self.db_path = db_path
+        self.flush_seconds = flush_seconds
+        self.flush_units = flush_units
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._pending = []
+        self._last_flush = time.monotonic()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                scope TEXT NOT NULL,
+                unit_key TEXT NOT NULL,
+                data TEXT,
+                recorded_at REAL NOT NULL,
+                PRIMARY KEY (scope, unit_key)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def scope(self, name):
+        """
+        수집 범위(예: 'zigbang:ids:villa:37.49,...') 하나에 묶인 체크포인트를 반환합니다.
+        """
+        return CheckpointScope(self, name)
+
+    def record(self, scope, unit_key, data=None):
+        with self._lock:
+            self._pending.append((scope, unit_key, json.dumps(data, ensure_ascii=False, default=record_to_json), time.time()))
+            if len(self._pending) >= self.flush_units or time.monotonic() - self._last_flush >= self.flush_seconds:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._pending:
+            self._conn.executemany("INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?)", self._pending)
+            self._conn.commit()
+            self._pending = []
+        self._last_flush = time.monotonic()
+
+    def load(self, scope):
+        """
+        scope에 기록된 {작업 단위 키: 데이터}를 반환합니다.
+        """
+        with self._lock:
+            self._flush_locked()
+            rows = self._conn.execute("SELECT unit_key, data FROM checkpoints WHERE scope = ?", (scope,)).fetchall()
+        return {unit_key: json.loads(data) for unit_key, data in rows}
+
+    def clear(self, scope):
+        with self._lock:
+            self._pending = [row for row in self._pending if row[0] != scope]
+            self._conn.execute("DELETE FROM checkpoints WHERE scope = ?", (scope,))
+            self._conn.commit()
+
+
+class CheckpointScope:
+    """
+    CrawlCheckpoint에서 수집 범위 하나만 다루는 얇은 래퍼입니다. 수집기에는 이 객체를 넘깁니다.
+    """
+    def __init__(self, checkpoint, name):
+        self.checkpoint = checkpoint
+        self.name = name
+
+    def load(self):
+        return self.checkpoint.load(self.name)
+
+    def record(self, unit_key, data=None):
+        self.checkpoint.record(self.name, unit_key, data)
+
+    def flush(self):
+        self.checkpoint.flush()
+
+    def clear(self):
+        self.checkpoint.clear(self.name)
@@ -0,0 +1,93 @@
+# common_utils/geohash_tiler.py
+from common_utils.geohash_utils import (
+    bbox_intersects, clip_bbox, geohash_bbox, geohash_children, geohashes_covering_bbox
+)
+
+
+class GeohashTiler:
+    """
+    BBOX를 Geohash 셀로 적응적으로 분할(quadtree 방식)하며 조회합니다.
+
+    min_precision 셀로 BBOX 전체를 덮은 뒤, 응답이 포화 상태(API 반환 상한에 도달)인 셀만
+    32개의 하위 셀로 다시 나누어 조회합니다. 매물이 적은 지역은 큰 셀 하나로 끝나고,
+    밀집 지역만 깊게 내려가므로 균일 격자보다 적은 요청으로 누락 없이 수집할 수 있습니다.
+
+    fetch_cell(geohash_code, cell_bbox) -> 응답 데이터
+    is_saturated(응답 데이터) -> bool
+    """
+    def __init__(self, fetch_cell, is_saturated, min_precision=5, max_precision=8, logger=None):
+        if min_precision > max_precision:
+            raise ValueError(f"min_precision ({min_precision}) must not exceed max_precision ({max_precision}).")
+        self.fetch_cell = fetch_cell
+        self.is_saturated = is_saturated
+        self.min_precision = min_precision
+        self.max_precision = max_precision
+        self.logger = logger
+        self.stats = {}
+
+    def tile(self, lat_min, lat_max, lng_min, lng_max, known_cells=None):
+        """
+        조회한 셀마다 (geohash_code, cell_bbox, data)를 생성(yield)합니다.
+        순회가 끝나면 self.stats에 요청 수와 균일 격자 대비 절감량이 기록됩니다.
+        요청이 실패한 셀(data가 None)은 하위 셀로 내려가지 않으므로, failed_cells가 0이 아니면 BBOX의 매물 목록이 완전하지 않습니다.
+
+        known_cells: {geohash_code: data}. 이전 실행(체크포인트)에서 이미 받은 셀은 요청하지 않고 이 데이터를 사용하며,
+        포화된 셀이었다면 그대로 하위 셀로 내려가므로 중단된 지점부터 이어서 순회합니다.
+        """
+        known_cells = known_cells or {}
+        bounds = (lat_min, lat_max, lng_min, lng_max)
+        # 깊이 우선으로 처리하여 대기 중인 셀 수를 (32 * 깊이) 이내로 유지
+        pending = list(reversed(geohashes_covering_bbox(lat_min, lat_max, lng_min, lng_max, self.min_precision)))
+        request_count = 0
+        saturated_count = 0
+        truncated_count = 0
+        resumed_count = 0
+        failed_count = 0
+        deepest_precision = self.min_precision
+
+        while pending:
+            geohash_code = pending.pop()
+            cell_bbox = clip_bbox(geohash_bbox(geohash_code), bounds)
+            if geohash_code in known_cells:
+                data = known_cells[geohash_code]
+                resumed_count += 1
+            else:
+                data = self.fetch_cell(geohash_code, cell_bbox)
+                request_count += 1
+            deepest_precision = max(deepest_precision, len(geohash_code))
+            yield geohash_code, cell_bbox, data
+
+            if data is None:
+                failed_count += 1
+                continue
+            if not self.is_saturated(data):
+                continue
+
+            saturated_count += 1
+            if len(geohash_code) >= self.max_precision:
+                truncated_count += 1
+                if self.logger:
+                    self.logger.warning(f"Geohash {geohash_code} is still saturated at max precision {self.max_precision}. Some listings may be missing.")
+                continue
+
+            children = [child for child in geohash_children(geohash_code)
+                        if bbox_intersects(geohash_bbox(child), bounds)]
+            pending.extend(reversed(children))
+
+        uniform_count = len(geohashes_covering_bbox(lat_min, lat_max, lng_min, lng_max, deepest_precision))
+        self.stats = {
+            "requests": request_count,
+            "saturated_cells": saturated_count,
+            "truncated_cells": truncated_count,
+            "deepest_precision": deepest_precision,
+            "uniform_grid_requests": uniform_count,
+            "saved_requests": uniform_count - request_count,
+            "resumed_cells": resumed_count,
+            "failed_cells": failed_count,
+        }
+        if self.logger:
+            self.logger.info(
+                f"Geohash tiling finished: {request_count} requests (uniform grid at precision {deepest_precision} "
+                f"would need {uniform_count}, saved {uniform_count - request_count}), "
+                f"{saturated_count} saturated cells subdivided, {resumed_count} cells restored from checkpoint, {failed_count} cells failed."
+            )
@@ -0,0 +1,126 @@
+# common_utils/geohash_utils.py
+import math
+import numpy as np
+import geohash2 as geohash
+
+# Geohash에 사용되는 base32 문자 집합 (a, i, l, o 제외)
+GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+# 주변 8개 셀의 (위도, 경도) 방향: 북, 북동, 동, 남동, 남, 남서, 서, 북서
+GEOHASH_NEIGHBOR_OFFSETS = [(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)]
+
+
+def geohash_cell_size(precision):
+    """
+    주어진 정밀도의 Geohash 셀 크기를 (위도 폭, 경도 폭) 도 단위로 반환합니다.
+    """
+    total_bits = precision * 5
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lng_bits)
+
+
+def geohash_bbox(geohash_code):
+    """
+    Geohash 셀의 경계를 (lat_min, lat_max, lng_min, lng_max)로 반환합니다.
+    """
+    lat, lng, lat_err, lng_err = geohash.decode_exactly(geohash_code)
+    return lat - lat_err, lat + lat_err, lng - lng_err, lng + lng_err
+
+
+def geohash_children(geohash_code):
+    """
+    한 단계 더 정밀한 32개의 하위 셀을 반환합니다.
+    """
+    return [geohash_code + char for char in GEOHASH_BASE32]
+
+
+def geohash_neighbors(geohash_code):
+    """
+    같은 정밀도에서 주변 8개 셀을 반환합니다. (북, 북동, 동, 남동, 남, 남서, 서, 북서 순)
+    셀 중심에서 셀 크기만큼 이동한 좌표를 인코딩하며, 극지방을 벗어나는 셀은 제외하고
+    경도 ±180도를 넘으면 반대편으로 이어 붙입니다.
+    """
+    precision = len(geohash_code)
+    lat, lng, _, _ = geohash.decode_exactly(geohash_code)
+    lat_step, lng_step = geohash_cell_size(precision)
+    neighbors = []
+    for lat_offset, lng_offset in GEOHASH_NEIGHBOR_OFFSETS:
+        neighbor_lat = lat + lat_offset * lat_step
+        if abs(neighbor_lat) > 90.0:
+            continue
+        neighbor_lng = (lng + lng_offset * lng_step + 180.0) % 360.0 - 180.0
+        neighbors.append(geohash.encode(neighbor_lat, neighbor_lng, precision=precision))
+    return neighbors
+
+
+def bbox_intersects(bbox_a, bbox_b):
+    """
+    두 BBOX (lat_min, lat_max, lng_min, lng_max)가 겹치는지 확인합니다. 경계만 맞닿은 경우는 제외합니다.
+    """
+    return (bbox_a[0] < bbox_b[1] and bbox_b[0] < bbox_a[1]
+            and bbox_a[2] < bbox_b[3] and bbox_b[2] < bbox_a[3])
+
+
+def clip_bbox(bbox, bounds):
+    """
+    bbox를 bounds 범위 안으로 잘라서 반환합니다.
+    """
+    return (max(bbox[0], bounds[0]), min(bbox[1], bounds[1]),
+            max(bbox[2], bounds[2]), min(bbox[3], bounds[3]))
+
+
+def geohashes_covering_bbox(lat_min, lat_max, lng_min, lng_max, precision):
+    """
+    BBOX 전체를 빈틈없이 덮는 특정 정밀도의 Geohash 목록을 반환합니다.
+    셀 격자에 맞춰 각 셀의 중심 좌표를 인코딩하므로 중복 없이 한 번씩만 생성됩니다.
+    """
+    lat_step, lng_step = geohash_cell_size(precision)
+    lat_start = math.floor((lat_min + 90.0) / lat_step)
+    lat_end = math.ceil((lat_max + 90.0) / lat_step)
+    lng_start = math.floor((lng_min + 180.0) / lng_step)
+    lng_end = math.ceil((lng_max + 180.0) / lng_step)
+
+    geohashes = []
+    for lat_index in range(lat_start, max(lat_end, lat_start + 1)):
+        center_lat = (lat_index + 0.5) * lat_step - 90.0
+        if center_lat >= 90.0:
+            break
+        for lng_index in range(lng_start, max(lng_end, lng_start + 1)):
+            center_lng = (lng_index + 0.5) * lng_step - 180.0
+            if center_lng >= 180.0:
+                break
+            geohashes.append(geohash.encode(center_lat, center_lng, precision=precision))
+    return geohashes
+
+
+def encode_geohashes(lats, lngs, precision):
+    """
+    위도/경도 배열을 한 번에 Geohash 문자열 배열로 인코딩합니다.
+    매물 수만 개를 셀 단위로 묶을 때 geohash.encode를 행마다 호출하는 것보다 훨씬 빠릅니다.
+    좌표가 없거나(NaN) 범위를 벗어난 값은 빈 문자열이 됩니다.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    total_bits = precision * 5
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    valid = np.isfinite(lats) & np.isfinite(lngs) & (np.abs(lats) <= 90.0) & (np.abs(lngs) <= 180.0)
+
+    # 각 축을 정수 격자 인덱스로 바꾼 뒤, 경도 비트부터 번갈아 끼워 넣어 Geohash 비트열을 만듦
+    lat_index = np.clip(((np.where(valid, lats, 0.0) + 90.0) / 180.0 * (1 << lat_bits)).astype(np.int64), 0, (1 << lat_bits) - 1)
+    lng_index = np.clip(((np.where(valid, lngs, 0.0) + 180.0) / 360.0 * (1 << lng_bits)).astype(np.int64), 0, (1 << lng_bits) - 1)
+    code = np.zeros(len(lats), dtype=np.int64)
+    lat_bit, lng_bit = lat_bits, lng_bits
+    for bit in range(total_bits):
+        if bit % 2 == 0:
+            lng_bit -= 1
+            code = (code << 1) | ((lng_index >> lng_bit) & 1)
+        else:
+            lat_bit -= 1
+            code = (code << 1) | ((lat_index >> lat_bit) & 1)
+
+    alphabet = np.frombuffer(GEOHASH_BASE32.encode("ascii"), dtype=np.uint8)
+    shifts = np.arange(precision - 1, -1, -1, dtype=np.int64) * 5
+    chars = alphabet[(code[:, None] >> shifts) & 31]
+    geohashes = chars.view(f"S{precision}").ravel().astype(str) if len(code) else np.array([], dtype=str)
+    return np.where(valid, geohashes, "")
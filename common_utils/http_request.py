@@ -0,0 +1,288 @@
+# common_utils/http_request.py
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
+
+import requests
+
+from common_utils.rate_limiter import get_rate_limiter, parse_retry_after
+from common_utils.metrics import get_metrics
+from platform_configs.general_config import (
+    REQUEST_TIMEOUT, DEFAULT_RATE_LIMIT, DEFAULT_RETRY_POLICY, DEFAULT_CIRCUIT_BREAKER, DEFAULT_HEDGING
+)
+
+# 재시도할 가치가 있는 상태 코드 (일시적인 서버 오류 또는 요청 제한)
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+# 재시도할 가치가 있는 예외 (타임아웃, 연결 오류, 본문을 받다가 끊기거나 깨진 응답)
+# 그 밖의 RequestException(리디렉션 반복, 잘못된 URL 등)은 다시 보내도 같으므로 회로 차단기에 실패로만 기록하고 바로 올림
+RETRYABLE_EXCEPTIONS = (
+    requests.exceptions.Timeout, requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError,
+)
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """
+    회로 차단기가 열려 있어 요청을 보내지 않았을 때 발생합니다.
+    """
+
+
+class CircuitBreaker:
+    """
+    호스트별 회로 차단기입니다.
+    연속 실패가 failure_threshold번 쌓이면 열리고(open), reset_timeout초가 지나면
+    요청 하나만 시험적으로 통과시킵니다(half-open). 시험 요청이 성공하면 다시 닫힙니다.
+    """
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                return "half_open"
+            return "open"
+
+    def allow_request(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout or self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class LatencyTracker:
+    """
+    최근 성공한 요청들의 지연 시간을 보관하고 백분위 값을 계산합니다.
+    """
+    def __init__(self, window=200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, fraction, min_samples=1):
+        with self._lock:
+            if len(self._samples) < max(1, min_samples):
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+        return ordered[index]
+
+
+# 프로세스 전체에서 호스트별로 공유되는 상태
+_circuit_breakers = {}
+_latency_trackers = {}
+_registry_lock = threading.Lock()
+# 헤지 요청에 사용할 공용 스레드 풀
+_hedge_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="hedge")
+
+
+def get_circuit_breaker(host, config=None):
+    with _registry_lock:
+        breaker = _circuit_breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(**(config or DEFAULT_CIRCUIT_BREAKER))
+            _circuit_breakers[host] = breaker
+        return breaker
+
+
+def get_latency_tracker(host):
+    with _registry_lock:
+        tracker = _latency_trackers.get(host)
+        if tracker is None:
+            tracker = LatencyTracker()
+            _latency_trackers[host] = tracker
+        return tracker
+
+
+class RequestExecutor:
+    """
+    API 클라이언트들이 공유하는 요청 계층입니다.
+
+    - 호스트별 요청 속도 제한 (AdaptiveRateLimiter)
+    - 재시도 가능한 오류에 대해 지터를 섞은 지수 백오프 재시도
+    - 호스트별 회로 차단기
+    - (선택) 헤지 요청: 지연 시간 백분위 값만큼 기다려도 응답이 없으면 같은 요청을 한 번 더 보냄
+
+    마지막 시도까지 실패하면 마지막 응답을 반환하거나(상태 코드 오류) 마지막 예외를 다시 발생시키므로,
+    호출하는 쪽의 기존 오류 처리(raise_for_status, except 절)를 그대로 사용할 수 있습니다.
+    """
+    def __init__(self, session, logger, rate_limit_config=None, retry_policy=None,
+                 circuit_breaker_config=None, hedging=None, timeout=REQUEST_TIMEOUT, response_cache=None, headers=None):
+        self.session = session
+        self.logger = logger
+        # 여러 클라이언트가 세션을 공유하므로 클라이언트별 헤더는 세션이 아닌 요청마다 붙임
+        self.headers = dict(headers or {})
+        self.rate_limit_config = rate_limit_config or DEFAULT_RATE_LIMIT
+        self.retry_policy = {**DEFAULT_RETRY_POLICY, **(retry_policy or {})}
+        self.circuit_breaker_config = circuit_breaker_config or DEFAULT_CIRCUIT_BREAKER
+        self.hedging = {**DEFAULT_HEDGING, **(hedging or {})}
+        self.timeout = timeout
+        self.response_cache = response_cache
+
+    def _send_once(self, method, url, host, **kwargs):
+        rate_limiter = get_rate_limiter(host, self.rate_limit_config)
+        rate_limiter.acquire()
+        metrics = get_metrics()
+        started = time.monotonic()
+        try:
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            if not kwargs.get("stream"):
+                # 본문까지 받은 시간을 지연 시간으로 기록 (스트리밍 응답은 헤더까지만)
+                response_bytes = len(response.content)
+            else:
+                response_bytes = int(response.headers.get("Content-Length") or 0)
+        except requests.exceptions.RequestException as err:
+            if isinstance(err, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+                rate_limiter.record_throttle()
+            metrics.increment("http_requests_total", host=host, method=method, status=err.__class__.__name__)
+            raise
+        elapsed = time.monotonic() - started
+        rate_limiter.record_response(response.status_code, response.headers)
+        if response.status_code < 500:
+            get_latency_tracker(host).record(elapsed)
+        metrics.increment("http_requests_total", host=host, method=method, status=response.status_code)
+        metrics.increment("http_response_bytes_total", response_bytes, host=host)
+        metrics.observe("http_request_seconds", elapsed, host=host, method=method)
+        return response
+
+    def _send_hedged(self, method, url, host, **kwargs):
+        delay = get_latency_tracker(host).percentile(self.hedging["percentile"], self.hedging["min_samples"])
+        if delay is None:
+            return self._send_once(method, url, host, **kwargs)
+
+        primary = _hedge_executor.submit(self._send_once, method, url, host, **kwargs)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        self.logger.debug("Sending hedged request for %s after %.3fs without a response.", url, delay)
+        get_metrics().increment("http_hedged_requests_total", host=host)
+        hedge = _hedge_executor.submit(self._send_once, method, url, host, **kwargs)
+        pending = {primary, hedge}
+        last_error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except requests.exceptions.RequestException as err:
+                    last_error = err
+                    continue
+                # 먼저 도착한 정상 응답을 사용하고, 남은 요청의 결과는 버림
+                if response.status_code not in RETRYABLE_STATUS_CODES or not pending:
+                    return response
+        raise last_error
+
+    def _backoff_delay(self, attempt, response=None):
+        delay = random.uniform(0, min(self.retry_policy["max_delay"], self.retry_policy["base_delay"] * (2 ** attempt)))
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after:
+                delay = max(delay, min(retry_after, self.retry_policy["max_delay"]))
+        return delay
+
+    def request(self, method, url, use_cache=False, **kwargs):
+        if self.headers:
+            kwargs["headers"] = {**self.headers, **(kwargs.get("headers") or {})}
+        if not (use_cache and self.response_cache):
+            return self._request_with_retries(method, url, **kwargs)
+
+        cache = self.response_cache
+        metrics = get_metrics()
+        host = urlparse(url).netloc
+        cache_key = cache.make_key(method, url, kwargs.get("params"), kwargs.get("json"))
+        entry = cache.get(cache_key)
+        if entry and entry["fresh"]:
+            cache.record_hit()
+            metrics.increment("http_cache_total", host=host, result="hit")
+            return cache.build_response(entry, url)
+
+        if entry:
+            # 만료된 항목은 ETag/Last-Modified로 서버에 변경 여부만 확인
+            conditional_headers = cache.conditional_headers(entry)
+            if conditional_headers:
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **conditional_headers}
+
+        response = self._request_with_retries(method, url, **kwargs)
+        if response.status_code == 304 and entry:
+            cache.refresh(cache_key)
+            cache.record_revalidated()
+            metrics.increment("http_cache_total", host=host, result="revalidated")
+            return cache.build_response(entry, url)
+
+        cache.record_miss()
+        metrics.increment("http_cache_total", host=host, result="miss")
+        cache.put(cache_key, response)
+        return response
+
+    def _request_with_retries(self, method, url, **kwargs):
+        host = urlparse(url).netloc
+        breaker = get_circuit_breaker(host, self.circuit_breaker_config)
+        max_attempts = max(1, self.retry_policy["max_attempts"])
+
+        for attempt in range(max_attempts):
+            if not breaker.allow_request():
+                raise CircuitOpenError(f"Circuit breaker for {host} is open; request to {url} was not sent.")
+
+            is_last_attempt = attempt == max_attempts - 1
+            try:
+                if self.hedging["enabled"]:
+                    response = self._send_hedged(method, url, host, **kwargs)
+                else:
+                    response = self._send_once(method, url, host, **kwargs)
+            except requests.exceptions.RequestException as err:
+                # 어떤 요청 오류든 실패로 기록해야 half-open 시험 요청이 끝난 것으로 처리됨 (기록하지 않으면 회로가 영영 열려 있음)
+                breaker.record_failure()
+                if is_last_attempt or not isinstance(err, RETRYABLE_EXCEPTIONS):
+                    raise
+                delay = self._backoff_delay(attempt)
+                get_metrics().increment("http_retries_total", host=host, reason=err.__class__.__name__)
+                self.logger.warning(f"Request to {url} failed ({err.__class__.__name__}), retrying in {delay:.2f}s (attempt {attempt + 1}/{max_attempts}).")
+                time.sleep(delay)
+                continue
+
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                # 429는 서버가 살아 있다는 뜻이므로 회로 차단기에는 성공으로 기록 (속도 조절은 제한기가 담당)
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                if is_last_attempt:
+                    return response
+                delay = self._backoff_delay(attempt, response)
+                get_metrics().increment("http_retries_total", host=host, reason=response.status_code)
+                self.logger.warning(f"Request to {url} returned {response.status_code}, retrying in {delay:.2f}s (attempt {attempt + 1}/{max_attempts}).")
+                time.sleep(delay)
+                continue
+
+            breaker.record_success()
+            return response
@@ -0,0 +1,222 @@
+# common_utils/http_transport.py
+import socket
+import threading
+import time
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from platform_configs.general_config import (
+    HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP2_ENABLED, DNS_CACHE_TTL_SECONDS
+)
+
+
+class _ConnectionStats:
+    """
+    공유 세션으로 보낸 요청 수와 새로 연 커넥션 수를 세어 커넥션 재사용률을 계산합니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+
+    def increment(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self):
+        with self._lock:
+            requests_sent = self.requests
+            new_connections = self.new_connections
+        reused = max(0, requests_sent - new_connections)
+        return {
+            "requests": requests_sent,
+            "new_connections": new_connections,
+            "reused_connections": reused,
+            "reuse_ratio": reused / requests_sent if requests_sent else 0.0,
+        }
+
+
+_stats = _ConnectionStats()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        _stats.increment("new_connections")
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _stats.increment("new_connections")
+        return super()._new_conn()
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """
+    새 커넥션을 열 때마다 횟수를 기록하는 HTTPAdapter입니다.
+    """
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        _stats.increment("requests")
+        return super().send(request, **kwargs)
+
+
+class Http2Adapter(BaseAdapter):
+    """
+    httpx(HTTP/2)로 요청을 보내고 결과를 requests.Response로 바꿔 주는 어댑터입니다.
+    기존 코드는 그대로 requests API를 사용하면서 HTTP/2 다중화의 이점을 얻을 수 있습니다.
+    """
+    def __init__(self, max_connections=HTTP_POOL_MAXSIZE):
+        super().__init__()
+        import httpx
+        self._httpx = httpx
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        _stats.increment("requests")
+        try:
+            httpx_response = self._client.request(
+                request.method, request.url, headers=dict(request.headers), content=request.body, timeout=timeout
+            )
+        except self._httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e, request=request)
+        except self._httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+
+        response = requests.Response()
+        response.status_code = httpx_response.status_code
+        response.headers = CaseInsensitiveDict(httpx_response.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = httpx_response.reason_phrase
+        response.url = str(httpx_response.url)
+        response.request = request
+        # httpx가 이미 본문을 모두 받아 압축을 풀었으므로 content/iter_content 모두 이 값을 사용
+        response._content = httpx_response.content
+        response._content_consumed = True
+        return response
+
+    def close(self):
+        self._client.close()
+
+
+def is_brotli_available():
+    for module_name in ("brotli", "brotlicffi"):
+        try:
+            __import__(module_name)
+            return True
+        except ImportError:
+            continue
+    return False
+
+
+def is_http2_available():
+    try:
+        import httpx  # noqa: F401
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def build_request_headers(headers):
+    """
+    실제로 디코딩할 수 있는 압축 방식만 Accept-Encoding에 남깁니다.
+    br은 brotli(또는 brotlicffi)가 설치되어 있어야 urllib3가 풀 수 있으므로, 없으면 광고하지 않습니다.
+    """
+    headers = dict(headers)
+    headers["Accept-Encoding"] = "gzip, deflate, br" if is_brotli_available() else "gzip, deflate"
+    headers.setdefault("Connection", "keep-alive")
+    return headers
+
+
+# --- DNS 캐시 ---
+_original_getaddrinfo = socket.getaddrinfo
+_dns_cache = {}
+_dns_cache_lock = threading.Lock()
+_dns_cache_ttl = 0
+
+
+def _cached_getaddrinfo(host, port, *args, **kwargs):
+    key = (host, port, args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+    with _dns_cache_lock:
+        cached = _dns_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+    result = _original_getaddrinfo(host, port, *args, **kwargs)
+    with _dns_cache_lock:
+        _dns_cache[key] = (now + _dns_cache_ttl, result)
+    return result
+
+
+def install_dns_cache(ttl=DNS_CACHE_TTL_SECONDS):
+    """
+    프로세스 전체의 DNS 조회 결과를 ttl초 동안 캐시합니다. ttl이 0이면 설치하지 않습니다.
+    """
+    global _dns_cache_ttl
+    if ttl <= 0:
+        return
+    _dns_cache_ttl = ttl
+    socket.getaddrinfo = _cached_getaddrinfo
+
+
+# --- 프로세스 공용 세션 ---
+_shared_session = None
+_mounted_pool_sizes = {}
+_session_lock = threading.Lock()
+
+
+def get_shared_session():
+    """
+    모든 API 클라이언트가 공유하는 requests.Session을 반환합니다.
+    처음 호출될 때 커넥션 풀, (설정 시) HTTP/2 어댑터와 DNS 캐시를 준비합니다.
+    """
+    global _shared_session
+    with _session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            adapter = CountingHTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            if HTTP2_ENABLED and is_http2_available():
+                session.mount("https://", Http2Adapter())
+            else:
+                session.mount("https://", adapter)
+            install_dns_cache()
+            _shared_session = session
+        return _shared_session
+
+
+def configure_host_pool(base_url, pool_maxsize):
+    """
+    특정 호스트(base_url)의 커넥션 풀 크기를 지정합니다. 이미 더 큰 풀이 설정되어 있으면 그대로 둡니다.
+    """
+    session = get_shared_session()
+    prefix = base_url.rstrip("/") + "/"
+    with _session_lock:
+        if _mounted_pool_sizes.get(prefix, 0) >= pool_maxsize:
+            return
+        # HTTP/2 어댑터는 다중화를 사용하므로 호스트별 풀을 따로 두지 않음
+        if prefix.startswith("https://") and isinstance(session.get_adapter("https://"), Http2Adapter):
+            return
+        session.mount(prefix, CountingHTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize))
+        _mounted_pool_sizes[prefix] = pool_maxsize
+
+
+def connection_stats():
+    """
+    공유 세션의 요청 수, 새 커넥션 수, 재사용된 커넥션 수와 재사용률을 반환합니다.
+    """
+    return _stats.snapshot()
@@ -0,0 +1,203 @@
+# common_utils/id_set.py
+import os
+
+import numpy as np
+
+
+def _sorted_unique(array):
+    """
+    정렬 후 이웃한 같은 값을 지웁니다. (np.unique는 버전에 따라 해시 기반으로 동작해 정렬보다 훨씬 느릴 수 있음)
+    이미 정렬된 조각들을 이어 붙인 배열이면 stable 정렬(timsort/radix)이 병합만 하므로 더 빠릅니다.
+    """
+    array = np.sort(array, kind="stable")
+    if len(array) < 2:
+        return array
+    keep = np.empty(len(array), dtype=bool)
+    keep[0] = True
+    np.not_equal(array[1:], array[:-1], out=keep[1:])
+    return array[keep]
+
+
+class IdSet:
+    """
+    매물 ID 집합을 정렬된(중복 없는) NumPy 배열 하나로 보관합니다.
+
+    파이썬 set은 ID 하나마다 정수 객체와 해시 테이블 칸을 따로 잡아 수십~수백 바이트를 쓰지만,
+    IdSet은 정수 ID를 uint64(8바이트), 문자열 ID를 고정 길이 bytes로 담습니다.
+    합집합/차집합/교집합은 정렬된 배열끼리의 병합이라 수백만 개도 수십 ms 안에 끝나고,
+    포함 여부는 이진 탐색으로 확인합니다. 순회하면 정렬된 순서의 파이썬 값(int 또는 str)이 나옵니다.
+
+    정수 ID(직방)와 문자열 ID(다방)를 한 집합에 섞을 수는 없습니다.
+    """
+    __slots__ = ("_values",)
+
+    def __init__(self, values=()):
+        if isinstance(values, IdSet):
+            self._values = values._values
+            return
+        self._values = _sorted_unique(self._to_array(values))
+
+    @staticmethod
+    def _to_array(values):
+        if isinstance(values, np.ndarray):
+            array = values
+        else:
+            values = values if isinstance(values, (list, tuple)) else list(values)
+            if not values:
+                return np.empty(0, dtype=np.uint64)
+            array = np.asarray(values)
+        if array.dtype.kind in "UO":
+            # 문자열 ID는 UTF-8 bytes로 저장 (numpy 유니코드 배열은 글자당 4바이트를 씀)
+            array = np.asarray([str(value).encode("utf-8") for value in array.tolist()])
+        elif array.dtype.kind not in "iuS":
+            raise TypeError(f"IdSet stores integer or string IDs, not {array.dtype}.")
+        if array.dtype.kind in "iu":
+            if array.dtype.kind == "i" and len(array) and array.min() < 0:
+                raise ValueError("IdSet only stores non-negative integer IDs.")
+            array = array.astype(np.uint64, copy=False)
+        return array
+
+    @classmethod
+    def _from_sorted(cls, values):
+        id_set = cls.__new__(cls)
+        id_set._values = values
+        return id_set
+
+    @classmethod
+    def union_all(cls, parts):
+        """
+        여러 ID 묶음(리스트, 배열, IdSet)을 한 번에 합칩니다. 셀/페이지마다 모은 ID를 마지막에 합칠 때 사용합니다.
+        """
+        arrays = [part._values if isinstance(part, IdSet) else cls._to_array(part) for part in parts]
+        arrays = [array for array in arrays if len(array)]
+        if not arrays:
+            return cls()
+        cls._check_kinds(*arrays)
+        return cls._from_sorted(_sorted_unique(np.concatenate(arrays)))
+
+    @staticmethod
+    def _check_kinds(*arrays):
+        kinds = {"S" if array.dtype.kind == "S" else "u" for array in arrays if len(array)}
+        if len(kinds) > 1:
+            raise TypeError("Cannot combine integer IDs with string IDs in one IdSet.")
+
+    def _coerce(self, other):
+        other_values = other._values if isinstance(other, IdSet) else IdSet(other)._values
+        self._check_kinds(self._values, other_values)
+        return other_values
+
+    @property
+    def values(self):
+        """
+        정렬된 ID 배열 (uint64 또는 bytes). 읽기 전용으로 사용합니다.
+        """
+        return self._values
+
+    @property
+    def nbytes(self):
+        return self._values.nbytes
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def tolist(self):
+        if self._values.dtype.kind == "S":
+            return [value.decode("utf-8") for value in self._values.tolist()]
+        return self._values.tolist()
+
+    def __getitem__(self, index):
+        """
+        정렬된 순서의 위치로 ID를 꺼냅니다. 슬라이스는 파이썬 값 리스트를 반환하므로
+        리스트를 청크로 나누던 코드(item_ids[i:i + chunk_size])에 그대로 넘길 수 있습니다.
+        """
+        if isinstance(index, slice):
+            return IdSet._from_sorted(self._values[index]).tolist()
+        value = self._values[index]
+        return value.decode("utf-8") if self._values.dtype.kind == "S" else int(value)
+
+    def _lookup_key(self, value):
+        if self._values.dtype.kind == "S":
+            return str(value).encode("utf-8")
+        if isinstance(value, (int, np.integer)) and not isinstance(value, bool) and value >= 0:
+            return np.uint64(value)
+        return None
+
+    def __contains__(self, value):
+        key = self._lookup_key(value)
+        if key is None or not len(self._values):
+            return False
+        position = np.searchsorted(self._values, key)
+        return position < len(self._values) and self._values[position] == key
+
+    @staticmethod
+    def _isin_sorted(query, sorted_values):
+        # 정렬된 배열에서 이진 탐색으로 위치를 찾아 같은 값인지 확인 (query는 정렬되어 있지 않아도 됨)
+        positions = np.minimum(np.searchsorted(sorted_values, query), len(sorted_values) - 1)
+        return sorted_values[positions] == query
+
+    def contains(self, values):
+        """
+        여러 ID의 포함 여부를 한 번에 확인해 bool 배열로 반환합니다.
+        """
+        query = values._values if isinstance(values, IdSet) else self._to_array(values)
+        if not len(self._values) or not len(query):
+            return np.zeros(len(query), dtype=bool)
+        self._check_kinds(self._values, query)
+        return self._isin_sorted(query, self._values)
+
+    # 빈 집합은 dtype이 uint64로 고정되어 있어 문자열 집합과 섞으면 dtype이 커지므로 먼저 처리
+    def union(self, other):
+        other_values = self._coerce(other)
+        if not len(other_values) or not len(self._values):
+            return IdSet._from_sorted(self._values if len(self._values) else other_values)
+        return IdSet._from_sorted(_sorted_unique(np.concatenate([self._values, other_values])))
+
+    def difference(self, other):
+        other_values = self._coerce(other)
+        if not len(other_values) or not len(self._values):
+            return IdSet._from_sorted(self._values)
+        # np.isin은 정수 ID 범위가 크지 않으면 조회 테이블, 아니면 정렬 병합으로 비교함
+        return IdSet._from_sorted(self._values[~np.isin(self._values, other_values, assume_unique=True)])
+
+    def intersection(self, other):
+        other_values = self._coerce(other)
+        if not len(other_values) or not len(self._values):
+            return IdSet()
+        return IdSet._from_sorted(self._values[np.isin(self._values, other_values, assume_unique=True)])
+
+    __or__ = union
+    __sub__ = difference
+    __and__ = intersection
+
+    def __eq__(self, other):
+        if not isinstance(other, IdSet):
+            return NotImplemented
+        return len(self) == len(other) and bool(np.array_equal(self._values, other._values))
+
+    def __repr__(self):
+        preview = ", ".join(map(repr, self[:5]))
+        return f"IdSet([{preview}{', ...' if len(self) > 5 else ''}], size={len(self)})"
+
+    def save(self, path):
+        """
+        .npy 파일로 저장합니다. 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 이름을 바꿉니다.
+        """
+        output_dir = os.path.dirname(path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
+        temp_path = f"{path}.tmp.npy"
+        np.save(temp_path, self._values, allow_pickle=False)
+        os.replace(temp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """
+        save()로 저장한 파일을 읽습니다. 파일이 없으면 빈 집합을 반환합니다.
+        """
+        if not os.path.exists(path):
+            return cls()
+        return cls._from_sorted(np.load(path, allow_pickle=False))
@@ -0,0 +1,186 @@
+# common_utils/listing_index.py
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from common_utils.id_set import IdSet
+from common_utils.response_records import record_to_json
+from platform_configs.general_config import LISTING_INDEX_PATH
+
+
+def _fingerprint_default(value):
+    try:
+        return record_to_json(value)
+    except TypeError:
+        return str(value)
+
+
+def listing_fingerprint(record):
+    """
+    목록 API가 돌려준 매물 정보로 내용 지문(fingerprint)을 만듭니다.
+    키 순서와 관계없이 같은 내용이면 같은 값이 나옵니다.
+    레코드(DabangRoom 등)는 to_dict() 결과로 지문을 만들므로, JSON으로 저장했다가 되살린 딕셔너리와 지문이 같습니다.
+    """
+    raw = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=_fingerprint_default)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class ListingIndex:
+    """
+    지금까지 본 매물을 기록하는 SQLite 색인입니다. 증분 수집에 사용합니다.
+
+    매물마다 플랫폼, 매물 ID, 처음/마지막으로 본 시각, 목록 단계의 내용 지문,
+    마지막으로 상세 정보를 받았을 때의 지문, 내려간(delisted) 시각을 저장합니다.
+
+    사용 순서:
+        1. observe(): 이번 수집에서 목록으로 확인한 매물을 기록하고, 상세 정보가 필요한 ID만 돌려받음
+        2. mark_fetched(): 상세 정보를 실제로 받은 ID를 기록
+        3. mark_delisted(): 같은 수집 범위(scope)에서 이번에 보이지 않은 매물을 내려간 것으로 표시
+    """
+    def __init__(self, db_path=LISTING_INDEX_PATH):
+        self.db_path = db_path
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # listing_id는 타입을 지정하지 않아 API가 준 값(정수/문자열)을 그대로 저장
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS listings (
+                platform TEXT NOT NULL,
+                listing_id NOT NULL,
+                scope TEXT,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                fingerprint TEXT,
+                fetched_fingerprint TEXT,
+                detail_fetched_at TEXT,
+                delisted_at TEXT,
+                PRIMARY KEY (platform, listing_id)
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_listings_scope ON listings (platform, scope)")
+        self._conn.commit()
+
+    @staticmethod
+    def _now():
+        return datetime.now().isoformat(timespec="seconds")
+
+    def observe(self, platform, scope, fingerprints):
+        """
+        목록 단계에서 확인한 매물들을 기록합니다.
+        fingerprints: {매물 ID: 지문 또는 None}. 목록 응답에 내용이 없어 지문을 만들 수 없으면 None을 넣습니다.
+
+        상세 정보를 다시 받아야 하는 ID 목록을 반환합니다.
+        (처음 본 매물, 아직 상세 정보를 받지 못한 매물, 지문이 바뀐 매물, 내려갔다가 다시 올라온 매물)
+        """
+        if not fingerprints:
+            return []
+        now = self._now()
+        rows = [(listing_id, fingerprint) for listing_id, fingerprint in fingerprints.items()]
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("CREATE TEMP TABLE IF NOT EXISTS observed (listing_id PRIMARY KEY, fingerprint TEXT)")
+            cur.execute("DELETE FROM observed")
+            cur.executemany("INSERT OR REPLACE INTO observed VALUES (?, ?)", rows)
+
+            to_fetch = [row[0] for row in cur.execute(
+                """
+                SELECT o.listing_id FROM observed o
+                LEFT JOIN listings l ON l.platform = ? AND l.listing_id = o.listing_id
+                WHERE l.listing_id IS NULL
+                   OR l.detail_fetched_at IS NULL
+                   OR l.delisted_at IS NOT NULL
+                   OR (o.fingerprint IS NOT NULL AND o.fingerprint IS NOT l.fetched_fingerprint)
+                """,
+                (platform,)
+            )]
+
+            cur.execute(
+                """
+                INSERT INTO listings (platform, listing_id, scope, first_seen, last_seen, fingerprint)
+                SELECT ?, listing_id, ?, ?, ?, fingerprint FROM observed WHERE true
+                ON CONFLICT (platform, listing_id) DO UPDATE SET
+                    scope = excluded.scope,
+                    last_seen = excluded.last_seen,
+                    fingerprint = COALESCE(excluded.fingerprint, listings.fingerprint),
+                    delisted_at = NULL
+                """,
+                (platform, scope, now, now)
+            )
+            cur.execute("DELETE FROM observed")
+            self._conn.commit()
+        return to_fetch
+
+    def mark_fetched(self, platform, listing_ids):
+        """
+        상세 정보를 받은 매물의 현재 지문을 '상세 정보를 받은 시점의 지문'으로 기록합니다.
+        """
+        now = self._now()
+        with self._lock:
+            self._conn.executemany(
+                """
+                UPDATE listings SET fetched_fingerprint = fingerprint, detail_fetched_at = ?
+                WHERE platform = ? AND listing_id = ?
+                """,
+                [(now, platform, listing_id) for listing_id in listing_ids]
+            )
+            self._conn.commit()
+
+    def _active_ids_locked(self, platform, scope=None):
+        query = "SELECT listing_id FROM listings WHERE platform = ? AND delisted_at IS NULL"
+        params = (platform,)
+        if scope is not None:
+            query += " AND scope = ?"
+            params += (scope,)
+        return IdSet(row[0] for row in self._conn.execute(query, params))
+
+    def active_ids(self, platform, scope=None):
+        """
+        내려가지 않은 매물 ID를 IdSet으로 반환합니다. scope를 주면 그 수집 범위의 매물만 반환합니다.
+        """
+        with self._lock:
+            return self._active_ids_locked(platform, scope)
+
+    def delisted_ids(self, platform):
+        """
+        내려간 것으로 표시된 매물 ID를 IdSet으로 반환합니다. (저장된 이전 행을 화면에서 뺄 때 사용)
+        """
+        with self._lock:
+            return IdSet(row[0] for row in self._conn.execute(
+                "SELECT listing_id FROM listings WHERE platform = ? AND delisted_at IS NOT NULL", (platform,)
+            ))
+
+    def mark_delisted(self, platform, scope, seen_ids):
+        """
+        같은 scope에서 이전에 보였지만 이번 수집에서 보이지 않은 매물을 내려간 것으로 표시하고 그 ID 목록을 반환합니다.
+        이번에 본 ID를 임시 테이블에 넣어 비교하지 않고, 이전 ID와 이번 ID를 IdSet 차집합으로 비교하므로
+        수백만 개에서도 비교 자체는 수십 ms 안에 끝나고 바뀐 매물만 UPDATE합니다.
+        """
+        now = self._now()
+        with self._lock:
+            delisted = self._active_ids_locked(platform, scope).difference(seen_ids).tolist()
+            self._conn.executemany(
+                "UPDATE listings SET delisted_at = ? WHERE platform = ? AND listing_id = ?",
+                [(now, platform, listing_id) for listing_id in delisted]
+            )
+            self._conn.commit()
+        return delisted
+
+    def counts(self, platform):
+        with self._lock:
+            active, delisted = self._conn.execute(
+                """
+                SELECT COALESCE(SUM(delisted_at IS NULL), 0), COALESCE(SUM(delisted_at IS NOT NULL), 0)
+                FROM listings WHERE platform = ?
+                """,
+                (platform,)
+            ).fetchone()
+        return {"active": active, "delisted": delisted}
@@ -1,26 +1,155 @@
 # common_utils/logger_setup.py
+import atexit
+import copy
+import itertools
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+from datetime import datetime
+
+from platform_configs.general_config import LOG_FILE_FORMAT, LOG_MAX_BYTES, LOG_BACKUP_COUNT, LOG_SAMPLE_RATES
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# LogRecord 기본 속성. 이 밖의 속성(extra=...로 넘긴 값)은 JSON 로그에 필드로 그대로 기록
+_STANDARD_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "log_file"}
+
+# 프로세스 전체에서 공유하는 로깅 상태: 큐 하나, 큐를 비우는 리스너 스레드 하나, 로그 파일 경로마다 파일 핸들러 하나
+_state_lock = threading.Lock()
+_log_queue = queue.SimpleQueue()
+_listener = None
+_console_handler = None
+_queue_handlers = {}
+_file_handlers = {}
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    로그 한 건을 JSON 한 줄로 기록합니다. extra=...로 넘긴 필드도 함께 기록됩니다.
+    """
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).astimezone().isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for name, value in vars(record).items():
+            if name not in _STANDARD_RECORD_ATTRS:
+                entry[name] = value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    WARNING 미만 로그를 rate 비율만큼만 통과시킵니다. (예: 0.1이면 10건 중 1건)
+    WARNING 이상은 항상 통과합니다. 로거에 붙이므로 걸러진 로그는 메시지 포맷팅도 하지 않습니다.
+    """
+    def __init__(self, rate):
+        super().__init__()
+        self.every = max(1, round(1 / rate)) if rate > 0 else None
+        self._counter = itertools.count()
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        return self.every is not None and next(self._counter) % self.every == 0
+
+
+class _RoutingQueueHandler(logging.handlers.QueueHandler):
+    """
+    호출한 스레드에서는 메시지만 만들어 큐에 넣습니다. 기록할 파일 경로를 레코드에 붙여 리스너가 파일을 고르게 합니다.
+    """
+    _exception_formatter = logging.Formatter()
+
+    def __init__(self, log_queue, log_file):
+        super().__init__(log_queue)
+        self.log_file = log_file
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        record.log_file = self.log_file
+        return record
+
+
+class _FileDispatchHandler(logging.Handler):
+    """
+    리스너 스레드에서 레코드를 해당 로그 파일의 핸들러로 넘깁니다.
+    """
+    def emit(self, record):
+        handler = _file_handlers.get(record.log_file)
+        if handler is not None:
+            handler.handle(record)
+
+
+def _create_file_handler(log_file):
+    log_dir = os.path.dirname(log_file)
+    if log_dir and not os.path.exists(log_dir):
+        os.makedirs(log_dir, exist_ok=True)
+    handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8'
+    )
+    handler.setFormatter(JsonLinesFormatter() if LOG_FILE_FORMAT == "json" else logging.Formatter(TEXT_FORMAT))
+    return handler
+
+
+def _get_queue_handler(log_file):
+    """
+    로그 파일 경로마다 큐 핸들러 하나를 만들고, 처음 호출될 때 리스너 스레드를 시작합니다.
+    같은 파일을 쓰는 로거들은 파일 핸들(과 회전 상태)을 하나만 공유합니다.
+    """
+    global _listener, _console_handler
+    key = os.path.abspath(log_file) if log_file else None
+    with _state_lock:
+        if _listener is None:
+            _console_handler = logging.StreamHandler()
+            _console_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+            _listener = logging.handlers.QueueListener(_log_queue, _console_handler, _FileDispatchHandler())
+            _listener.start()
+            atexit.register(shutdown_logging)
+        if key is not None and key not in _file_handlers:
+            _file_handlers[key] = _create_file_handler(log_file)
+        if key not in _queue_handlers:
+            _queue_handlers[key] = _RoutingQueueHandler(_log_queue, key)
+        return _queue_handlers[key]
+
+
+def shutdown_logging():
+    """
+    큐에 남은 로그를 모두 기록한 뒤 리스너와 파일을 닫습니다. 프로세스가 끝날 때 자동으로 호출됩니다.
+    """
+    global _listener
+    with _state_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        _listener = None
+        for handler in _file_handlers.values():
+            handler.close()
+
 
 def setup_logger(name, log_level="INFO", log_file=None):
+    """
+    이름별 로거를 설정합니다. 로거에는 큐 핸들러만 붙으므로 호출한 스레드는 파일/콘솔 I/O를 기다리지 않고,
+    실제 기록은 리스너 스레드 하나가 담당합니다. (콘솔은 text, 파일은 LOG_FILE_FORMAT 형식으로 회전하며 기록)
+    LOG_SAMPLE_RATES에 있는 로거는 WARNING 미만 로그를 일부만 남깁니다.
+    """
     logger = logging.getLogger(name)
     logger.setLevel(log_level)
 
     # 핸들러 중복 방지
     if not logger.handlers:
-        # 콘솔 핸들러
-        console_handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-
-        # 파일 핸들러 (지정된 경우)
-        if log_file:
-            log_dir = os.path.dirname(log_file)
-            if log_dir and not os.path.exists(log_dir):
-                os.makedirs(log_dir)
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+        logger.addHandler(_get_queue_handler(log_file))
+        if name in LOG_SAMPLE_RATES:
+            logger.addFilter(SamplingFilter(LOG_SAMPLE_RATES[name]))
     return logger
-
@@ -0,0 +1,241 @@
+# common_utils/metrics.py
+import json
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import datetime
+
+from platform_configs.general_config import METRICS_LATENCY_BUCKETS
+
+# 단계별 처리 시간/처리량 지표 이름 (stage 레이블: list, fetch, convert, save 등)
+STAGE_SECONDS = "crawl_stage_seconds"
+STAGE_ITEMS = "crawl_stage_items_total"
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Histogram:
+    """
+    고정 구간 히스토그램입니다. 관측값을 구간별 개수로만 보관하므로 메모리 사용량이 일정하며,
+    백분위 값은 해당 구간 안에서 선형 보간해 추정합니다.
+    """
+    def __init__(self, buckets=METRICS_LATENCY_BUCKETS):
+        self.bounds = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.bounds) + 1) # 마지막 칸은 +Inf 구간
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, fraction):
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else self.min
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+        }
+
+
+class _StageTracker:
+    def __init__(self):
+        self.items = 0
+
+    def add(self, count):
+        self.items += count
+
+
+class MetricsRegistry:
+    """
+    수집 중 API 클라이언트, 수집기, 변환기, 저장기가 기록하는 카운터/히스토그램/타이머를 모아 둡니다.
+
+    - increment(name, value, **labels): 누적 카운터 (요청 수, 전송 바이트, 상태 코드별 응답 수 등)
+    - observe(name, value, **labels): 히스토그램 (요청 지연 시간 등)
+    - timer(name, **labels): with 블록의 실행 시간(초)을 히스토그램에 기록
+    - track_stage(stage, **labels): 단계 실행 시간과 처리한 항목 수를 함께 기록 (단계별 초당 처리량 계산용)
+
+    snapshot()/to_prometheus()로 내보내고, write()로 JSON 또는 Prometheus 텍스트 파일에 기록합니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self.started_at = time.time()
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def increment(self, name, value=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, buckets=None, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = Histogram(buckets or METRICS_LATENCY_BUCKETS)
+                self._histograms[key] = histogram
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    @contextmanager
+    def track_stage(self, stage, **labels):
+        """
+        with 블록을 단계 하나의 실행으로 기록합니다. 블록 안에서 tracker.add(n)으로 처리한 항목 수를 알려 줍니다.
+        """
+        tracker = _StageTracker()
+        started = time.perf_counter()
+        try:
+            yield tracker
+        finally:
+            self.record_stage(stage, time.perf_counter() - started, tracker.items, **labels)
+
+    def record_stage(self, stage, seconds, items=0, **labels):
+        """
+        이미 측정한 단계 실행 시간과 처리 항목 수를 기록합니다.
+        """
+        self.observe(STAGE_SECONDS, seconds, stage=stage, **labels)
+        if items:
+            self.increment(STAGE_ITEMS, items, stage=stage, **labels)
+
+    def reset(self):
+        with self._lock:
+            self._counters = {}
+            self._histograms = {}
+            self.started_at = time.time()
+
+    def stage_summary(self):
+        """
+        단계(와 플랫폼)별 실행 횟수, 누적 실행 시간, 처리 항목 수, 초당 처리 항목 수를 반환합니다.
+        파이프라인 단계는 동시에 실행되므로, 누적 시간이 가장 긴 단계가 병목입니다.
+        """
+        with self._lock:
+            stages = [(dict(labels), histogram.count, histogram.sum)
+                      for (name, labels), histogram in self._histograms.items() if name == STAGE_SECONDS]
+            items = {labels: value for (name, labels), value in self._counters.items() if name == STAGE_ITEMS}
+        summary = []
+        for labels, runs, seconds in stages:
+            item_count = items.get(tuple(sorted(labels.items())), 0)
+            summary.append({
+                **labels,
+                "runs": runs,
+                "seconds": seconds,
+                "items": item_count,
+                "items_per_second": item_count / seconds if seconds > 0 else None,
+            })
+        return sorted(summary, key=lambda row: -row["seconds"])
+
+    def snapshot(self):
+        with self._lock:
+            counters = [{"name": name, "labels": dict(labels), "value": value}
+                        for (name, labels), value in sorted(self._counters.items())]
+            histograms = [{"name": name, "labels": dict(labels), **histogram.to_dict()}
+                          for (name, labels), histogram in sorted(self._histograms.items(), key=lambda entry: entry[0])]
+        return {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "uptime_seconds": time.time() - self.started_at,
+            "counters": counters,
+            "histograms": histograms,
+            "stages": self.stage_summary(),
+        }
+
+    def to_prometheus(self):
+        """
+        Prometheus 텍스트 형식(node_exporter textfile collector가 읽는 형식)으로 변환합니다.
+        """
+        def format_labels(labels, extra=()):
+            pairs = [*labels, *extra]
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in pairs) + "}"
+
+        lines = []
+        typed = set()
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {name} counter")
+                    typed.add(name)
+                lines.append(f"{name}{format_labels(labels)} {value}")
+            for (name, labels), histogram in sorted(self._histograms.items(), key=lambda entry: entry[0]):
+                if name not in typed:
+                    lines.append(f"# TYPE {name} histogram")
+                    typed.add(name)
+                cumulative = 0
+                for bound, bucket_count in zip([*histogram.bounds, "+Inf"], histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f"{name}_bucket{format_labels(labels, [('le', bound)])} {cumulative}")
+                lines.append(f"{name}_sum{format_labels(labels)} {histogram.sum}")
+                lines.append(f"{name}_count{format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """
+        지표를 파일에 기록합니다. 확장자가 .prom이면 Prometheus 텍스트, 그 외에는 JSON으로 기록합니다.
+        수집기가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 이름을 바꿉니다.
+        """
+        output_dir = os.path.dirname(path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
+        if path.endswith(".prom"):
+            content = self.to_prometheus()
+        else:
+            content = json.dumps(self.snapshot(), ensure_ascii=False, indent=2, default=str)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+        return path
+
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics():
+    """
+    프로세스 전체에서 공유하는 MetricsRegistry를 반환합니다.
+    """
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = MetricsRegistry()
+        return _metrics
@@ -0,0 +1,119 @@
+# common_utils/rate_limiter.py
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+# 서버가 요청을 제한하고 있다는 신호로 간주할 상태 코드
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value):
+    """
+    Retry-After 헤더 값(초 또는 HTTP 날짜)을 대기 시간(초)으로 변환합니다. 해석할 수 없으면 None.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveRateLimiter:
+    """
+    호스트 하나에 대한 토큰 버킷 요청 제한기입니다.
+
+    요청이 정상적으로 처리되는 동안에는 increase_interval초마다 초당 요청 수를 additive_increase만큼 올리고,
+    429/503 응답이나 타임아웃을 받으면 multiplicative_decrease배로 줄입니다(AIMD).
+    Retry-After 헤더가 있으면 그 시간 동안은 토큰을 발급하지 않습니다.
+    여러 스레드가 동시에 사용해도 안전합니다.
+    """
+    def __init__(self, initial_rate=2.0, min_rate=0.5, max_rate=20.0, additive_increase=0.5,
+                 multiplicative_decrease=0.5, burst=1, increase_interval=1.0):
+        self.rate = float(initial_rate)
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate)
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+        self.burst = max(1, burst)
+        self.increase_interval = increase_interval
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._last_increase = self._last_refill
+        self._blocked_until = 0.0
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def acquire(self):
+        """
+        토큰 하나를 얻을 때까지 대기합니다.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def record_success(self):
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_increase >= self.increase_interval:
+                self._refill(now)
+                self.rate = min(self.max_rate, self.rate + self.additive_increase)
+                self._last_increase = now
+
+    def record_throttle(self, retry_after=None):
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.multiplicative_decrease)
+            self._tokens = min(self._tokens, 0.0)
+            self._last_increase = now
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def record_response(self, status_code, headers=None):
+        """
+        응답 상태 코드와 헤더를 보고 요청 속도를 조정합니다.
+        """
+        retry_after = parse_retry_after((headers or {}).get("Retry-After"))
+        if status_code in THROTTLE_STATUS_CODES or retry_after:
+            self.record_throttle(retry_after)
+        elif status_code < 500:
+            self.record_success()
+
+
+# 프로세스 전체에서 호스트별로 하나의 제한기를 공유
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(host, config=None):
+    """
+    호스트에 대한 공유 AdaptiveRateLimiter를 반환합니다. 처음 요청될 때 config로 생성됩니다.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(**(config or {}))
+            _limiters[host] = limiter
+        return limiter
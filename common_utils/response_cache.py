@@ -0,0 +1,188 @@
+# common_utils/response_cache.py
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from platform_configs.general_config import HTTP_CACHE_PATH, HTTP_CACHE_TTL_SECONDS, HTTP_CACHE_MAX_BYTES
+
+# 캐시에 보관할 응답 헤더 (본문은 이미 디코딩된 상태로 저장하므로 Content-Encoding/Length는 제외)
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control", "Date")
+# 캐시에 저장할 상태 코드
+_CACHEABLE_STATUS_CODES = (200, 204)
+
+
+def _canonicalize(value):
+    """
+    딕셔너리 키 순서와 관계없이 같은 요청이면 같은 문자열이 되도록 정규화합니다.
+    """
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+class ResponseCache:
+    """
+    SQLite 파일에 HTTP 응답을 저장하는 디스크 캐시입니다.
+
+    - 키: 메서드 + URL + 정규화된 params / JSON 본문
+    - ttl초 이내의 응답은 네트워크 없이 바로 반환
+    - 만료된 응답에 ETag/Last-Modified가 있으면 조건부 요청으로 재검증 (304면 저장된 본문 재사용)
+    - 전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 삭제 (LRU)
+    """
+    def __init__(self, db_path=HTTP_CACHE_PATH, ttl=HTTP_CACHE_TTL_SECONDS, max_bytes=HTTP_CACHE_MAX_BYTES):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                cache_key TEXT PRIMARY KEY,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)")
+        self._conn.commit()
+        self._stats = {"hits": 0, "misses": 0, "revalidated": 0, "stores": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(method, url, params=None, json_data=None):
+        raw = "\n".join([method.upper(), url, _canonicalize(params), _canonicalize(json_data)])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def get(self, cache_key):
+        """
+        저장된 항목을 dict로 반환합니다. 없으면 None. 'fresh' 값으로 TTL 만료 여부를 알 수 있습니다.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_code, headers, body, stored_at FROM responses WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE cache_key = ?", (time.time(), cache_key))
+            self._conn.commit()
+        status_code, headers, body, stored_at = row
+        return {
+            "status_code": status_code,
+            "headers": json.loads(headers),
+            "body": body,
+            "stored_at": stored_at,
+            "fresh": time.time() - stored_at < self.ttl,
+        }
+
+    def put(self, cache_key, response):
+        if response.status_code not in _CACHEABLE_STATUS_CODES:
+            return
+        headers = {name: response.headers[name] for name in _STORED_HEADERS if name in response.headers}
+        body = response.content or b""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (cache_key, response.status_code, json.dumps(headers), body, len(body), now, now)
+            )
+            self._evict_locked()
+            self._conn.commit()
+            self._stats["stores"] += 1
+
+    def refresh(self, cache_key):
+        """
+        304 응답으로 재검증된 항목의 저장 시각을 갱신합니다.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, last_access = ? WHERE cache_key = ?", (now, now, cache_key)
+            )
+            self._conn.commit()
+
+    def _evict_locked(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT cache_key, size FROM responses ORDER BY last_access ASC").fetchall()
+        for cache_key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE cache_key = ?", (cache_key,))
+            total -= size
+            self._stats["evictions"] += 1
+
+    def conditional_headers(self, entry):
+        """
+        재검증 요청에 붙일 If-None-Match / If-Modified-Since 헤더를 만듭니다.
+        """
+        headers = {}
+        if entry["headers"].get("ETag"):
+            headers["If-None-Match"] = entry["headers"]["ETag"]
+        if entry["headers"].get("Last-Modified"):
+            headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+        return headers
+
+    @staticmethod
+    def build_response(entry, url):
+        """
+        저장된 항목으로 requests.Response 객체를 만들어 기존 응답 처리 코드를 그대로 쓸 수 있게 합니다.
+        """
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["body"]
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = url
+        response.reason = "OK"
+        response.from_cache = True
+        return response
+
+    def record_hit(self):
+        self._count("hits")
+
+    def record_miss(self):
+        self._count("misses")
+
+    def record_revalidated(self):
+        self._count("revalidated")
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            row = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        lookups = stats["hits"] + stats["revalidated"] + stats["misses"]
+        stats["entries"], stats["bytes"] = row
+        stats["hit_ratio"] = (stats["hits"] + stats["revalidated"]) / lookups if lookups else 0.0
+        return stats
+
+
+# 프로세스 전체에서 하나의 캐시 인스턴스를 공유
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ResponseCache()
+        return _shared_cache
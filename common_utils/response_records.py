@@ -0,0 +1,164 @@
+# common_utils/response_records.py
+"""
+API 응답에서 변환에 쓰는 필드만 꺼내 담는 __slots__ 레코드와 응답 디코더입니다.
+
+응답 전체를 중첩 딕셔너리로 들고 다니면 매물마다 쓰지 않는 필드(설명, 태그, 이미지 메타데이터 등)까지
+메모리에 남고, 변환기는 매물마다 .get 조회를 수십 번 반복합니다. 디코더는 응답을 받은 자리에서
+필요한 필드만 고정된 순서의 레코드로 옮기고 원래 딕셔너리는 바로 버리므로, 청크가 파이프라인 큐에
+머무는 동안의 메모리가 줄고 변환기는 속성 값을 튜플로 한 번에 꺼내기만 하면 됩니다.
+
+orjson이 설치되어 있으면 JSON 파싱에 사용하고, 없으면 표준 json 모듈을 사용합니다.
+"""
+import json
+from operator import attrgetter
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json 모듈로 파싱
+    orjson = None
+
+
+def loads(body):
+    """
+    응답 본문(bytes 또는 str)을 파싱합니다. 형식 오류는 두 경우 모두 json.JSONDecodeError로 발생합니다.
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+class _SlotsRecord:
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # 매물마다 호출되므로 setattr 반복 대신 필드를 직접 대입하는 __init__을 만들어 둠 (namedtuple과 같은 방식)
+        arguments = ", ".join(cls.__slots__)
+        assignments = "\n".join(f"    self.{name} = {name}" for name in cls.__slots__)
+        namespace = {}
+        exec(f"def __init__(self, {arguments}):\n{assignments}\n", namespace)
+        cls.__init__ = namespace["__init__"]
+
+    def get(self, name, default=None):
+        # 딕셔너리를 받던 코드(room.get('id') 등)가 레코드도 그대로 다룰 수 있도록 제공
+        return getattr(self, name, default)
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        return type(other) is type(self) and all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+
+class ZigbangItem(_SlotsRecord):
+    """
+    직방 상세 정보(/v3/items/list) 매물 하나. 필드 순서는 ZIGBANG_DATAFRAME_COLUMNS와 같습니다.
+    여러 이름으로 올 수 있는 필드(title/item_title 등)는 디코딩할 때 하나로 정리합니다.
+    """
+    __slots__ = (
+        "item_id", "title", "address", "sales_type", "deposit", "rent", "sales_price",
+        "room_type", "floor", "area_m2", "lat", "lng", "building_name", "image_urls",
+    )
+
+    @classmethod
+    def from_dict(cls, item):
+        return cls(*zigbang_item_fields(item))
+
+
+class DabangRoom(_SlotsRecord):
+    """
+    다방 목록 응답의 room 하나. 필드 이름은 API 필드 이름 그대로이며, 순서는 다방 변환기의 컬럼 순서와 같습니다.
+    to_dict() 결과를 from_dict()로 다시 읽을 수 있어 체크포인트/샤드 큐에 JSON으로 저장했다가 되살릴 수 있습니다.
+    """
+    __slots__ = (
+        "id", "room_type_text", "building_type", "dealType", "deposit", "rent", "price",
+        "address_road", "address_jibun", "lat", "lng", "floor_string", "size_m2",
+    )
+
+    @classmethod
+    def from_dict(cls, room):
+        return cls(*dabang_room_fields(room))
+
+
+# 레코드의 필드 값을 변환기의 컬럼 순서대로 한 번에 꺼내는 함수
+zigbang_item_row = attrgetter(*ZigbangItem.__slots__)
+dabang_room_row = attrgetter(*DabangRoom.__slots__)
+
+
+def zigbang_item_fields(item):
+    """
+    직방 상세 정보 딕셔너리에서 ZigbangItem 필드 순서의 튜플을 만듭니다.
+    """
+    get = item.get
+    sales_type_info = get('sales_type_info') or {}
+    address1 = get('address1')
+    address2 = get('address2')
+    return (
+        get('item_id'),
+        get('title') or get('item_title'),
+        f"{address1} {address2}".strip() if address1 or address2 else "",
+        sales_type_info.get('sales_type_text') or get('sales_type'),
+        sales_type_info.get('deposit') or get('deposit'),
+        sales_type_info.get('rent') or get('rent'),
+        get('sales_price'),
+        get('item_type_summary') or get('room_type'),
+        get('floor_text') or get('floor'),
+        get('space_m2') or get('size_m2'),
+        get('lat'),
+        get('lng'),
+        get('building_name'),
+        # 여러 이미지 URL을 콤마로 구분
+        ", ".join([img.get('url') for img in get('images', []) if img.get('url')]),
+    )
+
+
+def dabang_room_fields(room):
+    """
+    다방 room 딕셔너리에서 DabangRoom 필드 순서의 튜플을 만듭니다.
+    """
+    return tuple(map(room.get, DabangRoom.__slots__))
+
+
+def record_to_json(value):
+    """
+    json.dumps(default=...)용 함수. 레코드는 딕셔너리로 바꿔 저장합니다.
+    """
+    if isinstance(value, _SlotsRecord):
+        return value.to_dict()
+    raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serializable")
+
+
+def decode_zigbang_search(body):
+    """
+    /v2/search 응답에서 매물 ID만 꺼내 {"items": [{"itemIds": [...]}]} 형태로 반환합니다.
+    """
+    data = loads(body)
+    item_ids = []
+    for item_group in (data.get('items') or []) if isinstance(data, dict) else []:
+        item_ids.extend(item_group.get('itemIds') or [])
+    return {"items": [{"itemIds": item_ids}] if item_ids else []}
+
+
+def decode_zigbang_item_list(body):
+    """
+    /v3/items/list 응답을 {"items": [ZigbangItem, ...]} 형태로 반환합니다.
+    """
+    data = loads(body)
+    items = (data.get('items') or []) if isinstance(data, dict) else []
+    return {"items": [ZigbangItem(*zigbang_item_fields(item)) for item in items]}
+
+
+def decode_dabang_rooms(body):
+    """
+    다방 목록 응답을 {"rooms": [DabangRoom, ...], 페이지 정보...} 형태로 반환합니다.
+    """
+    data = loads(body)
+    if not isinstance(data, dict):
+        return {"rooms": []}
+    decoded = {key: data[key] for key in ('last_page', 'total_page', 'totalPage') if key in data}
+    decoded["rooms"] = [DabangRoom(*map(room.get, DabangRoom.__slots__)) for room in data.get('rooms') or []]
+    return decoded
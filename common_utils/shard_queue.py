@@ -0,0 +1,380 @@
+# common_utils/shard_queue.py
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+
+from common_utils.response_records import record_to_json
+from platform_configs.general_config import (
+    SHARD_QUEUE_PATH, SHARD_LEASE_SECONDS, SHARD_MAX_ATTEMPTS, SHARD_POLL_INTERVAL
+)
+
+
+def make_worker_id():
+    """
+    여러 머신/프로세스에서 겹치지 않는 작업자 ID를 만듭니다. (호스트명-PID-난수)
+    """
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+class ShardWorkQueue:
+    """
+    여러 작업자 프로세스(다른 머신 포함)가 함께 사용하는 SQLite 기반의 내구성 있는 작업 큐입니다.
+
+    - 작업(job) 하나는 여러 샤드(shard)로 나뉩니다. 샤드는 수집 단계(kind)와 묶음(group_key)을 가집니다.
+    - 작업자는 lease()로 샤드를 빌려 가고, 처리하는 동안 heartbeat()로 임대 기한을 연장합니다.
+    - 작업자가 죽어 임대 기한이 지나면 다른 작업자가 같은 샤드를 다시 가져갑니다.
+    - 처리 결과(매물 ID, 지문, 필요 시 원본 데이터)는 complete()와 같은 트랜잭션으로 저장되며,
+      (묶음, 단계, 매물 ID) 기본 키로 저장되므로 겹치는 샤드의 결과는 자동으로 중복 제거됩니다.
+
+    여러 머신에서 사용할 때는 모든 작업자가 같은 DB 파일(공유 파일 시스템)을 바라보도록 db_path를 지정합니다.
+    """
+    def __init__(self, db_path=SHARD_QUEUE_PATH, lease_seconds=SHARD_LEASE_SECONDS, max_attempts=SHARD_MAX_ATTEMPTS):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # 트랜잭션을 직접 제어하기 위해 autocommit 모드(isolation_level=None)로 연결
+        self._conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                finished_at REAL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS shards (
+                job_id TEXT NOT NULL,
+                shard_key TEXT NOT NULL,
+                group_key TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                state TEXT NOT NULL DEFAULT 'pending',
+                owner TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                PRIMARY KEY (job_id, shard_key)
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_shards_state ON shards (job_id, state)")
+        # listing_id는 타입을 지정하지 않아 API가 준 값(정수/문자열)을 그대로 저장
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS shard_results (
+                job_id TEXT NOT NULL,
+                group_key TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                listing_id NOT NULL,
+                fingerprint TEXT,
+                data TEXT,
+                PRIMARY KEY (job_id, group_key, kind, listing_id)
+            )
+            """
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def create_job(self, job_id):
+        """
+        작업을 등록합니다. 같은 job_id로 다시 실행하면 남은 샤드부터 이어서 처리합니다.
+        """
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO jobs (job_id, state, created_at) VALUES (?, 'running', ?)
+                ON CONFLICT (job_id) DO UPDATE SET state = 'running', finished_at = NULL
+                """,
+                (job_id, time.time()),
+            )
+
+    def finish_job(self, job_id):
+        """
+        작업을 끝난 것으로 표시합니다. 새 샤드를 기다리던 작업자들은 이 표시를 보고 종료합니다.
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET state = 'finished', finished_at = ? WHERE job_id = ?", (time.time(), job_id)
+            )
+
+    def is_job_finished(self, job_id):
+        with self._lock:
+            row = self._conn.execute("SELECT state FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return row is not None and row[0] == "finished"
+
+    def enqueue(self, job_id, shards):
+        """
+        샤드들을 큐에 넣습니다. shards: {"shard_key", "group_key", "kind", "payload"} 딕셔너리들
+        같은 shard_key는 한 번만 들어가므로 조정자(coordinator)가 다시 실행되어도 안전합니다.
+        """
+        rows = [
+            (job_id, shard["shard_key"], shard["group_key"], shard["kind"], json.dumps(shard["payload"], ensure_ascii=False))
+            for shard in shards
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO shards (job_id, shard_key, group_key, kind, payload) VALUES (?, ?, ?, ?, ?)", rows
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def lease(self, job_id, worker_id):
+        """
+        대기 중이거나 임대 기한이 지난 샤드 하나를 빌려 옵니다. 없으면 None을 반환합니다.
+        BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡으므로 두 작업자가 같은 샤드를 동시에 가져가지 않습니다.
+        임대 기한이 지났는데 이미 max_attempts번 시도한 샤드(처리하던 작업자가 매번 죽은 경우)는 다시 빌려 주지 않고 실패로 표시합니다.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    """
+                    UPDATE shards SET state = 'failed', owner = NULL, lease_expires = NULL,
+                        last_error = 'lease expired after ' || attempts || ' attempts'
+                    WHERE job_id = ? AND state = 'leased' AND lease_expires < ? AND attempts >= ?
+                    """,
+                    (job_id, now, self.max_attempts),
+                )
+                row = self._conn.execute(
+                    """
+                    SELECT shard_key, group_key, kind, payload, attempts FROM shards
+                    WHERE job_id = ? AND (state = 'pending' OR (state = 'leased' AND lease_expires < ?))
+                    ORDER BY attempts, rowid LIMIT 1
+                    """,
+                    (job_id, now),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                self._conn.execute(
+                    """
+                    UPDATE shards SET state = 'leased', owner = ?, lease_expires = ?, attempts = attempts + 1
+                    WHERE job_id = ? AND shard_key = ?
+                    """,
+                    (worker_id, now + self.lease_seconds, job_id, row[0]),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return {
+            "job_id": job_id,
+            "shard_key": row[0],
+            "group_key": row[1],
+            "kind": row[2],
+            "payload": json.loads(row[3]),
+            "attempt": row[4] + 1,
+        }
+
+    def heartbeat(self, job_id, shard_key, worker_id):
+        """
+        임대 기한을 연장합니다. 이미 다른 작업자에게 넘어간 샤드면 False를 반환합니다.
+        """
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE shards SET lease_expires = ? WHERE job_id = ? AND shard_key = ? AND owner = ? AND state = 'leased'",
+                (time.time() + self.lease_seconds, job_id, shard_key, worker_id),
+            )
+        return cur.rowcount == 1
+
+    def complete(self, job_id, shard, worker_id, results=()):
+        """
+        샤드를 완료로 표시하고 결과를 같은 트랜잭션으로 저장합니다.
+        results: (매물 ID, 지문 또는 None, JSON으로 저장할 데이터 또는 None) 튜플들
+
+        임대를 잃은 경우(기한이 지나 다른 작업자가 가져감) 결과를 버리고 False를 반환합니다.
+        """
+        rows = [
+            (job_id, shard["group_key"], shard["kind"], listing_id, fingerprint,
+             json.dumps(data, ensure_ascii=False, default=record_to_json) if data is not None else None)
+            for listing_id, fingerprint, data in results
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cur = self._conn.execute(
+                    """
+                    UPDATE shards SET state = 'done', lease_expires = NULL, last_error = NULL
+                    WHERE job_id = ? AND shard_key = ? AND owner = ? AND state = 'leased'
+                    """,
+                    (job_id, shard["shard_key"], worker_id),
+                )
+                if cur.rowcount != 1:
+                    self._conn.execute("ROLLBACK")
+                    return False
+                self._conn.executemany("INSERT OR REPLACE INTO shard_results VALUES (?, ?, ?, ?, ?, ?)", rows)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return True
+
+    def fail(self, job_id, shard, worker_id, error):
+        """
+        샤드 처리 실패를 기록합니다. 시도 횟수가 max_attempts보다 적으면 다시 대기 상태로 돌립니다.
+        """
+        with self._lock:
+            self._conn.execute(
+                """
+                UPDATE shards SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    owner = NULL, lease_expires = NULL, last_error = ?
+                WHERE job_id = ? AND shard_key = ? AND owner = ?
+                """,
+                (self.max_attempts, str(error)[:1000], job_id, shard["shard_key"], worker_id),
+            )
+
+    def progress(self, job_id, kind=None, group_key=None):
+        """
+        샤드 상태별 개수를 {"pending": n, "leased": n, "done": n, "failed": n}로 반환합니다.
+        """
+        query = "SELECT state, COUNT(*) FROM shards WHERE job_id = ?"
+        params = [job_id]
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        if group_key:
+            query += " AND group_key = ?"
+            params.append(group_key)
+        with self._lock:
+            rows = self._conn.execute(query + " GROUP BY state", params).fetchall()
+        counts = {"pending": 0, "leased": 0, "done": 0, "failed": 0}
+        counts.update(dict(rows))
+        return counts
+
+    def has_live_lease(self, job_id, kind):
+        """
+        임대 기한이 남은 샤드가 있으면(어느 작업자든 처리 중이면) True를 반환합니다.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM shards WHERE job_id = ? AND kind = ? AND state = 'leased' AND lease_expires >= ? LIMIT 1",
+                (job_id, kind, time.time()),
+            ).fetchone()
+        return row is not None
+
+    def fail_unfinished(self, job_id, kind, error):
+        """
+        한 단계의 남은 샤드(대기 중이거나 임대 기한이 지난 샤드)를 모두 실패로 표시하고 그 개수를 반환합니다.
+        처리할 작업자가 더 이상 없을 때 조정자가 단계를 끝내는 데 사용합니다.
+        """
+        with self._lock:
+            cur = self._conn.execute(
+                """
+                UPDATE shards SET state = 'failed', owner = NULL, lease_expires = NULL, last_error = ?
+                WHERE job_id = ? AND kind = ? AND (state = 'pending' OR (state = 'leased' AND lease_expires < ?))
+                """,
+                (str(error)[:1000], job_id, kind, time.time()),
+            )
+        return cur.rowcount
+
+    def is_phase_done(self, job_id, kind):
+        counts = self.progress(job_id, kind)
+        return counts["pending"] == 0 and counts["leased"] == 0
+
+    def results(self, job_id, group_key, kind):
+        """
+        한 묶음/단계의 결과를 모든 샤드에 걸쳐 합쳐서(중복 제거된 상태로) {매물 ID: (지문, 데이터)}로 반환합니다.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT listing_id, fingerprint, data FROM shard_results WHERE job_id = ? AND group_key = ? AND kind = ?",
+                (job_id, group_key, kind),
+            ).fetchall()
+        return {
+            listing_id: (fingerprint, json.loads(data) if data is not None else None)
+            for listing_id, fingerprint, data in rows
+        }
+
+    def group_keys(self, job_id, kind):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT group_key FROM shards WHERE job_id = ? AND kind = ?", (job_id, kind)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+
+class LeaseHeartbeat:
+    """
+    샤드를 처리하는 동안 백그라운드 스레드에서 주기적으로 heartbeat를 보내는 컨텍스트 매니저입니다.
+    임대를 잃으면 lost가 True가 됩니다.
+    """
+    def __init__(self, queue, shard, worker_id, interval=None):
+        self.queue = queue
+        self.shard = shard
+        self.worker_id = worker_id
+        self.interval = interval or max(1.0, queue.lease_seconds / 3)
+        self.lost = False
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def _beat(self):
+        while not self._stop_event.wait(self.interval):
+            if not self.queue.heartbeat(self.shard["job_id"], self.shard["shard_key"], self.worker_id):
+                self.lost = True
+                return
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._beat, name="shard-heartbeat", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop_event.set()
+        self._thread.join()
+        return False
+
+
+def run_shard_worker(queue, job_id, handler, logger, worker_id=None, poll_interval=SHARD_POLL_INTERVAL):
+    """
+    작업이 끝날 때까지 샤드를 빌려 handler(shard)로 처리하고 결과를 저장하는 작업자 루프입니다.
+    handler는 (매물 ID, 지문, 데이터) 튜플들을 반환해야 합니다.
+    처리한 샤드 수를 반환합니다.
+    """
+    worker_id = worker_id or make_worker_id()
+    processed = 0
+    while True:
+        shard = queue.lease(job_id, worker_id)
+        if shard is None:
+            if queue.is_job_finished(job_id):
+                break
+            time.sleep(poll_interval)
+            continue
+
+        logger.debug(f"Worker {worker_id} leased shard {shard['shard_key']} (attempt {shard['attempt']})")
+        try:
+            with LeaseHeartbeat(queue, shard, worker_id):
+                results = list(handler(shard))
+        except Exception as e:
+            logger.error(f"Worker {worker_id} failed on shard {shard['shard_key']}: {e}", exc_info=True)
+            queue.fail(job_id, shard, worker_id, e)
+            continue
+
+        if queue.complete(job_id, shard, worker_id, results):
+            processed += 1
+        else:
+            logger.warning(f"Worker {worker_id} lost the lease on shard {shard['shard_key']}; its results were discarded.")
+
+    logger.info(f"Worker {worker_id} finished job {job_id} after processing {processed} shards.")
+    return processed
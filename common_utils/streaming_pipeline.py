@@ -0,0 +1,110 @@
+# common_utils/streaming_pipeline.py
+import queue
+import threading
+
+# 단계 사이 큐에서 데이터의 끝을 알리는 표시
+_END = object()
+
+
+class StreamingPipeline:
+    """
+    source(제너레이터) → stage1 → stage2 → ... 순서로 데이터를 한 덩어리(청크)씩 흘려보내는 파이프라인입니다.
+
+    각 단계는 별도 스레드에서 실행되고, 단계 사이는 크기가 queue_size인 큐로 연결됩니다.
+    뒷 단계가 느려 큐가 가득 차면 앞 단계는 자리가 날 때까지 기다리므로(backpressure),
+    전체 데이터 양과 관계없이 메모리에는 (단계 수 x queue_size)개 정도의 청크만 머무릅니다.
+
+    단계 함수가 None을 반환하면 그 청크는 다음 단계로 넘기지 않습니다.
+    어느 단계에서든 예외가 발생하면 파이프라인을 멈추고 run()에서 같은 예외를 다시 발생시킵니다.
+    """
+    def __init__(self, stages, queue_size=2, logger=None):
+        self.stages = list(stages)
+        self.queue_size = queue_size
+        self.logger = logger
+        self._stop = threading.Event()
+        self._errors = []
+
+    def _put(self, target_queue, value):
+        # 멈춤 신호를 확인하며 대기해야 뒷 단계가 실패했을 때 앞 단계가 영원히 막히지 않음
+        while not self._stop.is_set():
+            try:
+                target_queue.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source_queue):
+        while not self._stop.is_set():
+            try:
+                return source_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _END
+
+    def _fail(self, name, error):
+        if self.logger:
+            self.logger.error(f"Pipeline stage '{name}' failed: {error}")
+        self._errors.append(error)
+        self._stop.set()
+
+    def _produce(self, source, output_queue):
+        try:
+            for chunk in source:
+                if not self._put(output_queue, chunk):
+                    break
+        except Exception as e:
+            self._fail("source", e)
+        finally:
+            close = getattr(source, "close", None)
+            if close:
+                close()
+            self._put(output_queue, _END)
+
+    def _run_stage(self, stage, input_queue, output_queue):
+        name = getattr(stage, "__name__", repr(stage))
+        try:
+            while True:
+                chunk = self._get(input_queue)
+                if chunk is _END:
+                    break
+                result = stage(chunk)
+                if result is not None and output_queue is not None:
+                    if not self._put(output_queue, result):
+                        break
+        except Exception as e:
+            self._fail(name, e)
+        finally:
+            if output_queue is not None:
+                self._put(output_queue, _END)
+
+    def run(self, source):
+        """
+        source가 끝날 때까지 파이프라인을 실행합니다. 처리된 청크 수(마지막 단계 기준)를 반환합니다.
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        processed = {"count": 0}
+        last_stage = self.stages[-1]
+
+        def counting_last_stage(chunk):
+            last_stage(chunk)
+            processed["count"] += 1
+        counting_last_stage.__name__ = getattr(last_stage, "__name__", "sink")
+
+        stage_functions = self.stages[:-1] + [counting_last_stage]
+        threads = [threading.Thread(target=self._produce, args=(source, queues[0]), name="pipeline-source", daemon=True)]
+        for index, stage in enumerate(stage_functions):
+            output_queue = queues[index + 1] if index + 1 < len(queues) else None
+            threads.append(threading.Thread(
+                target=self._run_stage, args=(stage, queues[index], output_queue),
+                name=f"pipeline-{getattr(stage, '__name__', index)}", daemon=True
+            ))
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if self._errors:
+            raise self._errors[0]
+        return processed["count"]
@@ -0,0 +1,99 @@
+# crawler_cli.py
+"""
+매물 수집 명령줄 진입점입니다.
+
+수집 범위(BBOX/지역), 플랫폼, 매물 유형, 저장 형식을 인자로 받아 MainContainer로 수집합니다.
+MainContainer와 플랫폼 모듈은 인자를 확인한 뒤에 import하므로 --help/--list-platforms는 바로 끝나고,
+선택하지 않은 플랫폼의 모듈은 수집 중에도 읽지 않습니다.
+
+실행: python crawler_cli.py --bbox 37.493 37.527 127.025 127.065 --platforms zigbang --item-types villa apt
+"""
+import argparse
+import sys
+
+from platform_configs.general_config import (
+    CRAWL_REGIONS, CRAWL_PLATFORMS, INCREMENTAL_CRAWL, DEFAULT_OUTPUT_FORMAT, SHARD_WORKER_PROCESSES, SHARD_QUEUE_PATH
+)
+from platform_registry import available_platforms, get_platform
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Zigbang/Dabang listing crawler")
+    parser.add_argument("--bbox", type=float, nargs=4, metavar=("LAT_MIN", "LAT_MAX", "LNG_MIN", "LNG_MAX"),
+                        help="수집할 범위. 지정하지 않으면 설정 파일의 CRAWL_REGIONS를 수집")
+    parser.add_argument("--region", help="--bbox와 함께 쓰면 저장 파일 이름에 붙일 지역 이름, 단독으로 쓰면 CRAWL_REGIONS에서 고를 지역")
+    parser.add_argument("--platforms", nargs="+", choices=available_platforms(), default=CRAWL_PLATFORMS)
+    parser.add_argument("--item-types", nargs="+", help="매물 유형 (지정하지 않으면 플랫폼별 기본 유형)")
+    parser.add_argument("--output-format", choices=["parquet", "csv"], default=DEFAULT_OUTPUT_FORMAT)
+    parser.add_argument("--resume", action="store_true", help="중단된 이전 수집을 체크포인트부터 이어서 실행")
+    parser.add_argument("--full", action="store_true", help="증분 수집을 끄고 모든 매물의 상세 정보를 다시 받음")
+    parser.add_argument("--sharded", action="store_true", help="Geohash 샤드로 나눠 작업자 프로세스에서 수집")
+    parser.add_argument("--workers", type=int, default=SHARD_WORKER_PROCESSES, help="--sharded일 때 로컬 작업자 프로세스 수")
+    parser.add_argument("--job-id", help="--sharded일 때 이어서 실행할 샤드 작업 ID")
+    parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="로그 레벨 (기본값은 main_container.py의 LOG_LEVEL)")
+    parser.add_argument("--list-platforms", action="store_true", help="등록된 플랫폼과 매물 유형을 출력하고 종료")
+    return parser
+
+
+def resolve_regions(parser, args):
+    """
+    인자로 수집할 {지역 이름: BBOX}를 만듭니다.
+    """
+    if args.bbox:
+        lat_min, lat_max, lng_min, lng_max = args.bbox
+        if lat_min >= lat_max or lng_min >= lng_max:
+            parser.error("--bbox must be given as LAT_MIN LAT_MAX LNG_MIN LNG_MAX with min < max")
+        return {args.region or "custom": tuple(args.bbox)}
+    if args.region:
+        if args.region not in CRAWL_REGIONS:
+            parser.error(f"unknown region '{args.region}' (configured regions: {', '.join(CRAWL_REGIONS)})")
+        return {args.region: CRAWL_REGIONS[args.region]}
+    return CRAWL_REGIONS
+
+
+def resolve_item_types(parser, args):
+    if not args.item_types:
+        return None
+    supported = {item_type for platform in args.platforms for item_type in (get_platform(platform).item_types or [])}
+    unknown = [item_type for item_type in args.item_types if item_type not in supported]
+    if unknown:
+        parser.error(f"item types {unknown} are not supported by {args.platforms} (supported: {', '.join(sorted(supported)) or 'none'})")
+    return args.item_types
+
+
+def list_platforms():
+    for name in available_platforms():
+        spec = get_platform(name)
+        item_types = ", ".join(spec.item_types) if spec.item_types else f"(all listings as '{spec.all_item_type}')"
+        print(f"{name}: item types {item_types}; default {', '.join(spec.default_item_types)}")
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.list_platforms:
+        list_platforms()
+        return 0
+
+    regions = resolve_regions(parser, args)
+    item_types = resolve_item_types(parser, args)
+
+    # 인자 확인이 끝난 뒤에 수집 모듈을 불러옴
+    from main_container import MainContainer, LOG_LEVEL
+    container = MainContainer(log_level=args.log_level or LOG_LEVEL, output_format=args.output_format)
+    incremental = INCREMENTAL_CRAWL and not args.full
+    if args.sharded:
+        results = container.run_sharded(
+            job_id=args.job_id, workers=args.workers, incremental=incremental, platforms=args.platforms,
+            item_types=item_types, regions=regions, queue_path=SHARD_QUEUE_PATH
+        )
+    else:
+        results = container.run(
+            incremental=incremental, platforms=args.platforms, item_types=item_types, regions=regions, resume=args.resume
+        )
+    # 실패한 작업이 있으면 종료 코드 1
+    return 1 if any(result is None for result in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
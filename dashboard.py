@@ -2,11 +2,13 @@
 import streamlit as st
 import pandas as pd
 import folium
-from streamlit_folium import folium_static
+from streamlit_folium import st_folium
 import matplotlib.pyplot as plt
 import os
 import sys
 import json
+import hashlib
+import time
 from datetime import datetime
 
 # Add project root to path
@@ -15,8 +17,21 @@ if current_dir not in sys.path:
     sys.path.append(current_dir)
 
 # Import project modules
-from main_container import MainContainer, BBOX_LAT_MIN, BBOX_LAT_MAX, BBOX_LNG_MIN, BBOX_LNG_MAX
+from main_container import MainContainer
 from common_utils.logger_setup import setup_logger
+from common_utils.response_cache import get_response_cache
+from common_utils.background_jobs import BackgroundJobRunner
+from common_utils.metrics import get_metrics
+from platform_configs.general_config import (
+    DASHBOARD_CACHE_TTL_SECONDS, DASHBOARD_POLL_SECONDS, BBOX_LAT_MIN, BBOX_LAT_MAX, BBOX_LNG_MIN, BBOX_LNG_MAX,
+    HTTP_CACHE_ENABLED
+)
+from platform_registry import available_platforms
+from platform_data_processors.parquet_store import read_listings_in_bbox, is_parquet_available
+from platform_data_processors.listing_store import SpatialListingStore
+from platform_data_processors.listing_aggregation import (
+    aggregate_listings_by_geohash, geohash_precision_for_zoom, listings_in_view, should_show_markers
+)
 
 # Setup logger
 logger = setup_logger("StreamlitDashboard", log_level="INFO", log_file="logs/dashboard.log")
@@ -52,7 +67,7 @@ with col2:
 # Platform selection
 platforms = st.sidebar.multiselect(
     "Select Platforms",
-    ["Zigbang", "Dabang"],
+    [platform.capitalize() for platform in available_platforms()],
     default=["Zigbang"]
 )
 
@@ -63,49 +78,116 @@ property_types = st.sidebar.multiselect(
     default=["villa"]
 )
 
-# Run crawler button
+# HTTP response cache statistics
+with st.sidebar.expander("HTTP Cache"):
+    if HTTP_CACHE_ENABLED:
+        cache_stats = get_response_cache().stats()
+        st.write(f"Hit ratio: {cache_stats['hit_ratio']:.1%}")
+        st.write(f"Hits / Revalidated / Misses: {cache_stats['hits']} / {cache_stats['revalidated']} / {cache_stats['misses']}")
+        st.write(f"Stored: {cache_stats['entries']} entries ({cache_stats['bytes'] / 1024:.1f} KB)")
+    else:
+        st.write("HTTP response cache is disabled.")
+
+# Cached resources shared by every session of this server process
+@st.cache_resource
+def get_container():
+    # 세션마다 수집기/세션/rate limiter를 새로 만들지 않고 하나를 공유
+    return MainContainer()
+
+
+@st.cache_resource
+def get_job_runner():
+    return BackgroundJobRunner(log_level="INFO", log_file="logs/dashboard.log")
+
+
+@st.cache_resource
+def get_listing_store():
+    return SpatialListingStore()
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL_SECONDS, show_spinner=False)
+def aggregate_area_listings(platform, bbox, view_bbox, precision, price_column, data_version):
+    # 같은 화면/정밀도의 셀 집계는 캐시에서 바로 사용
+    listings = load_area_listings(platform, bbox, ("매물ID", "거래유형", "위도", "경도", price_column), None, data_version)
+    return aggregate_listings_by_geohash(listings_in_view(listings, view_bbox), precision, price_column)
+
+
+@st.cache_data(ttl=DASHBOARD_CACHE_TTL_SECONDS, show_spinner=False)
+def load_area_listings(platform, bbox, columns, crawl_dates, data_version):
+    # 캐시 키는 인자 전체이며, data_version(마지막으로 끝난 수집 작업 시각)이 바뀌면 새로 읽음
+    if crawl_dates:
+        # 수집일을 고르면 그 파티션에 저장된 행을 그대로 보여 줌
+        return read_listings_in_bbox(platform, bbox, columns=list(columns) if columns else None, crawl_dates=list(crawl_dates))
+    # 수집일을 고르지 않으면 현재 매물만 보여 줌: 매물마다 가장 최근에 저장된 행만 남기고 내려간 매물은 뺌
+    listings = read_listings_in_bbox(platform, bbox, columns=list(columns) if columns else None, latest_only=True)
+    if listings.empty:
+        return listings
+    delisted = get_container().listing_index.delisted_ids(platform).contains(listings["매물ID"].tolist())
+    return listings[~delisted].reset_index(drop=True)
+
+
+def make_job_key(bbox, platforms, item_types):
+    return json.dumps({
+        "bbox": [round(value, 6) for value in bbox],
+        "platforms": sorted(platforms),
+        "item_types": sorted(item_types),
+    })
+
+
+def make_job_region(job_key):
+    # 저장 파일 이름에 붙는 지역 이름. 작업 키마다 달라야 동시에 실행되는 CSV 작업이 같은 '.part' 파일에 쓰지 않음
+    return f"dashboard_{hashlib.sha1(job_key.encode('utf-8')).hexdigest()[:12]}"
+
+
+job_runner = get_job_runner()
+selected_bbox = (lat_min, lat_max, lng_min, lng_max)
+job_key = make_job_key(selected_bbox, platforms, property_types)
+
+# Run crawler button: submit the crawl to the background runner instead of blocking the script
 if st.sidebar.button("Run Crawler"):
-    with st.spinner("Running crawler..."):
-        try:
-            # Create MainContainer instance
-            container = MainContainer()
-            
-            # Store results
-            results = {}
-            
-            # Run for selected platforms
-            if "Zigbang" in platforms:
-                for property_type in property_types:
-                    st.info(f"Collecting Zigbang {property_type} data...")
-                    zigbang_item_ids = container.zigbang_collector.collect_item_ids_by_area(
-                        lat_min, lat_max, lng_min, lng_max, item_type=property_type
-                    )
-                    
-                    # Store results
-                    if property_type not in results:
-                        results[property_type] = {}
-                    
-                    results[property_type]["Zigbang"] = {
-                        "item_ids": zigbang_item_ids,
-                        "count": len(zigbang_item_ids)
-                    }
-                    
-                    st.success(f"Found {len(zigbang_item_ids)} Zigbang {property_type} properties")
-            
-            # Save results to session state
-            st.session_state.results = results
-            st.session_state.last_run = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-        except Exception as e:
-            st.error(f"Error running crawler: {str(e)}")
-            logger.error(f"Error running crawler: {str(e)}", exc_info=True)
+    selected_platforms = [platform.lower() for platform in platforms]
+    selected_types = list(property_types)
+    job_region = make_job_region(job_key)
+
+    def crawl(report_progress):
+        results = get_container().run(
+            platforms=selected_platforms,
+            item_types=selected_types,
+            regions={job_region: selected_bbox},
+            progress_callback=report_progress
+        )
+        # 증분 수집에서는 바뀐 매물만 저장되므로 수집된 매물 ID 수를 함께 남기고, 실패한 작업은 failed로 표시
+        return [
+            {"platform": platform, "item_type": item_type, "failed": result is None, **(result or {})}
+            for (platform, item_type, _, _), result in results.items()
+        ]
+
+    st.session_state.job_id = job_runner.submit(
+        job_key, crawl,
+        params={"bbox": selected_bbox, "platforms": selected_platforms, "item_types": selected_types, "region": job_region}
+    )
 
 # Display results
 st.header("Crawler Results")
 
-# Check if results exist in session state
-if hasattr(st.session_state, 'results') and st.session_state.results:
-    st.subheader(f"Last Run: {st.session_state.last_run}")
+current_job = None
+if st.session_state.get("job_id"):
+    current_job = job_runner.get(st.session_state.job_id)
+if current_job is None:
+    current_job = job_runner.latest(job_key=job_key)
+
+job_in_progress = current_job is not None and current_job["state"] in ("queued", "running")
+if job_in_progress:
+    total = current_job["progress_total"] or 1
+    st.progress(current_job["progress_done"] / total, text=f"Crawling... {current_job['message'] or current_job['state']}")
+elif current_job is not None and current_job["state"] == "failed":
+    st.error(f"Error running crawler: {current_job['error']}")
+
+last_finished_job = job_runner.latest(job_key=job_key, state="finished")
+data_version = last_finished_job["finished_at"] if last_finished_job else 0
+
+if last_finished_job and last_finished_job["result"]:
+    st.subheader(f"Last Run: {datetime.fromtimestamp(last_finished_job['finished_at']).strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Create tabs for different visualizations
     tab1, tab2, tab3 = st.tabs(["Summary", "Map View", "Raw Data"])
@@ -113,16 +195,27 @@ if hasattr(st.session_state, 'results') and st.session_state.results:
     with tab1:
         # Summary statistics
         st.subheader("Summary Statistics")
-        
+
+        failed_rows = [row for row in last_finished_job["result"] if row.get("failed")]
+        if failed_rows:
+            st.error("Crawl failed for: " + ", ".join(f"{row['platform']}/{row['item_type']}" for row in failed_rows))
+        incomplete_rows = [row for row in last_finished_job["result"] if not row.get("failed") and not row.get("complete", True)]
+        if incomplete_rows:
+            st.warning(
+                "Some listing requests failed, so these results may be missing listings: "
+                + ", ".join(f"{row['platform']}/{row['item_type']}" for row in incomplete_rows)
+            )
+
         # Create summary dataframe
-        summary_data = []
-        for property_type, platforms_data in st.session_state.results.items():
-            for platform, data in platforms_data.items():
-                summary_data.append({
-                    "Property Type": property_type,
-                    "Platform": platform,
-                    "Count": data["count"]
-                })
+        summary_data = [
+            {
+                "Property Type": row["item_type"],
+                "Platform": "Zigbang" if row["platform"] == "zigbang" else "Dabang",
+                "Count": row["collected"],
+                "Saved This Run": row["saved"]
+            }
+            for row in last_finished_job["result"] if not row.get("failed")
+        ]
         
         if summary_data:
             summary_df = pd.DataFrame(summary_data)
@@ -143,48 +236,158 @@ if hasattr(st.session_state, 'results') and st.session_state.results:
     with tab2:
         # Map visualization
         st.subheader("Map View")
+
+        map_platform = st.selectbox(
+            "Map Platform", sorted({row["platform"] for row in last_finished_job["result"]}), key="map_platform"
+        )
+        price_column = st.selectbox("Price", ["보증금(만원)", "월세(만원)", "매매가(만원)"], key="map_price")
+
+        # 마지막으로 본 지도 화면(줌, 범위)을 기준으로 셀 정밀도와 표시 방식을 정함
+        map_zoom = st.session_state.get("map_zoom", 15)
+        map_view = st.session_state.get("map_view", selected_bbox)
+        center_lat = (map_view[0] + map_view[1]) / 2
+        center_lng = (map_view[2] + map_view[3]) / 2
         
-        # Create a map centered at the middle of the bounding box
-        center_lat = (lat_min + lat_max) / 2
-        center_lng = (lng_min + lng_max) / 2
-        
-        m = folium.Map(location=[center_lat, center_lng], zoom_start=15)
+        m = folium.Map(location=[center_lat, center_lng], zoom_start=map_zoom)
         
         # Add rectangle for the bounding box
         folium.Rectangle(
             bounds=[(lat_min, lng_min), (lat_max, lng_max)],
             color="blue",
-            fill=True,
-            fill_opacity=0.1,
+            fill=False,
             tooltip="Search Area"
         ).add_to(m)
-        
-        # Display the map
-        folium_static(m)
-        
-        st.info("Note: Detailed property locations would be shown here if available from the API")
+
+        if is_parquet_available():
+            listings = load_area_listings(
+                map_platform, selected_bbox, ("매물ID", "거래유형", "위도", "경도", price_column), None, data_version
+            )
+            visible = listings_in_view(listings, map_view)
+            if should_show_markers(map_zoom, len(visible)):
+                # 충분히 확대했을 때만 화면 안의 매물을 개별 마커로 그림
+                for listing_id, deal_type, lat, lng, price in visible.itertuples(index=False, name=None):
+                    folium.CircleMarker(
+                        location=[lat, lng],
+                        radius=4,
+                        color="crimson",
+                        fill=True,
+                        tooltip=f"{listing_id} · {deal_type} · {price_column} {price}"
+                    ).add_to(m)
+                st.caption(f"{len(visible)} listings in view")
+            else:
+                # 그 외에는 서버에서 Geohash 셀로 묶어 셀마다 매물 수와 가격 중앙값만 그림
+                precision = geohash_precision_for_zoom(map_zoom)
+                cells = aggregate_area_listings(map_platform, selected_bbox, map_view, precision, price_column, data_version)
+                max_count = cells["count"].max() if not cells.empty else 1
+                for cell in cells.itertuples(index=False):
+                    folium.Rectangle(
+                        bounds=[(cell.lat_min, cell.lng_min), (cell.lat_max, cell.lng_max)],
+                        color="crimson",
+                        weight=0,
+                        fill=True,
+                        fill_opacity=0.15 + 0.6 * cell.count / max_count,
+                        tooltip=f"{cell.count} listings · median {price_column} {cell.median_price:,.0f}"
+                    ).add_to(m)
+                st.caption(f"{len(visible)} listings in view, grouped into {len(cells)} geohash cells (precision {precision}). Zoom in to see individual listings.")
+
+        # Display the map and remember where the user zoomed/panned to
+        map_state = st_folium(m, key="listing_map", returned_objects=["zoom", "bounds"], use_container_width=True, height=600)
+        if map_state and map_state.get("zoom") and map_state.get("bounds"):
+            south_west = map_state["bounds"]["_southWest"]
+            north_east = map_state["bounds"]["_northEast"]
+            new_view = tuple(round(value, 3) for value in (south_west["lat"], north_east["lat"], south_west["lng"], north_east["lng"]))
+            if map_state["zoom"] != map_zoom or new_view != tuple(round(value, 3) for value in map_view):
+                st.session_state.map_zoom = map_state["zoom"]
+                st.session_state.map_view = new_view
+                st.rerun()
     
     with tab3:
         # Raw data
         st.subheader("Raw Data")
         
-        # Select property type and platform
-        property_type_options = list(st.session_state.results.keys())
-        if property_type_options:
-            selected_property_type = st.selectbox("Select Property Type", property_type_options)
-            
-            platform_options = list(st.session_state.results[selected_property_type].keys())
-            selected_platform = st.selectbox("Select Platform", platform_options)
-            
-            # Display raw data
-            raw_data = st.session_state.results[selected_property_type][selected_platform]
-            st.json(raw_data)
+        platform_options = sorted({row["platform"] for row in last_finished_job["result"]})
+        selected_platform = st.selectbox("Select Platform", platform_options)
+        if is_parquet_available():
+            # 같은 BBOX/플랫폼은 캐시에서 바로 읽음
+            raw_df = load_area_listings(selected_platform, selected_bbox, None, None, data_version)
+            st.write(f"{len(raw_df)} current listings in the selected area (latest record per listing)")
+            st.dataframe(raw_df, use_container_width=True)
         else:
-            st.info("No raw data available")
+            st.json(last_finished_job["result"])
 
-else:
+elif not job_in_progress:
     st.info("No crawler results yet. Configure and run the crawler using the sidebar.")
 
+# Runtime metrics of crawls running in this server process (refreshed while a job is in progress)
+st.header("Runtime Metrics")
+metrics_snapshot = get_metrics().snapshot()
+stage_rows = metrics_snapshot["stages"]
+http_rows = [
+    {"host": h["labels"].get("host"), "method": h["labels"].get("method"), "requests": h["count"],
+     "p50 (ms)": h["p50"] * 1000, "p90 (ms)": h["p90"] * 1000, "p99 (ms)": h["p99"] * 1000}
+    for h in metrics_snapshot["histograms"] if h["name"] == "http_request_seconds"
+]
+if not stage_rows and not http_rows:
+    st.info("No metrics recorded yet. Run the crawler to collect request and stage metrics.")
+else:
+    metrics_col1, metrics_col2 = st.columns(2)
+    with metrics_col1:
+        st.subheader("Stages")
+        # 누적 시간이 가장 긴 단계가 병목
+        st.dataframe(pd.DataFrame(stage_rows), use_container_width=True)
+    with metrics_col2:
+        st.subheader("HTTP Latency")
+        st.dataframe(pd.DataFrame(http_rows), use_container_width=True)
+        counters = pd.DataFrame(
+            [{**c["labels"], "name": c["name"], "value": c["value"]} for c in metrics_snapshot["counters"]]
+        )
+        if not counters.empty and "status" in counters:
+            status_mix = counters[counters["name"] == "http_requests_total"].groupby("status")["value"].sum()
+            st.write("Status codes:", status_mix.to_dict())
+        if not counters.empty:
+            response_bytes = counters.loc[counters["name"] == "http_response_bytes_total", "value"].sum()
+            st.write(f"Transferred: {response_bytes / 1024 / 1024:.1f} MB")
+
+# Stored listings (partitioned Parquet dataset)
+st.header("Stored Listings")
+if is_parquet_available():
+    stored_platform = st.selectbox("Platform", ["zigbang", "dabang"], key="stored_platform")
+    stored_columns = st.multiselect(
+        "Columns",
+        ["매물ID", "거래유형", "보증금(만원)", "월세(만원)", "매매가(만원)", "면적(m2)", "위도", "경도", "crawl_date", "geohash_prefix"],
+        default=["매물ID", "거래유형", "보증금(만원)", "월세(만원)", "crawl_date"]
+    )
+    stored_date = st.date_input("Crawl Date", value=datetime.now().date(), key="stored_date")
+    # 선택한 플랫폼/수집일 파티션과 선택한 컬럼만 읽음
+    stored_df = load_area_listings(
+        stored_platform, selected_bbox, tuple(stored_columns), (stored_date.isoformat(),), data_version
+    )
+    st.write(f"{len(stored_df)} listings")
+    st.dataframe(stored_df, use_container_width=True)
+else:
+    st.info("Install pyarrow to browse stored Parquet listings.")
+
+# Nearby listings (spatially indexed listing store)
+st.header("Nearby Listings")
+near_col1, near_col2, near_col3, near_col4 = st.columns(4)
+with near_col1:
+    near_lat = st.number_input("Latitude", value=(lat_min + lat_max) / 2, format="%.6f", key="near_lat")
+with near_col2:
+    near_lng = st.number_input("Longitude", value=(lng_min + lng_max) / 2, format="%.6f", key="near_lng")
+with near_col3:
+    near_radius = st.number_input("Radius (m)", min_value=50, max_value=20000, value=500, step=50, key="near_radius")
+with near_col4:
+    near_limit = st.number_input("Max Results", min_value=1, max_value=1000, value=50, key="near_limit")
+# R*Tree 색인으로 조회하므로 저장된 매물이 많아도 CSV/Parquet을 다시 읽지 않음
+nearby_df = get_listing_store().query_radius(near_lat, near_lng, near_radius).head(int(near_limit))
+st.write(f"{len(nearby_df)} listings within {near_radius} m")
+st.dataframe(nearby_df, use_container_width=True)
+
 # Footer
 st.markdown("---")
-st.markdown("© 2025 Real Estate Crawler Dashboard")
\ No newline at end of file
+st.markdown("© 2025 Real Estate Crawler Dashboard")
+
+# 수집 작업이 진행 중이면 잠시 후 화면을 다시 그려 진행률을 갱신
+if job_in_progress:
+    time.sleep(DASHBOARD_POLL_SECONDS)
+    st.rerun()
\ No newline at end of file
@@ -1,63 +1,615 @@
 # main_container.py
-
-import sys
 import os
-# sys.path 설정 (현재 스크립트의 상위 디렉토리를 PYTHONPATH에 추가)
-# 이 부분은 모듈 import 오류를 방지하기 위해 추가된 것으로 보이지만,
-# 프로젝트 구조에 따라 불필요할 수도 있습니다.
-# 하지만 현재 오류 해결을 위해 잠시 유지합니다.
-current_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(current_dir) # RPA_Assignment_01 폴더
-if project_root not in sys.path:
-    sys.path.append(project_root)
-
+import time
+import threading
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from common_utils.logger_setup import setup_logger
-from platform_crawlers.zigbang.zigbang_collector import ZigbangCollector
-# from platform_crawlers.dabang.dabang_collector import DabangCollector # 아직 Dabang 관련 파일이 없으므로 주석 처리
-
-# ==== 전역 설정 변수 정의 (config.py가 없으므로 여기에 직접 정의) ====
-BBOX_LAT_MIN = 37.493
-BBOX_LAT_MAX = 37.527
-BBOX_LNG_MIN = 127.025
-BBOX_LNG_MAX = 127.065
+from common_utils.response_cache import get_response_cache
+from common_utils.http_transport import connection_stats
+from common_utils.metrics import get_metrics
+from common_utils.id_set import IdSet
+from common_utils.listing_index import ListingIndex, listing_fingerprint
+from common_utils.streaming_pipeline import StreamingPipeline
+from common_utils.crawl_checkpoint import CrawlCheckpoint
+from common_utils.shard_queue import ShardWorkQueue, run_shard_worker
+from common_utils.geohash_utils import geohashes_covering_bbox, geohash_bbox, bbox_intersects, clip_bbox
+from platform_configs.general_config import (
+    PIPELINE_QUEUE_SIZE, LISTING_STORE_ENABLED, DEDUP_ENABLED, UNIFIED_OUTPUT_CSV_PATH, CRAWL_MAX_CONCURRENT_JOBS, SHARD_QUEUE_PATH, SHARD_GEOHASH_PRECISION,
+    SHARD_DETAIL_CHUNK_SIZE, SHARD_POLL_INTERVAL, SHARD_WORKER_PROCESSES, SHARD_PHASE_STALL_SECONDS, METRICS_OUTPUT_PATH, DEFAULT_OUTPUT_FORMAT,
+    CRAWL_REGIONS, CRAWL_PLATFORMS, CRAWL_ITEM_TYPES, INCREMENTAL_CRAWL, HTTP_CACHE_ENABLED
+)
+from platform_configs.dabang_config import DABANG_CONVERT_CHUNK_SIZE
+from platform_registry import get_platform
+
+# 플랫폼 수집기/변환기/저장기와 공간 색인 저장소, 중복 통합기는 pandas 등 무거운 모듈을 불러오므로
+# 모듈을 import할 때가 아니라 처음 사용할 때 만듭니다. (대시보드/CLI 시작 시간 단축)
 LOG_FILE_PATH = "crawler_output.log"
 LOG_LEVEL = "DEBUG" # 상세 로그를 보기 위해 DEBUG로 설정
-# ===============================================================
 
 class MainContainer:
-    def __init__(self):
-        self.logger = setup_logger(self.__class__.__name__, log_level=LOG_LEVEL, log_file=LOG_FILE_PATH)
-        self.logger.debug(f"DEBUG: Initializing MainContainer with LOG_LEVEL={LOG_LEVEL}") # DEBUG 추가
-        self.zigbang_collector = ZigbangCollector(log_level=LOG_LEVEL, log_file=LOG_FILE_PATH)
-        # self.dabang_collector = DabangCollector(log_level=LOG_LEVEL, log_file=LOG_FILE_PATH) # 아직 Dabang 관련 파일이 없으므로 주석 처리
+    def __init__(self, log_level=LOG_LEVEL, log_file=LOG_FILE_PATH, output_format=DEFAULT_OUTPUT_FORMAT):
+        self.log_level = log_level
+        self.log_file = log_file
+        self.output_format = output_format
+        self.logger = setup_logger(self.__class__.__name__, log_level=log_level, log_file=log_file)
+        self.logger.debug(f"DEBUG: Initializing MainContainer with LOG_LEVEL={log_level}") # DEBUG 추가
+        self.listing_index = ListingIndex()
+        self.checkpoint = CrawlCheckpoint()
+        # 동시에 실행되는 작업들이 같은 플랫폼 구성 요소를 두 번 만들지 않도록 잠금 아래에서 생성
+        self._components = {}
+        self._components_lock = threading.Lock()
         self.logger.info("MainContainer initialized.")
 
-    def run(self):
-        self.logger.info(f"Starting crawlers for BBOX: Lat:[{BBOX_LAT_MIN}-{BBOX_LAT_MAX}], Lng:[{BBOX_LNG_MIN}-{BBOX_LNG_MAX}]")
+    def _component(self, key, factory):
+        with self._components_lock:
+            if key not in self._components:
+                self._components[key] = factory()
+            return self._components[key]
 
-        # Zigbang 데이터 수집
-        self.logger.info("Collecting Zigbang item IDs by area...")
-        zigbang_item_ids = self.zigbang_collector.collect_item_ids_by_area(
-            BBOX_LAT_MIN, BBOX_LAT_MAX, BBOX_LNG_MIN, BBOX_LNG_MAX
-        )
-        self.logger.info(f"Total unique Zigbang item IDs collected: {len(zigbang_item_ids)}")
+    def collector(self, platform):
+        """
+        플랫폼 수집기. 처음 호출할 때 플랫폼 모듈을 import하고 만든 뒤 이후에는 같은 객체를 반환합니다.
+        (수집기마다 세션/rate limiter를 갖고 있으므로 작업들이 공유)
+        """
+        collector_class = get_platform(platform).load("collector")
+        return self._component(("collector", platform), lambda: collector_class(log_level=self.log_level, log_file=self.log_file))
+
+    def converter(self, platform):
+        converter_class = get_platform(platform).load("converter")
+        return self._component(("converter", platform), lambda: converter_class(log_level=self.log_level, log_file=self.log_file))
+
+    def saver(self, platform, output_path):
+        """
+        저장 파일마다 새 저장기를 만듭니다. (스트리밍 상태를 저장기가 들고 있으므로 공유하지 않음)
+        """
+        saver_class = get_platform(platform).load("saver")
+        return saver_class(output_path, log_level=self.log_level, log_file=self.log_file, output_format=self.output_format)
+
+    @property
+    def listing_store(self):
+        """
+        공간 색인 저장소. 비활성화되어 있으면 None입니다.
+        """
+        if not LISTING_STORE_ENABLED:
+            return None
+
+        def create():
+            from platform_data_processors.listing_store import SpatialListingStore
+            return SpatialListingStore()
+        return self._component("listing_store", create)
 
-        if zigbang_item_ids:
-            # 상세 정보 수집 (현재는 미구현)
-            # zigbang_details = self.zigbang_collector.collect_item_details(zigbang_item_ids)
-            # self.logger.info(f"Total Zigbang item details collected: {len(zigbang_details)}")
-            pass
+    @property
+    def deduplicator(self):
+        def create():
+            from platform_data_processors.listing_dedup import ListingDeduplicator
+            return ListingDeduplicator(log_level=self.log_level, log_file=self.log_file)
+        return self._component("deduplicator", create)
+
+    def build_jobs(self, platforms=CRAWL_PLATFORMS, item_types=CRAWL_ITEM_TYPES, regions=CRAWL_REGIONS):
+        """
+        (플랫폼, 매물 유형, 지역 이름, BBOX) 조합으로 수집 작업 목록을 만듭니다.
+        item_types 중 플랫폼이 지원하지 않는 유형은 그 플랫폼에서 건너뛰고,
+        매물 유형 구분이 없는 플랫폼(다방)은 지역마다 작업 하나만 만듭니다.
+        """
+        specs = [get_platform(platform) for platform in platforms]
+        jobs = []
+        for region, bbox in regions.items():
+            for spec in specs:
+                jobs.extend((spec.name, item_type, region, bbox) for item_type in spec.job_item_types(item_types))
+        return jobs
+
+    def run_jobs(self, jobs, job_func, max_workers=CRAWL_MAX_CONCURRENT_JOBS, progress_callback=None):
+        """
+        작업들을 작업자 풀에서 동시에 실행하고 {작업: 결과}를 반환합니다.
+        각 작업은 자기 플랫폼 호스트의 rate limiter만 사용하므로 느린 플랫폼이 다른 플랫폼을 막지 않고,
+        전체 소요 시간은 모든 작업 시간의 합이 아니라 가장 오래 걸리는 작업에 가까워집니다.
+        실패한 작업은 기록만 하고 결과를 None으로 두어 나머지 작업은 끝까지 진행합니다.
+        progress_callback이 있으면 작업이 하나 끝날 때마다 (끝난 작업 수, 전체 작업 수, 메시지)로 호출합니다.
+        """
+        results = {}
+        if not jobs:
+            return results
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs)), thread_name_prefix="crawl-job") as executor:
+            futures = {executor.submit(self._timed_job, job_func, job): job for job in jobs}
+            for future in as_completed(futures):
+                platform, item_type, region, _ = futures[future]
+                try:
+                    results[futures[future]], elapsed = future.result()
+                    get_metrics().observe("crawl_job_seconds", elapsed, platform=platform, item_type=item_type, region=region)
+                    self.logger.info(f"Job {platform}/{item_type}/{region} finished in {elapsed:.1f}s.")
+                except Exception as e:
+                    results[futures[future]] = None
+                    get_metrics().increment("crawl_job_failures_total", platform=platform, item_type=item_type, region=region)
+                    self.logger.error(f"Job {platform}/{item_type}/{region} failed: {e}", exc_info=True)
+                if progress_callback:
+                    progress_callback(len(results), len(jobs), f"{platform}/{item_type}/{region} done")
+
+        self.logger.info(f"{len(jobs)} crawl jobs completed in {time.monotonic() - started:.1f}s.")
+        return results
+
+    @staticmethod
+    def _timed_job(job_func, job):
+        started = time.monotonic()
+        result = job_func(*job)
+        return result, time.monotonic() - started
+
+    def collect_listing_ids(self, platform, item_type, region, bbox):
+        """
+        작업 하나의 매물 ID만 IdSet으로 수집합니다. (대시보드처럼 상세 정보 없이 ID만 필요한 경우)
+        """
+        if platform == "zigbang":
+            return self.collector("zigbang").collect_item_ids_by_area(*bbox, item_type=item_type)
+        return self.collector("dabang").collect_rooms_data_by_area(*bbox)
+
+    def _filter_incremental(self, platform, scope, fingerprints, incremental, complete=True):
+        """
+        증분 수집이면 지난 수집 이후 새로 생기거나 바뀐 매물 ID만, 아니면 전체 ID를 반환합니다.
+        complete가 False면(목록 요청 일부가 실패) 이번 목록에 없는 매물도 사라졌다고 볼 수 없으므로
+        사라진 매물 표시는 하지 않습니다.
+        """
+        listing_ids = list(fingerprints)
+        if not incremental:
+            return listing_ids
+        # 같은 범위(scope)로 다시 수집할 때 새로 생기거나 바뀐 매물만 상세 정보를 받음
+        ids_to_fetch = self.listing_index.observe(platform, scope, fingerprints)
+        if complete:
+            delisted_ids = self.listing_index.mark_delisted(platform, scope, listing_ids)
         else:
+            delisted_ids = []
+            self.logger.warning(f"Listing for {platform} {scope} is incomplete; skipping delisting for this crawl.")
+        self.logger.info(
+            f"Incremental crawl ({platform} {scope}): {len(ids_to_fetch)} new or changed items to fetch, "
+            f"{len(listing_ids) - len(ids_to_fetch)} unchanged skipped, {len(delisted_ids)} delisted."
+        )
+        return ids_to_fetch
+
+    def _saved_recorder(self, platform, incremental, checkpoint=None):
+        """
+        청크가 실제로 파일에 기록될 때마다 호출할 함수를 만듭니다.
+        증분 수집이면 상세 정보를 받은 것으로 색인에 기록하고, 체크포인트가 있으면 저장을 마친 매물로 기록합니다.
+        """
+        if not incremental and checkpoint is None:
+            return None
+
+        def record_saved(listing_ids):
+            if not listing_ids:
+                return
+            if incremental:
+                self.listing_index.mark_fetched(platform, listing_ids)
+            if checkpoint is not None:
+                # 청크 안의 매물 ID는 다른 청크와 겹치지 않으므로 첫 ID를 작업 단위 키로 사용
+                checkpoint.record(str(listing_ids[0]), listing_ids)
+                # 파일에는 기록됐는데 체크포인트가 없으면 이어하기 때 같은 매물이 두 번 저장되므로 바로 씀
+                checkpoint.flush()
+        return record_saved
+
+    def _skip_checkpointed(self, listing_ids, checkpoint):
+        """
+        이전 실행에서 이미 저장까지 끝난 매물 ID를 제외합니다.
+        """
+        saved_ids = IdSet.union_all(checkpoint.load().values())
+        if not saved_ids:
+            return listing_ids
+        already_saved = saved_ids.contains(listing_ids).tolist()
+        remaining = [listing_id for listing_id, saved in zip(listing_ids, already_saved) if not saved]
+        self.logger.info(f"Resuming from checkpoint: {len(listing_ids) - len(remaining)} items already saved, {len(remaining)} remaining.")
+        return remaining
+
+    def _stream_chunks(self, platform, chunks, converter, saver, on_saved=None, resume=False, carry_over_ids=None):
+        """
+        청크를 곧바로 DataFrame으로 변환하고 저장합니다(Parquet 또는 CSV).
+        수집 → 변환 → 저장 단계는 크기가 제한된 큐로 연결되어 있어, 매물 수와 관계없이
+        메모리에는 몇 개의 청크만 머무릅니다.
+        on_saved가 있으면 저장기가 데이터를 실제로 파일에 기록할 때마다 기록된 매물 ID 목록으로 호출합니다.
+        (Parquet은 여러 청크를 모아서 기록하므로, 버퍼에만 있는 매물이 저장된 것으로 기록되지 않도록 함)
+        공간 색인 저장소를 쓰면 변환된 청크를 저장하기 전에 저장소에도 추가/갱신합니다.
+        carry_over_ids는 저장기의 start_stream에 그대로 넘깁니다. (증분 수집 CSV에서 바뀌지 않은 매물 행 유지)
+        """
+        def convert_chunk(chunk_items):
+            if not chunk_items:
+                return None
+            return converter.convert_raw_to_dataframe(chunk_items)
+
+        def index_chunk(dataframe):
+            with get_metrics().track_stage("index", platform=platform) as stage:
+                stage.add(self.listing_store.upsert_dataframe(platform, dataframe))
+            return dataframe
+
+        stages = [convert_chunk, saver.append_dataframe]
+        if self.listing_store is not None:
+            stages.insert(1, index_chunk)
+
+        saver.on_flushed = on_saved
+        saver.start_stream(resume=resume, carry_over_ids=carry_over_ids)
+        pipeline = StreamingPipeline(stages, queue_size=PIPELINE_QUEUE_SIZE, logger=self.logger)
+        pipeline.run(chunks)
+        saver.finish_stream()
+        return saver.streamed_records
+
+    @staticmethod
+    def _crawl_scope(item_type, bbox):
+        return f"{item_type}:{','.join(str(value) for value in bbox)}"
+
+    def _carry_over_ids(self, platform, scope, incremental):
+        """
+        증분 수집이면 이번에 상세 정보를 다시 받지 않아도 출력 파일에 남아 있어야 하는 매물, 즉 범위 안에서
+        내려가지 않은 매물 ID를 반환합니다. (_filter_incremental 이후에 호출)
+        """
+        return self.listing_index.active_ids(platform, scope) if incremental else None
+
+    def _job_checkpoints(self, platform, scope, resume):
+        """
+        작업 하나의 목록 단계/저장 단계 체크포인트를 반환합니다. 이어하기가 아니면 이전 기록을 지우고 새로 시작합니다.
+        """
+        list_checkpoint = self.checkpoint.scope(f"{platform}:list:{scope}")
+        saved_checkpoint = self.checkpoint.scope(f"{platform}:saved:{scope}")
+        if not resume:
+            list_checkpoint.clear()
+            saved_checkpoint.clear()
+        return list_checkpoint, saved_checkpoint
+
+    @staticmethod
+    def _job_result(collected, saved, complete):
+        """
+        작업 하나의 결과: 수집된 매물 ID 수, 이번에 저장한 매물 수, 목록 수집이 완전했는지 여부
+        증분 수집에서는 바뀐 매물만 저장하므로 saved가 0이어도 collected개의 매물이 확인된 것입니다.
+        """
+        return {"collected": collected, "saved": saved, "complete": complete}
+
+    def crawl_zigbang(self, item_type, region, bbox, incremental=INCREMENTAL_CRAWL, resume=False):
+        """
+        직방 작업 하나: 매물 ID 수집 → 상세 정보 → 변환 → 저장
+        resume이 True면 체크포인트에 기록된 Geohash 셀과 저장된 매물은 건너뜁니다.
+        결과는 _job_result 형식의 딕셔너리입니다.
+        """
+        scope = self._crawl_scope(item_type, bbox)
+        list_checkpoint, saved_checkpoint = self._job_checkpoints("zigbang", scope, resume)
+
+        self.logger.info(f"Collecting Zigbang {item_type} item IDs for region {region}...")
+        collector = self.collector("zigbang")
+        failed_cells = []
+        fingerprints = collector.collect_item_fingerprints_by_area(
+            *bbox, item_type=item_type, checkpoint=list_checkpoint, failed_cells=failed_cells
+        )
+        self.logger.info(f"Total unique Zigbang {item_type} item IDs collected in {region}: {len(fingerprints)}")
+        if not fingerprints:
+            if failed_cells:
+                # 목록 요청이 실패해서 비어 있는 것이므로 사라진 매물 판단/출력 파일 교체 없이 끝냄
+                self.logger.warning("No Zigbang items collected and some geohash cells failed; leaving the previous results as they are.")
+                return self._job_result(0, 0, False)
+            # 완전히 조회했는데 비어 있으면 이전에 있던 매물이 모두 내려간 것이므로 아래 단계를 그대로 진행
             self.logger.info("No Zigbang items found for the specified area.")
 
-        # Dabang 데이터 수집 (현재 DabangCollector 주석 처리)
-        # self.logger.info("Collecting Dabang room data by area...")
-        # dabang_room_data = self.dabang_collector.collect_room_data_by_area(
-        #     BBOX_LAT_MIN, BBOX_LAT_MAX, BBOX_LNG_MIN, BBOX_LNG_MAX
-        # )
-        # self.logger.info(f"Total Dabang room data collected: {len(dabang_room_data)}")
+        ids_to_fetch = self._filter_incremental("zigbang", scope, fingerprints, incremental, complete=not failed_cells)
+        ids_to_fetch = self._skip_checkpointed(ids_to_fetch, saved_checkpoint)
+        saver = self.saver("zigbang", get_platform("zigbang").output_path_for(item_type, region))
+        saved_count = self._stream_chunks(
+            "zigbang", collector.iter_item_details(ids_to_fetch), self.converter("zigbang"), saver,
+            on_saved=self._saved_recorder("zigbang", incremental, saved_checkpoint), resume=resume,
+            carry_over_ids=self._carry_over_ids("zigbang", scope, incremental)
+        )
+        self.logger.info(f"Total Zigbang {item_type} item details collected in {region}: {saved_count}")
+
+        # 작업이 끝까지 완료되었으므로 다음 실행은 처음부터 시작
+        list_checkpoint.clear()
+        saved_checkpoint.clear()
+        return self._job_result(len(fingerprints), saved_count, not failed_cells)
+
+    def crawl_dabang(self, region, bbox, incremental=INCREMENTAL_CRAWL, resume=False, item_type="all"):
+        """
+        다방 작업 하나: 목록 수집 → 변환 → 저장
+        다방은 목록 응답에 필요한 필드가 모두 있으므로 별도의 상세 정보 단계가 없습니다.
+        resume이 True면 체크포인트에 기록된 페이지와 저장된 매물은 건너뜁니다.
+        결과는 _job_result 형식의 딕셔너리입니다.
+        """
+        scope = self._crawl_scope(item_type, bbox)
+        list_checkpoint, saved_checkpoint = self._job_checkpoints("dabang", scope, resume)
+
+        self.logger.info(f"Collecting Dabang rooms for region {region}...")
+        failed_pages = []
+        rooms = self.collector("dabang").collect_rooms_by_area(*bbox, checkpoint=list_checkpoint, failed_pages=failed_pages)
+        if not rooms:
+            if failed_pages:
+                self.logger.warning("No Dabang rooms collected and a page request failed; leaving the previous results as they are.")
+                return self._job_result(0, 0, False)
+            self.logger.info("No Dabang rooms found for the specified area.")
+
+        fingerprints = {room_id: listing_fingerprint(room) for room_id, room in rooms.items()}
+        ids_to_fetch = self._filter_incremental("dabang", scope, fingerprints, incremental, complete=not failed_pages)
+        ids_to_fetch = self._skip_checkpointed(ids_to_fetch, saved_checkpoint)
+        rooms_to_save = iter([rooms[room_id] for room_id in ids_to_fetch])
+        chunks = iter(lambda: list(islice(rooms_to_save, DABANG_CONVERT_CHUNK_SIZE)), [])
+
+        saver = self.saver("dabang", get_platform("dabang").output_path_for(item_type, region))
+        saved_count = self._stream_chunks(
+            "dabang", chunks, self.converter("dabang"), saver,
+            on_saved=self._saved_recorder("dabang", incremental, saved_checkpoint), resume=resume,
+            carry_over_ids=self._carry_over_ids("dabang", scope, incremental)
+        )
+        self.logger.info(f"Total Dabang rooms saved in {region}: {saved_count}")
+
+        list_checkpoint.clear()
+        saved_checkpoint.clear()
+        return self._job_result(len(rooms), saved_count, not failed_pages)
+
+    def _crawl_job(self, platform, item_type, region, bbox, incremental=INCREMENTAL_CRAWL, resume=False):
+        crawl = getattr(self, get_platform(platform).crawl_method)
+        return crawl(item_type=item_type, region=region, bbox=bbox, incremental=incremental, resume=resume)
+
+    @staticmethod
+    def _group_key(platform, item_type, region):
+        return f"{platform}/{item_type}/{region}"
+
+    def build_shards(self, jobs, precision=SHARD_GEOHASH_PRECISION):
+        """
+        각 작업의 BBOX를 Geohash 셀로 나눠 ID 수집 샤드 목록을 만듭니다.
+        셀은 작업 BBOX 안으로 잘라서 넣으므로 샤드들을 합치면 정확히 원래 BBOX가 됩니다.
+        """
+        shards = []
+        for platform, item_type, region, bbox in jobs:
+            group_key = self._group_key(platform, item_type, region)
+            for geohash_code in geohashes_covering_bbox(*bbox, precision):
+                cell_bbox = geohash_bbox(geohash_code)
+                if not bbox_intersects(cell_bbox, bbox):
+                    continue
+                shards.append({
+                    "shard_key": f"ids/{group_key}/{geohash_code}",
+                    "group_key": group_key,
+                    "kind": "ids",
+                    "payload": {"platform": platform, "item_type": item_type, "region": region,
+                                "bbox": list(clip_bbox(cell_bbox, bbox))},
+                })
+        return shards
+
+    def _build_detail_shards(self, platform, item_type, region, listing_ids, merged):
+        group_key = self._group_key(platform, item_type, region)
+        # 조정자가 다시 실행되어도 같은 샤드 키가 나오도록 ID를 정렬해서 나눔
+        listing_ids = sorted(listing_ids, key=str)
+        shards = []
+        for part, start in enumerate(range(0, len(listing_ids), SHARD_DETAIL_CHUNK_SIZE)):
+            chunk_ids = listing_ids[start:start + SHARD_DETAIL_CHUNK_SIZE]
+            payload = {"platform": platform, "item_type": item_type, "region": region, "part": part, "ids": chunk_ids}
+            if platform == "dabang":
+                # 다방은 목록 단계에서 받은 room 데이터를 그대로 변환/저장
+                payload["rooms"] = [merged[room_id][1] for room_id in chunk_ids]
+            shards.append({"shard_key": f"details/{group_key}/{part}", "group_key": group_key, "kind": "details", "payload": payload})
+        return shards
+
+    def process_shard(self, shard):
+        """
+        작업자 프로세스에서 샤드 하나를 처리하고 (매물 ID, 지문, 데이터) 튜플 목록을 반환합니다.
+        - ids: 샤드 BBOX의 매물 ID와 지문 수집 (다방은 변환에 쓸 room 데이터도 함께 반환)
+          목록 요청이 일부라도 실패하면 예외를 내서 샤드를 다시 시도하게 함 (끝내 실패한 샤드는 조정자가 집계)
+        - details: 매물 상세 정보 수집 → 변환 → 저장 후 저장된 매물 ID 반환
+        """
+        payload = shard["payload"]
+        platform, item_type, region = payload["platform"], payload["item_type"], payload["region"]
+
+        if shard["kind"] == "ids":
+            failed_units = []
+            if platform == "zigbang":
+                fingerprints = self.collector("zigbang").collect_item_fingerprints_by_area(
+                    *payload["bbox"], item_type=item_type, failed_cells=failed_units
+                )
+                results = [(item_id, fingerprint, None) for item_id, fingerprint in fingerprints.items()]
+            else:
+                rooms = self.collector("dabang").collect_rooms_by_area(*payload["bbox"], failed_pages=failed_units)
+                results = [(room_id, listing_fingerprint(room), room) for room_id, room in rooms.items()]
+            if failed_units:
+                raise RuntimeError(f"{len(failed_units)} listing requests failed in shard {shard['shard_key']}: {failed_units[:10]}")
+            return results
+
+        saved_ids = []
+        if platform == "zigbang":
+            chunks = self.collector("zigbang").iter_item_details(payload["ids"])
+        else:
+            chunks = iter([payload["rooms"]])
+        # 여러 작업자가 같은 CSV 파일에 쓰지 않도록 샤드마다 파일을 나눔 (Parquet은 파일 이름이 원래 겹치지 않음)
+        # 증분 수집이면 바뀐 매물만 담기므로, 이전 실행의 같은 번호 샤드 파일을 덮어쓰지 않도록 작업 ID를 붙임
+        output_root, output_ext = os.path.splitext(get_platform(platform).output_path_for(item_type, region))
+        saver = self.saver(platform, f"{output_root}_{shard['job_id']}_part{payload['part']:04d}{output_ext}")
+        self._stream_chunks(platform, chunks, self.converter(platform), saver, on_saved=saved_ids.extend)
+        return [(listing_id, None, None) for listing_id in saved_ids]
+
+    def run_shard_worker(self, job_id, queue_path=SHARD_QUEUE_PATH):
+        """
+        작업자로 참여해 job_id의 샤드를 작업이 끝날 때까지 처리합니다.
+        다른 머신에서는 같은 큐 파일을 바라보도록 queue_path를 지정해 이 메서드만 실행하면 됩니다.
+        """
+        queue = ShardWorkQueue(queue_path)
+        try:
+            return run_shard_worker(queue, job_id, self.process_shard, self.logger)
+        finally:
+            queue.close()
+            # 작업자 프로세스의 지표는 프로세스마다 따로 쌓이므로 작업자별 파일로 남김
+            output_root, output_ext = os.path.splitext(METRICS_OUTPUT_PATH)
+            self.write_metrics(f"{output_root}_worker{os.getpid()}{output_ext}")
+
+    def write_metrics(self, path=METRICS_OUTPUT_PATH):
+        """
+        이 프로세스에서 지금까지 쌓인 지표를 파일로 기록하고 가장 느린 단계를 로그로 남깁니다.
+        (카운터는 프로세스가 시작된 뒤로 계속 누적되는 값이며, 확장자가 .prom이면 Prometheus 텍스트 형식)
+        """
+        metrics = get_metrics()
+        try:
+            metrics.write(path)
+        except OSError as e:
+            self.logger.error(f"Failed to write metrics to {path}: {e}")
+            return None
+        for stage in metrics.stage_summary():
+            rate = f"{stage['items_per_second']:.1f} items/s" if stage["items_per_second"] else "n/a"
+            self.logger.info(
+                f"Stage {stage.get('platform', '-')}/{stage['stage']}: {stage['seconds']:.2f}s over {stage['runs']} runs, "
+                f"{stage['items']} items ({rate})"
+            )
+        self.logger.info(f"Metrics written to {path}.")
+        return path
+
+    def _wait_for_phase(self, queue, job_id, kind, processes):
+        """
+        한 단계의 샤드가 모두 끝날 때까지 기다립니다.
+        로컬 작업자가 모두 끝난 뒤에도 다른 머신의 작업자가 처리할 수 있으므로 바로 포기하지 않지만,
+        처리 중인 샤드가 없는 상태가 SHARD_PHASE_STALL_SECONDS 동안 이어지면 남은 샤드를 실패로 표시하고 단계를 끝냅니다.
+        """
+        last_logged = 0.0
+        idle_since = None
+        while not queue.is_phase_done(job_id, kind):
+            if any(process.is_alive() for process in processes) or queue.has_live_lease(job_id, kind):
+                idle_since = None
+            elif idle_since is None:
+                self.logger.warning(f"No shard worker is active in the {kind} phase; waiting up to {SHARD_PHASE_STALL_SECONDS}s for remote workers.")
+                idle_since = time.monotonic()
+            elif time.monotonic() - idle_since >= SHARD_PHASE_STALL_SECONDS:
+                abandoned = queue.fail_unfinished(job_id, kind, f"no shard worker picked it up within {SHARD_PHASE_STALL_SECONDS}s")
+                self.logger.error(f"Giving up on {abandoned} {kind} shards in sharded crawl {job_id}: no shard worker is active.")
+                break
+            if time.monotonic() - last_logged >= 10:
+                self.logger.info(f"Sharded crawl {job_id} {kind} phase progress: {queue.progress(job_id, kind)}")
+                last_logged = time.monotonic()
+            time.sleep(SHARD_POLL_INTERVAL)
+        counts = queue.progress(job_id, kind)
+        if counts["failed"]:
+            self.logger.error(f"{counts['failed']} {kind} shards failed after all retries in sharded crawl {job_id}.")
+
+    def run_sharded(self, job_id=None, workers=SHARD_WORKER_PROCESSES, incremental=INCREMENTAL_CRAWL,
+                    platforms=CRAWL_PLATFORMS, item_types=CRAWL_ITEM_TYPES, regions=CRAWL_REGIONS, queue_path=SHARD_QUEUE_PATH):
+        """
+        BBOX를 Geohash 샤드로 나눠 작업 큐에 넣고, 로컬 작업자 프로세스 workers개(와 다른 머신의 작업자)가 처리하게 합니다.
+        이 프로세스는 조정자로서 다음 순서로 진행합니다.
+            1. ID 수집 샤드를 큐에 넣고 모두 끝날 때까지 대기
+            2. 작업별로 모든 샤드의 ID를 합쳐 중복 제거하고, 증분 수집이면 새로/바뀐 매물만 골라 상세 정보 샤드를 큐에 넣음
+            3. 상세 정보 샤드가 모두 끝나면 작업을 종료 표시하고 작업자 프로세스를 정리
+        같은 job_id로 다시 실행하면 이미 끝난 샤드는 건너뜁니다.
+        """
+        job_id = job_id or datetime.now().strftime("crawl-%Y%m%d-%H%M%S")
+        queue = ShardWorkQueue(queue_path)
+        queue.create_job(job_id)
+        jobs = self.build_jobs(platforms, item_types, regions)
+        shard_count = queue.enqueue(job_id, self.build_shards(jobs))
+        self.logger.info(f"Sharded crawl {job_id}: {len(jobs)} jobs split into {shard_count} ID shards, {workers} local workers.")
+
+        # 작업자는 자기 프로세스에서 수집기/세션/rate limiter를 새로 만들도록 spawn으로 시작
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=_shard_worker_main, args=(job_id, queue_path, self.log_level, self.log_file, self.output_format), name=f"shard-worker-{index}")
+            for index in range(workers)
+        ]
+        for process in processes:
+            process.start()
+
+        results = {}
+        listing_stats = {}
+        started = time.monotonic()
+        try:
+            self._wait_for_phase(queue, job_id, "ids", processes)
+            for job in jobs:
+                platform, item_type, region, bbox = job
+                group_key = self._group_key(platform, item_type, region)
+                merged = queue.results(job_id, group_key, "ids")
+                failed_shards = queue.progress(job_id, "ids", group_key)["failed"]
+                listing_stats[job] = (len(merged), not failed_shards)
+                self.logger.info(
+                    f"{group_key}: {len(merged)} unique listing IDs merged from all shards ({failed_shards} ID shards failed)."
+                )
+                scope = self._crawl_scope(item_type, bbox)
+                fingerprints = {listing_id: fingerprint for listing_id, (fingerprint, _) in merged.items()}
+                ids_to_fetch = self._filter_incremental(platform, scope, fingerprints, incremental, complete=not failed_shards)
+                queue.enqueue(job_id, self._build_detail_shards(platform, item_type, region, ids_to_fetch, merged))
+
+            self._wait_for_phase(queue, job_id, "details", processes)
+            for job in jobs:
+                platform, item_type, region, _ = job
+                saved_ids = list(queue.results(job_id, self._group_key(platform, item_type, region), "details"))
+                if incremental:
+                    self.listing_index.mark_fetched(platform, saved_ids)
+                collected, complete = listing_stats[job]
+                results[job] = self._job_result(collected, len(saved_ids), complete)
+                self.logger.info(f"{platform}/{item_type}/{region}: {len(saved_ids)} records saved")
+        finally:
+            queue.finish_job(job_id)
+            for process in processes:
+                process.join()
+            queue.close()
+
+        self.logger.info(f"Sharded crawl {job_id} completed in {time.monotonic() - started:.1f}s.")
+        if DEDUP_ENABLED and len(platforms) > 1:
+            self.build_unified_listings(regions)
+        self.write_metrics()
+        return results
+
+    def build_unified_listings(self, regions=CRAWL_REGIONS):
+        """
+        지역마다 공간 색인 저장소의 매물을 읽어 플랫폼 간 중복을 통합하고, 클러스터 ID가 붙은 통합 매물 테이블을 CSV로 저장합니다.
+        지역 이름 → 저장한 CSV 경로를 반환합니다.
+        """
+        if self.listing_store is None:
+            self.logger.warning("Listing store is disabled; skipping cross-platform deduplication.")
+            return {}
+
+        output_paths = {}
+        for region, bbox in regions.items():
+            with get_metrics().track_stage("dedup", region=region) as stage:
+                unified = self.deduplicator.deduplicate(self.listing_store.query_bbox(*bbox))
+                stage.add(len(unified))
+            output_path = UNIFIED_OUTPUT_CSV_PATH.format(region=region)
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            unified.to_csv(output_path, index=False, encoding='utf-8-sig')
+            self.logger.info(f"Unified listings for region {region} saved to {output_path} ({len(unified)} rows).")
+            output_paths[region] = output_path
+        return output_paths
+
+    def run(self, incremental=INCREMENTAL_CRAWL, platforms=CRAWL_PLATFORMS, item_types=CRAWL_ITEM_TYPES, regions=CRAWL_REGIONS,
+            resume=False, progress_callback=None):
+        """
+        모든 작업을 동시에 실행하고 {작업: 결과}를 반환합니다. 결과는 _job_result 딕셔너리이며, 실패한 작업은 None입니다.
+        """
+        jobs = self.build_jobs(platforms, item_types, regions)
+        self.logger.info(f"Starting {len(jobs)} crawl jobs for platforms {platforms}, item types {item_types}, regions {list(regions)}")
+
+        results = self.run_jobs(
+            jobs, lambda *job: self._crawl_job(*job, incremental=incremental, resume=resume), progress_callback=progress_callback
+        )
+        for (platform, item_type, region, _), result in results.items():
+            if result is None:
+                self.logger.info(f"{platform}/{item_type}/{region}: failed")
+            else:
+                self.logger.info(
+                    f"{platform}/{item_type}/{region}: {result['collected']} listings collected, {result['saved']} records saved"
+                    + ("" if result["complete"] else " (listing incomplete)")
+                )
+
+        if HTTP_CACHE_ENABLED:
+            # 캐시를 끈 경우 통계를 보려고 캐시 파일을 만들지 않음
+            cache_stats = get_response_cache().stats()
+            self.logger.info(
+                f"HTTP cache: {cache_stats['hits']} hits, {cache_stats['revalidated']} revalidated, "
+                f"{cache_stats['misses']} misses (hit ratio {cache_stats['hit_ratio']:.1%}), "
+                f"{cache_stats['entries']} entries / {cache_stats['bytes']} bytes stored."
+            )
+        conn_stats = connection_stats()
+        self.logger.info(
+            f"HTTP connections: {conn_stats['requests']} requests over {conn_stats['new_connections']} new connections "
+            f"(reuse ratio {conn_stats['reuse_ratio']:.1%})."
+        )
+        if DEDUP_ENABLED and len(platforms) > 1:
+            self.build_unified_listings(regions)
+        self.write_metrics()
+        return results
+
+
+def _shard_worker_main(job_id, queue_path, log_level=LOG_LEVEL, log_file=LOG_FILE_PATH, output_format=DEFAULT_OUTPUT_FORMAT):
+    """
+    run_sharded()가 띄우는 작업자 프로세스의 진입점입니다.
+    """
+    MainContainer(log_level=log_level, log_file=log_file, output_format=output_format).run_shard_worker(job_id, queue_path=queue_path)
 
 
 if __name__ == "__main__":
-    container = MainContainer()
-    container.run()
+    # 기존 실행 방법(python main_container.py [--resume])도 CLI로 처리
+    from crawler_cli import main
+    raise SystemExit(main())
@@ -1,4 +1,6 @@
 # platform_configs/dabang_config.py
+import os
+from platform_configs.general_config import DEFAULT_RATE_LIMIT, DEFAULT_HEDGING, OUTPUT_BASE_DIR
 
 # 다방 API의 기본 URL
 DABANG_API_BASE_URL = "https://www.dabangapp.com/api/v1"
@@ -20,3 +22,18 @@ DABANG_DEFAULT_ZOOM_LEVEL = 15
 
 # 다방 API 페이지네이션 시 최대로 수집할 페이지 수 (무한 루프 방지)
 DABANG_DEFAULT_MAX_PAGES = 100
+
+# 페이지를 동시에 몇 개까지 미리 요청할지 (동시 요청 윈도우 크기)
+DABANG_PAGE_FETCH_WINDOW = 4
+
+# 다방 API 호스트의 요청 속도 제한 설정 (공통 설정을 기반으로 필요한 값만 덮어씀)
+DABANG_RATE_LIMIT = {**DEFAULT_RATE_LIMIT, "initial_rate": 2.0, "max_rate": 10.0, "burst": DABANG_PAGE_FETCH_WINDOW}
+
+# 다방 API 헤지 요청 설정 (느린 요청의 꼬리 지연을 줄이고 싶을 때 enabled를 True로 변경)
+DABANG_HEDGING = {**DEFAULT_HEDGING, "enabled": False}
+
+# 목록에서 받은 매물을 변환/저장 단계로 넘길 때 한 번에 묶는 매물 수
+DABANG_CONVERT_CHUNK_SIZE = 500
+
+# 다방 수집 결과 저장 경로 ({region}에 수집 지역 이름이 들어감)
+DABANG_OUTPUT_CSV_PATH = os.path.join(OUTPUT_BASE_DIR, "dabang", "dabang_rooms_{region}.csv")
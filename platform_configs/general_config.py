@@ -5,6 +5,159 @@ import os
 LOG_DIR = "logs"
 LOG_FILE_PATH = os.path.join(LOG_DIR, "crawler.log")
 LOG_LEVEL = "INFO" # DEBUG, INFO, WARNING, ERROR, CRITICAL 중 선택
+LOG_FILE_FORMAT = "json" # 로그 파일 형식: "json"(한 줄에 JSON 하나) 또는 "text" (콘솔은 항상 text)
+LOG_MAX_BYTES = 20 * 1024 * 1024 # 로그 파일이 이 크기를 넘으면 새 파일로 교체
+LOG_BACKUP_COUNT = 5 # 보관할 이전 로그 파일 수 (crawler.log.1 ~ .5)
+# 로거별로 WARNING 미만 로그 중 이 비율만 남김 (요청마다 찍히는 로그가 많은 로거용). 없는 로거는 전부 남김
+LOG_SAMPLE_RATES = {
+    "ZigbangApiClient": 0.1,
+    "DabangApiClient": 0.1,
+}
 
 # --- 공통 출력 디렉토리 설정 ---
 OUTPUT_BASE_DIR = "data"
+
+# --- 기본 수집 대상 설정 (crawler_cli.py에서 --bbox/--region/--platforms/--item-types로 바꿀 수 있음) ---
+BBOX_LAT_MIN = 37.493
+BBOX_LAT_MAX = 37.527
+BBOX_LNG_MIN = 127.025
+BBOX_LNG_MAX = 127.065
+# 지역 이름 → (lat_min, lat_max, lng_min, lng_max)
+CRAWL_REGIONS = {
+    "gangnam": (BBOX_LAT_MIN, BBOX_LAT_MAX, BBOX_LNG_MIN, BBOX_LNG_MAX),
+}
+CRAWL_PLATFORMS = ["zigbang", "dabang"] # platform_registry.py에 등록된 플랫폼 이름
+# 수집할 매물 유형. None이면 플랫폼마다 기본 유형(직방은 ZIGBANG_DEFAULT_ITEM_TYPE)으로 수집
+CRAWL_ITEM_TYPES = None
+INCREMENTAL_CRAWL = True # True면 이전 수집 이후 새로 생기거나 바뀐 매물만 상세 정보를 받음
+
+# --- 공통 요청 속도 제한 설정 (호스트별 토큰 버킷, AIMD 방식) ---
+# 정상 응답이 이어지면 increase_interval초마다 초당 요청 수를 additive_increase만큼 올리고,
+# 429/503/Retry-After/타임아웃을 받으면 multiplicative_decrease배로 줄입니다.
+DEFAULT_RATE_LIMIT = {
+    "initial_rate": 2.0,
+    "min_rate": 0.5,
+    "max_rate": 20.0,
+    "additive_increase": 0.5,
+    "multiplicative_decrease": 0.5,
+    "burst": 1,
+    "increase_interval": 1.0,
+}
+
+# --- 공통 요청 재시도/회로 차단기/헤지 요청 설정 ---
+REQUEST_TIMEOUT = 10 # 요청 한 번의 타임아웃(초)
+
+# 재시도 가능한 오류(타임아웃, 연결 오류, 429/5xx)는 지터를 섞은 지수 백오프로 재시도
+DEFAULT_RETRY_POLICY = {
+    "max_attempts": 4,
+    "base_delay": 0.5,
+    "max_delay": 10.0,
+}
+
+# 같은 호스트에서 연속으로 failure_threshold번 실패하면 reset_timeout초 동안 요청을 차단
+DEFAULT_CIRCUIT_BREAKER = {
+    "failure_threshold": 5,
+    "reset_timeout": 30.0,
+}
+
+# 헤지 요청: 응답이 최근 지연 시간의 percentile 값보다 늦어지면 같은 요청을 한 번 더 보내고 먼저 온 응답을 사용
+DEFAULT_HEDGING = {
+    "enabled": False,
+    "percentile": 0.95,
+    "min_samples": 20,
+}
+
+# --- HTTP 응답 디스크 캐시 설정 ---
+# 같은 요청(메서드, URL, 파라미터/본문)이 TTL 이내에 다시 오면 네트워크 없이 저장된 응답을 사용
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_PATH = os.path.join("cache", "http_cache.sqlite3")
+HTTP_CACHE_TTL_SECONDS = 600
+HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# --- 증분 수집 설정 ---
+# 지금까지 본 매물(ID, 처음/마지막 확인 시각, 내용 지문)을 기록하는 SQLite 색인 파일
+LISTING_INDEX_PATH = os.path.join(OUTPUT_BASE_DIR, "listing_index.sqlite3")
+
+# --- 공간 색인 매물 저장소 설정 ---
+# 저장한 매물을 위도/경도로 색인해 BBOX/반경/가까운 매물 조회에 쓰는 SQLite(R*Tree) 파일
+LISTING_STORE_ENABLED = True
+LISTING_STORE_PATH = os.path.join(OUTPUT_BASE_DIR, "listing_store.sqlite3")
+
+# --- 스트리밍 파이프라인 설정 ---
+# 단계(수집 → 변환 → 저장) 사이 큐에 대기할 수 있는 최대 청크 수. 메모리 사용량의 상한을 결정합니다.
+PIPELINE_QUEUE_SIZE = 2
+
+# --- 체크포인트/이어하기 설정 ---
+# 끝난 Geohash 셀, 다방 페이지, 저장된 상세 정보 청크를 기록해 두고 --resume 실행 시 건너뜁니다.
+CHECKPOINT_PATH = os.path.join(OUTPUT_BASE_DIR, "crawl_checkpoint.sqlite3")
+CHECKPOINT_FLUSH_SECONDS = 5 # 마지막 기록 후 이 시간이 지나면 모아 둔 체크포인트를 디스크에 씀
+CHECKPOINT_FLUSH_UNITS = 50 # 모아 둔 작업 단위가 이 개수가 되면 디스크에 씀
+
+# --- 수집 작업 오케스트레이션 설정 ---
+# (플랫폼, 매물 유형, 지역) 조합 하나가 작업 하나이며, 최대 이 개수만큼의 작업을 동시에 실행합니다.
+# 호스트별 요청 속도는 rate limiter가 따로 제한하므로, 이 값은 서로 다른 플랫폼/지역을 겹쳐 실행하기 위한 것입니다.
+CRAWL_MAX_CONCURRENT_JOBS = 4
+
+# --- 샤드 분산 수집 설정 ---
+# BBOX를 Geohash 셀(샤드)로 나눠 SQLite 작업 큐에 넣고, 여러 작업자 프로세스(다른 머신 포함)가 임대(lease)해 처리합니다.
+# 작업자 프로세스마다 자체 rate limiter를 가지므로, 호스트에 가는 총 요청 속도는 작업자 수에 비례해 늘어납니다.
+SHARD_QUEUE_PATH = os.path.join(OUTPUT_BASE_DIR, "shard_queue.sqlite3")
+SHARD_GEOHASH_PRECISION = 5 # 샤드 하나의 크기 (5자리 ≈ 4.9km x 4.9km 셀)
+SHARD_DETAIL_CHUNK_SIZE = 1000 # 상세 정보 단계에서 샤드 하나에 담을 매물 수
+SHARD_LEASE_SECONDS = 60 # 임대 기한. 이 시간 동안 heartbeat가 없으면 다른 작업자가 샤드를 다시 가져감
+SHARD_MAX_ATTEMPTS = 3 # 샤드 하나를 최대 몇 번까지 시도할지
+SHARD_POLL_INTERVAL = 1.0 # 빌려 갈 샤드가 없을 때 다시 확인하기까지 기다리는 시간(초)
+SHARD_WORKER_PROCESSES = 4 # run_sharded()가 로컬에서 띄울 작업자 프로세스 수
+SHARD_PHASE_STALL_SECONDS = 120 # 로컬 작업자가 모두 끝났고 처리 중인 샤드도 없는 상태가 이 시간 동안 이어지면 남은 샤드를 실패로 처리
+
+# --- 저장 형식 설정 ---
+# "parquet": 플랫폼/수집일/geohash 앞자리로 파티션된 Parquet 데이터셋 (pyarrow 필요)
+# "csv": 기존 utf-8-sig CSV 파일 (내보내기용)
+DEFAULT_OUTPUT_FORMAT = "parquet"
+PARQUET_OUTPUT_DIR = os.path.join(OUTPUT_BASE_DIR, "listings_parquet")
+PARQUET_COMPRESSION = "zstd"
+PARQUET_GEOHASH_PREFIX_PRECISION = 5 # 파티션에 사용할 geohash 앞자리 길이 (5자리 ≈ 4.9km 셀)
+PARQUET_FLUSH_ROWS = 50000 # 스트리밍 저장 시 이 행 수만큼 모아서 한 번에 기록 (작은 파일이 많아지는 것 방지)
+CSV_CARRY_OVER_CHUNK_ROWS = 50000 # 증분 수집 CSV 저장 시 이전 출력 파일에서 바뀌지 않은 행을 옮겨 올 때 한 번에 읽는 행 수
+
+# --- 공용 HTTP 전송 계층 설정 ---
+# 모든 API 클라이언트와 이미지 다운로더가 하나의 세션(커넥션 풀)을 공유합니다.
+HTTP_POOL_CONNECTIONS = 20 # 커넥션 풀을 유지할 호스트 수
+HTTP_POOL_MAXSIZE = 16 # 호스트별 기본 커넥션 풀 크기 (클라이언트가 호스트별로 더 크게 지정할 수 있음)
+HTTP2_ENABLED = False # True이고 httpx[http2]가 설치되어 있으면 HTTPS 요청을 HTTP/2로 보냄
+DNS_CACHE_TTL_SECONDS = 300 # DNS 조회 결과를 캐시할 시간(초). 0이면 캐시하지 않음
+# True이면 검색/상세/다방 목록 응답에서 변환에 쓰는 필드만 __slots__ 레코드로 꺼내 변환기에 넘김
+# (orjson이 설치되어 있으면 JSON 파싱에도 사용)
+TYPED_DECODING_ENABLED = True
+
+# --- 대시보드 설정 ---
+DASHBOARD_JOBS_PATH = os.path.join(OUTPUT_BASE_DIR, "dashboard_jobs.sqlite3") # 백그라운드 수집 작업 상태/결과 기록
+DASHBOARD_JOB_WORKERS = 2 # 대시보드 서버 프로세스에서 동시에 실행할 수 있는 수집 작업 수
+DASHBOARD_CACHE_TTL_SECONDS = 300 # 저장된 매물 조회 결과를 캐시할 시간(초)
+DASHBOARD_POLL_SECONDS = 2 # 수집 작업이 진행 중일 때 화면을 다시 그리는 간격(초)
+
+# --- 지도 렌더링 설정 ---
+# 지도 줌 레벨별로 매물을 묶을 Geohash 정밀도. 줌이 커질수록(확대할수록) 더 작은 셀로 묶음
+MAP_ZOOM_GEOHASH_PRECISION = {10: 4, 12: 5, 14: 6, 16: 7}
+MAP_MARKER_MIN_ZOOM = 17 # 이 줌 레벨 이상에서만 매물을 개별 마커로 표시
+MAP_MAX_MARKERS = 500 # 화면 안 매물이 이보다 많으면 확대해도 셀 단위로 묶어서 표시
+
+# --- 플랫폼 간 중복 매물 통합 설정 ---
+DEDUP_ENABLED = True
+# 후보 매물을 묶는 Geohash 정밀도. 같은 셀과 주변 8개 셀의 매물끼리만 비교하므로
+# 셀 크기(정밀도 7 ≈ 150m x 120m)가 DEDUP_MAX_DISTANCE_M보다 커야 후보를 놓치지 않음
+DEDUP_GEOHASH_PRECISION = 7
+DEDUP_MAX_DISTANCE_M = 100 # 이보다 멀리 떨어진 매물은 같은 매물로 보지 않음
+DEDUP_AREA_TOLERANCE = 0.15 # 면적 차이가 이 비율을 넘으면 면적 점수 0
+DEDUP_PRICE_TOLERANCE = 0.2 # 가격 차이가 이 비율을 넘으면 가격 점수 0
+# 항목별 가중치. 값이 없는 항목은 빼고 나머지 가중치로 다시 정규화
+DEDUP_SCORE_WEIGHTS = {"distance": 0.15, "address": 0.15, "area": 0.3, "floor": 0.15, "price": 0.25}
+DEDUP_MIN_EVIDENCE_WEIGHT = 0.5 # 값이 있는 항목의 가중치 합이 이보다 작으면 판단하지 않음
+DEDUP_MATCH_THRESHOLD = 0.8 # 이 점수 이상인 후보 쌍을 같은 매물로 판단
+UNIFIED_OUTPUT_CSV_PATH = os.path.join(OUTPUT_BASE_DIR, "unified", "unified_listings_{region}.csv")
+
+# --- 실행 지표(metrics) 설정 ---
+# MainContainer.run이 끝날 때 지표를 기록하는 파일. 확장자가 .prom이면 Prometheus 텍스트 형식, 그 외에는 JSON
+METRICS_OUTPUT_PATH = os.path.join(OUTPUT_BASE_DIR, "metrics", "crawl_metrics.json")
+# 지연 시간 히스토그램 구간 경계(초)
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
@@ -1,4 +1,6 @@
 # platform_configs/zigbang_config.py
+import os
+from platform_configs.general_config import DEFAULT_RATE_LIMIT, DEFAULT_HEDGING, OUTPUT_BASE_DIR
 
 # 직방 API의 기본 URL
 ZIGBANG_API_BASE_URL = "https://apis.zigbang.com" # 이 줄을 https://apis.zigbang.com으로 수정했습니다.
@@ -24,3 +26,46 @@ ZIGBANG_DEFAULT_PARAMS = {
     "checkAnyItemWithoutFilter": True,
     "zoom": 6 # Geohash 생성에 사용되는 줌 레벨 (이 값은 API의 특성에 따라 유지)
 }
+
+# 상세 정보(/v3/items/list) 요청 시 한 번에 묶어 보낼 매물 ID 개수 (묶음 크기 자동 조절을 끄면 항상 이 값 사용)
+ZIGBANG_DETAIL_CHUNK_SIZE = 100
+
+# 상세 정보 묶음 크기 자동 조절: 응답이 target_latency초 안에 오면 키우고, 늦거나 실패하면 줄임 (AIMD)
+# 실패한 묶음은 반으로 나눠 다시 요청하며, 매물 하나만 남을 때까지 실패하면 그 ID만 건너뜀
+ZIGBANG_DETAIL_CHUNK_SIZING = {
+    "enabled": True,
+    "initial_size": ZIGBANG_DETAIL_CHUNK_SIZE,
+    "min_size": 10,
+    "max_size": 500,
+    "target_latency": 1.0,
+    "additive_increase": 20,
+    "multiplicative_decrease": 0.5,
+}
+
+# 상세 정보 요청을 동시에 최대 몇 개까지 보낼지 (동시 요청 상한)
+ZIGBANG_DETAIL_MAX_CONCURRENCY = 8
+
+# Geohash 타일링 설정
+# 처음에는 MIN 정밀도 셀로 BBOX 전체를 덮고, 응답이 포화된 셀만 MAX 정밀도까지 32개 하위 셀로 분할
+ZIGBANG_GEOHASH_MIN_PRECISION = 5
+ZIGBANG_GEOHASH_MAX_PRECISION = 8
+
+# /v2/search 한 번의 응답으로 반환되는 최대 매물 수 (이 값에 도달하면 셀이 포화된 것으로 판단)
+# 실제 API 응답을 보고 조정 필요
+ZIGBANG_SEARCH_ITEM_CAP = 500
+
+# 직방 API 호스트의 요청 속도 제한 설정 (공통 설정을 기반으로 필요한 값만 덮어씀)
+ZIGBANG_RATE_LIMIT = {**DEFAULT_RATE_LIMIT, "initial_rate": 2.0, "max_rate": 20.0, "burst": 4}
+
+# 직방 API 헤지 요청 설정 (느린 요청의 꼬리 지연을 줄이고 싶을 때 enabled를 True로 변경)
+ZIGBANG_HEDGING = {**DEFAULT_HEDGING, "enabled": False}
+
+# 직방 수집 결과 저장 경로 ({item_type}에 매물 유형, {region}에 수집 지역 이름이 들어감)
+ZIGBANG_OUTPUT_CSV_PATH = os.path.join(OUTPUT_BASE_DIR, "zigbang", "zigbang_{item_type}_{region}.csv")
+# 직방 매물 이미지 저장 기본 디렉토리
+ZIGBANG_IMAGE_BASE_DIR = os.path.join(OUTPUT_BASE_DIR, "zigbang", "images")
+
+# 이미지 다운로드 설정
+ZIGBANG_IMAGE_DOWNLOAD_WORKERS = 16 # 전체 동시 다운로드 수
+ZIGBANG_IMAGE_PER_HOST_CONCURRENCY = 4 # 이미지 호스트 하나당 동시 다운로드 수
+ZIGBANG_IMAGE_STREAM_CHUNK_SIZE = 64 * 1024 # 응답 본문을 파일에 나누어 쓸 때의 조각 크기(bytes)
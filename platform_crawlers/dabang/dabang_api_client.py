@@ -3,27 +3,43 @@
 import requests
 import json
 from common_utils.logger_setup import setup_logger
-from platform_configs.dabang_config import DABANG_API_BASE_URL, DABANG_DEFAULT_PAYLOAD
+from common_utils.http_request import RequestExecutor
+from common_utils.http_transport import get_shared_session, configure_host_pool, build_request_headers
+from common_utils.response_cache import get_response_cache
+from common_utils.response_records import decode_dabang_rooms
+from platform_configs.general_config import HTTP_CACHE_ENABLED, TYPED_DECODING_ENABLED
+from platform_configs.dabang_config import DABANG_API_BASE_URL, DABANG_DEFAULT_PAYLOAD, DABANG_PAGE_FETCH_WINDOW, DABANG_RATE_LIMIT, DABANG_HEDGING
 
 class DabangApiClient:
-    def __init__(self, log_level="INFO", log_file=None):
+    def __init__(self, log_level="INFO", log_file=None, max_concurrency=DABANG_PAGE_FETCH_WINDOW):
         self.logger = setup_logger(self.__class__.__name__, log_level, log_file)
         self.base_url = DABANG_API_BASE_URL
-        self.headers = {
+        self.headers = build_request_headers({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Accept": "application/json, text/plain, */*",
             "Accept-Encoding": "gzip, deflate, br",
             "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7"
-        }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        })
+        # 페이지를 동시에 요청하므로 공용 세션에서 이 호스트의 커넥션 풀을 윈도우 크기만큼 확보
+        self.session = get_shared_session()
+        configure_host_pool(self.base_url, max_concurrency)
+        self.requester = RequestExecutor(
+            self.session, self.logger, rate_limit_config=DABANG_RATE_LIMIT, hedging=DABANG_HEDGING,
+            response_cache=get_response_cache() if HTTP_CACHE_ENABLED else None,
+            headers=self.headers
+        )
         self.logger.info("DabangApiClient initialized.")
 
-    def _make_request(self, method, url, params=None, json_data=None):
+    def _make_request(self, method, url, params=None, json_data=None, use_cache=True, decoder=None):
         try:
-            response = self.session.request(method, url, params=params, json=json_data, timeout=10)
+            # 요청 속도 제한, 재시도, 회로 차단기, 헤지 요청, 응답 캐시는 공용 요청 계층에서 처리
+            response = self.requester.request(method, url, use_cache=use_cache, params=params, json=json_data)
             response.raise_for_status() # Raises HTTPError for bad responses (4xx or 5xx)
-            return response.json()
+            # decoder가 있으면 변환에 쓰는 필드만 레코드로 꺼냄 (TYPED_DECODING_ENABLED)
+            return decoder(response.content) if decoder else response.json()
+        # requests의 JSONDecodeError는 RequestException의 하위 클래스이므로 먼저 처리해야 응답 상태와 본문이 로그에 남음
+        except json.JSONDecodeError as json_err:
+            self.logger.error(f"Failed to decode JSON from response: {json_err}. Response text (first 500 chars): {response.text[:500]}...")
         except requests.exceptions.HTTPError as http_err:
             self.logger.error(f"HTTP error occurred: {http_err} - Status: {response.status_code}, Response: {response.text}")
         except requests.exceptions.ConnectionError as conn_err:
@@ -32,8 +48,6 @@ class DabangApiClient:
             self.logger.error(f"Timeout error occurred: {timeout_err}")
         except requests.exceptions.RequestException as req_err:
             self.logger.error(f"An error occurred during the request: {req_err}")
-        except json.JSONDecodeError as json_err:
-            self.logger.error(f"Failed to decode JSON from response: {json_err}. Response text (first 500 chars): {response.text[:500]}...")
         return None
 
     # get_rooms_list_by_bbox 메서드가 BBOX 인자와 줌 레벨, 페이지를 받도록 수정
@@ -56,13 +70,16 @@ class DabangApiClient:
             # "longitude": (lng_min + lng_max) / 2, # 지도의 중심 경도
         })
         
-        self.logger.info(f"Requesting Dabang rooms for page {page} with BBOX: ({lat_min}, {lng_min}) to ({lat_max}, {lng_max}) at zoom {zoom}")
-        return self._make_request("GET", url, params=params)
+        # 요청마다 실행되는 경로이므로 메시지 포맷팅은 로그가 실제로 남을 때만 하도록 인자로 넘김
+        self.logger.info("Requesting Dabang rooms for page %s with BBOX: (%s, %s) to (%s, %s) at zoom %s",
+                         page, lat_min, lng_min, lat_max, lng_max, zoom)
+        return self._make_request("GET", url, params=params,
+                                  decoder=decode_dabang_rooms if TYPED_DECODING_ENABLED else None)
 
     def get_room_details(self, room_id):
         """
         단일 방에 대한 상세 정보를 가져옵니다.
         """
         url = f"{self.base_url}/room/{room_id}" # 예시 URL
-        self.logger.debug(f"Requesting details for room ID: {room_id}")
+        self.logger.debug("Requesting details for room ID: %s", room_id)
         return self._make_request("GET", url)
@@ -1,9 +1,14 @@
 # platform_crawlers/dabang/dabang_collector.py
 
-import time
+from concurrent.futures import ThreadPoolExecutor
 from common_utils.logger_setup import setup_logger
+from common_utils.id_set import IdSet
+from common_utils.listing_index import listing_fingerprint
+from common_utils.metrics import get_metrics
 from platform_crawlers.dabang.dabang_api_client import DabangApiClient
-from platform_configs.dabang_config import DABANG_DEFAULT_PAYLOAD, DABANG_DEFAULT_MAX_PAGES, DABANG_DEFAULT_ZOOM_LEVEL
+from platform_configs.dabang_config import (
+    DABANG_DEFAULT_PAYLOAD, DABANG_DEFAULT_MAX_PAGES, DABANG_DEFAULT_ZOOM_LEVEL, DABANG_PAGE_FETCH_WINDOW
+)
 
 class DabangCollector:
     def __init__(self, log_level="INFO", log_file=None):
@@ -11,39 +16,129 @@ class DabangCollector:
         self.api_client = DabangApiClient(log_level=log_level, log_file=log_file)
         self.logger.info("DabangCollector initialized.")
 
+    def _fetch_rooms_page(self, lat_min, lat_max, lng_min, lng_max, page):
+        self.logger.debug("Requesting Dabang rooms for page %s with BBOX: (%s, %s) to (%s, %s)", page, lat_min, lng_min, lat_max, lng_max)
+        # DabangApiClient.get_rooms_list_by_bbox() 호출 시 BBOX 인자와 줌 레벨 전달
+        return self.api_client.get_rooms_list_by_bbox(
+            lat_min=lat_min,
+            lat_max=lat_max,
+            lng_min=lng_min,
+            lng_max=lng_max,
+            zoom=DABANG_DEFAULT_ZOOM_LEVEL, # 설정 파일에서 가져온 줌 레벨 사용
+            page=page
+        )
+
+    def _detect_last_page(self, data):
+        """
+        첫 페이지 응답에 전체 페이지 수 정보가 있으면 마지막 페이지 번호를 반환합니다.
+        정보가 없으면 None을 반환하며, 이 경우 첫 번째 빈 페이지에서 수집을 멈춥니다.
+        """
+        for key in ('last_page', 'total_page', 'totalPage'):
+            value = data.get(key)
+            if isinstance(value, int) and value > 0:
+                return value
+        return None
+
     # collect_rooms_data_by_area 메서드가 BBOX 인자를 받도록 수정
     def collect_rooms_data_by_area(self, lat_min, lat_max, lng_min, lng_max):
+        """
+        BBOX 안의 room ID를 IdSet으로 반환합니다.
+        """
+        return IdSet(self.collect_rooms_by_area(lat_min, lat_max, lng_min, lng_max))
+
+    def collect_room_fingerprints_by_area(self, lat_min, lat_max, lng_min, lng_max, checkpoint=None, failed_pages=None):
+        """
+        BBOX 안의 room ID와 목록 응답 내용으로 만든 지문을 {room ID: 지문} 형태로 반환합니다.
+        지문은 증분 수집에서 상세 정보를 다시 받아야 하는지 판단하는 데 사용됩니다.
+        """
+        rooms = self.collect_rooms_by_area(lat_min, lat_max, lng_min, lng_max, checkpoint=checkpoint, failed_pages=failed_pages)
+        return {room_id: listing_fingerprint(room) for room_id, room in rooms.items()}
+
+    def collect_rooms_by_area(self, lat_min, lat_max, lng_min, lng_max, checkpoint=None, failed_pages=None):
+        """
+        BBOX 안의 매물을 {room ID: 목록 응답의 room 데이터} 형태로 반환합니다.
+        다방은 목록 응답에 변환에 필요한 필드가 모두 들어 있으므로, 이 값을 그대로 변환/저장 단계에 넘길 수 있습니다.
+        failed_pages(리스트)가 주어지면 요청이 실패해 수집을 멈춘 페이지 번호를 추가합니다. (iter_room_pages 참고)
+        """
         self.logger.info(f"Collecting Dabang room data for Lat:[{lat_min}-{lat_max}], Lng:[{lng_min}-{lng_max}]")
-        
-        all_room_ids = set()
-        current_page = 1
-        
-        while current_page <= DABANG_DEFAULT_MAX_PAGES:
-            self.logger.debug(f"Requesting Dabang rooms for page {current_page} with BBOX: ({lat_min}, {lng_min}) to ({lat_max}, {lng_max})")
-            
-            # DabangApiClient.get_rooms_list_by_bbox() 호출 시 BBOX 인자와 줌 레벨 전달
-            data = self.api_client.get_rooms_list_by_bbox(
-                lat_min=lat_min,
-                lat_max=lat_max,
-                lng_min=lng_min,
-                lng_max=lng_max,
-                zoom=DABANG_DEFAULT_ZOOM_LEVEL, # 설정 파일에서 가져온 줌 레벨 사용
-                page=current_page
-            )
-            
-            if data and data.get('rooms'):
-                for room in data['rooms']:
-                    if 'id' in room:
-                        all_room_ids.add(room['id'])
-                
-                current_page += 1
-                time.sleep(0.5) # 요청 간격
-            else:
-                self.logger.info(f"No more Dabang rooms found or an error occurred on page {current_page}.")
-                break
-                
-        self.logger.info(f"Collected {len(all_room_ids)} unique Dabang room IDs.")
-        return list(all_room_ids)
+
+        all_rooms = {}
+        with get_metrics().track_stage("list", platform="dabang") as stage:
+            for rooms in self.iter_room_pages(lat_min, lat_max, lng_min, lng_max, checkpoint=checkpoint, failed_pages=failed_pages):
+                for room in rooms:
+                    # room은 딕셔너리 또는 DabangRoom 레코드 (둘 다 get을 지원)
+                    room_id = room.get('id')
+                    if room_id is not None:
+                        all_rooms[room_id] = room
+            stage.add(len(all_rooms))
+
+        self.logger.info(f"Collected {len(all_rooms)} unique Dabang room IDs.")
+        return all_rooms
+
+    def iter_room_pages(self, lat_min, lat_max, lng_min, lng_max, checkpoint=None, failed_pages=None):
+        """
+        BBOX의 목록 페이지를 순서대로 하나씩(rooms 리스트) 생성합니다.
+
+        페이지를 DABANG_PAGE_FETCH_WINDOW개씩 미리 동시에 요청하되, 결과는 페이지 순서대로 내보냅니다.
+        순서대로 처리하다가 빈 페이지(또는 오류)를 만나면 그 뒤의 요청은 취소하므로,
+        수집되는 room ID는 한 페이지씩 순차로 요청하던 방식과 동일합니다.
+
+        checkpoint(CheckpointScope)가 주어지면 받은 페이지를 기록하고, 이미 기록된 페이지는 다시 요청하지 않습니다.
+        failed_pages(리스트)가 주어지면 빈 페이지가 아니라 요청 실패로 멈춘 경우 그 페이지 번호를 추가합니다.
+        이때 그 뒤 페이지의 매물은 수집되지 않았으므로 목록이 완전하지 않습니다.
+        """
+        known_pages = checkpoint.load() if checkpoint else {}
+        if known_pages:
+            self.logger.info(f"Resuming from checkpoint: {len(known_pages)} Dabang pages already collected.")
+
+        def fetch_page(page):
+            if str(page) in known_pages:
+                return known_pages[str(page)]
+            data = self._fetch_rooms_page(lat_min, lat_max, lng_min, lng_max, page)
+            if checkpoint and data and data.get('rooms'):
+                # 마지막 페이지 판단에 필요한 값과 rooms만 기록 (빈 페이지/오류는 기록하지 않아 다시 요청)
+                checkpoint.record(str(page), {"rooms": data['rooms'], "last_page": self._detect_last_page(data)})
+            return data
+
+        last_page = DABANG_DEFAULT_MAX_PAGES
+        data = fetch_page(1)
+        if data and data.get('rooms'):
+            # 첫 응답으로 마지막 페이지를 알 수 있으면 그 이후 페이지는 요청하지 않음
+            last_page = min(self._detect_last_page(data) or DABANG_DEFAULT_MAX_PAGES, DABANG_DEFAULT_MAX_PAGES)
+            self.logger.debug(f"Dabang pagination will stop at page {last_page} at the latest.")
+
+        with ThreadPoolExecutor(max_workers=DABANG_PAGE_FETCH_WINDOW) as executor:
+            pending = {}
+            next_page_to_submit = 2
+            current_page = 1
+
+            try:
+                while data and data.get('rooms'):
+                    yield data['rooms']
+
+                    current_page += 1
+                    if current_page > last_page:
+                        break
+
+                    # 윈도우가 찰 때까지 다음 페이지들을 미리 요청
+                    while next_page_to_submit <= last_page and len(pending) < DABANG_PAGE_FETCH_WINDOW:
+                        pending[next_page_to_submit] = executor.submit(fetch_page, next_page_to_submit)
+                        next_page_to_submit += 1
+
+                    data = pending.pop(current_page).result()
+                else:
+                    if data is None:
+                        self.logger.warning(f"Dabang page {current_page} failed; the room list for this area is incomplete.")
+                        if failed_pages is not None:
+                            failed_pages.append(current_page)
+                    else:
+                        self.logger.info(f"No more Dabang rooms found on page {current_page}.")
+            finally:
+                # 마지막 페이지 이후로 미리 보낸 요청은 취소 (이미 진행 중인 요청의 결과는 버림)
+                for future in pending.values():
+                    future.cancel()
+                if checkpoint:
+                    checkpoint.flush()
 
     def collect_room_details(self, room_ids):
         """
@@ -2,27 +2,68 @@
 
 import requests
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from urllib.parse import urlparse
 from common_utils.logger_setup import setup_logger
-from platform_configs.zigbang_config import ZIGBANG_API_BASE_URL, ZIGBANG_DEFAULT_HEADERS, ZIGBANG_DEFAULT_PARAMS
+from common_utils.adaptive_batch import AdaptiveBatchSizer
+from common_utils.http_request import RequestExecutor, get_circuit_breaker
+from common_utils.metrics import get_metrics
+from common_utils.http_transport import get_shared_session, configure_host_pool, build_request_headers
+from common_utils.response_cache import get_response_cache
+from common_utils.response_records import decode_zigbang_search, decode_zigbang_item_list
+from platform_configs.general_config import HTTP_CACHE_ENABLED, TYPED_DECODING_ENABLED
+from platform_configs.zigbang_config import (
+    ZIGBANG_API_BASE_URL, ZIGBANG_DEFAULT_HEADERS, ZIGBANG_DEFAULT_PARAMS,
+    ZIGBANG_DETAIL_CHUNK_SIZE, ZIGBANG_DETAIL_CHUNK_SIZING, ZIGBANG_DETAIL_MAX_CONCURRENCY, ZIGBANG_RATE_LIMIT, ZIGBANG_HEDGING
+)
+
+# 묶음에 담은 매물이 너무 많다는 신호로 볼 상태 코드 (요청 본문이 너무 큼, 게이트웨이 타임아웃)
+CHUNK_TOO_LARGE_STATUS_CODES = (413, 504)
+# 묶음 안의 특정 매물 ID 때문에 생길 수 있는 상태 코드 (잘못된 요청, 없는 매물, 처리할 수 없는 값)
+BAD_ITEM_STATUS_CODES = (400, 404, 422)
+
 
 class ZigbangApiClient:
-    def __init__(self, log_level="INFO", log_file=None):
+    def __init__(self, log_level="INFO", log_file=None, max_concurrency=ZIGBANG_DETAIL_MAX_CONCURRENCY):
         self.logger = setup_logger(self.__class__.__name__, log_level, log_file)
         self.base_url = ZIGBANG_API_BASE_URL
+        self.max_concurrency = max_concurrency
         self.logger.debug(f"DEBUG_INIT: ZigbangApiClient base_url is set to: {self.base_url}")
-        self.session = requests.Session()
-        self.session.headers.update(ZIGBANG_DEFAULT_HEADERS)
+        # 프로세스 공용 세션을 사용하고, 동시 요청 수만큼 이 호스트의 커넥션 풀 크기를 맞춤
+        self.session = get_shared_session()
+        configure_host_pool(self.base_url, max_concurrency)
+        self.requester = RequestExecutor(
+            self.session, self.logger, rate_limit_config=ZIGBANG_RATE_LIMIT, hedging=ZIGBANG_HEDGING,
+            response_cache=get_response_cache() if HTTP_CACHE_ENABLED else None,
+            headers=build_request_headers(ZIGBANG_DEFAULT_HEADERS)
+        )
+        # 상세 정보 묶음 크기는 이 클라이언트를 함께 쓰는 모든 작업이 같이 조절함
+        sizing = {key: value for key, value in ZIGBANG_DETAIL_CHUNK_SIZING.items() if key != "enabled"}
+        self.chunk_sizer = AdaptiveBatchSizer(**sizing) if ZIGBANG_DETAIL_CHUNK_SIZING["enabled"] else None
         self.logger.info("ZigbangApiClient initialized.")
 
-    def _make_request(self, method, url, params=None, json_data=None):
+    def _make_request(self, method, url, params=None, json_data=None, use_cache=True, decoder=None, on_response=None):
         try:
-            response = self.session.request(method, url, params=params, json=json_data, timeout=10)
+            # 요청 속도 제한, 재시도, 회로 차단기, 헤지 요청, 응답 캐시는 공용 요청 계층에서 처리
+            response = self.requester.request(method, url, use_cache=use_cache, params=params, json=json_data)
+            if on_response:
+                on_response(response)
             response.raise_for_status()
 
             if response.status_code == 204:
-                self.logger.info(f"[{response.status_code}] No content (no items) found for: {url} with params: {params}")
+                # 요청마다 실행되는 경로이므로 메시지 포맷팅은 로그가 실제로 남을 때만 하도록 인자로 넘김
+                self.logger.info("[204] No content (no items) found for: %s", url)
+                self.logger.debug("[204] Request params: %s", params)
                 return []
-            return response.json()
+            # decoder가 있으면 변환에 쓰는 필드만 레코드로 꺼냄 (TYPED_DECODING_ENABLED)
+            return decoder(response.content) if decoder else response.json()
+        # requests의 JSONDecodeError는 RequestException의 하위 클래스이므로 먼저 처리해야 응답 상태와 본문이 로그에 남음
+        except json.JSONDecodeError as json_err:
+            response_text_snippet = response.text[:500] if response else "No response text"
+            response_status_code = response.status_code if response else "N/A"
+            self.logger.error(f"Failed to decode JSON from response: {json_err}. Response status: {response_status_code}, Response text (first 500 chars): {response_text_snippet}...")
         except requests.exceptions.HTTPError as http_err:
             response_text_snippet = response.text[:500] if response else "No response text"
             response_status_code = response.status_code if response else "N/A"
@@ -31,16 +72,14 @@ class ZigbangApiClient:
             self.logger.error(f"Connection error occurred: {conn_err}")
         except requests.exceptions.Timeout as timeout_err:
             self.logger.error(f"Timeout error occurred: {timeout_err}")
-        except json.JSONDecodeError as json_err:
-            response_text_snippet = response.text[:500] if response else "No response text"
-            response_status_code = response.status_code if response else "N/A"
-            self.logger.error(f"Failed to decode JSON from response: {json_err}. Response status: {response_status_code}, Response text (first 500 chars): {response_text_snippet}...")
+        except requests.exceptions.RequestException as req_err:
+            self.logger.error(f"An error occurred during the request: {req_err}")
         return None
 
     def get_items_by_geohash(self, geohash, item_type, lat_min, lat_max, lng_min, lng_max):
         # API URL 구성: /v2/items/{item_type} 대신 /v2/search를 사용
         url = f"{self.base_url}/v2/search" # 이 줄을 /v2/search로 수정합니다.
-        self.logger.debug(f"DEBUG_GET_ITEMS: Requesting URL constructed as: {url}")
+        self.logger.debug("DEBUG_GET_ITEMS: Requesting URL constructed as: %s", url)
 
         # ZIGBANG_DEFAULT_PARAMS와 전달된 BBOX 파라미터를 결합하여 요청 파라미터 생성
         params = ZIGBANG_DEFAULT_PARAMS.copy()
@@ -53,35 +92,129 @@ class ZigbangApiClient:
             "serviceType": item_type, # item_type을 URL 경로가 아닌 파라미터로 추가
         })
 
-        self.logger.info(f"Requesting item list for {item_type} with geohash: {geohash}")
-        return self._make_request("GET", url, params=params)
+        self.logger.info("Requesting item list for %s with geohash: %s", item_type, geohash)
+        return self._make_request("GET", url, params=params,
+                                  decoder=decode_zigbang_search if TYPED_DECODING_ENABLED else None)
 
-    def get_item_details_by_ids(self, item_ids):
+    def _request_details_chunk(self, chunk, on_response=None):
+        """
+        매물 ID 묶음 하나에 대한 상세 정보를 요청합니다. 실패하면 None을 반환합니다.
+        """
+        url = f"{self.base_url}/v3/items/list"
+        self.logger.debug("DEBUG_GET_DETAILS: Requesting URL constructed as: %s with %d item IDs", url, len(chunk))
+
+        # POST 요청 본문에 itemIds 포함
+        json_data = {"itemIds": chunk}
+
+        self.logger.info("Requesting details for %d items.", len(chunk))
+        return self._make_request("POST", url, json_data=json_data, on_response=on_response,
+                                  decoder=decode_zigbang_item_list if TYPED_DECODING_ENABLED else None)
+
+    def _fetch_details(self, chunk, failed_ids):
+        """
+        매물 ID 묶음 하나의 상세 정보 목록을 반환하고, 응답 시간/실패를 묶음 크기 조절에 반영합니다.
+        특정 ID나 묶음 크기 때문에 실패했을 수 있으면(BAD_ITEM_STATUS_CODES, CHUNK_TOO_LARGE_STATUS_CODES, 타임아웃/연결 오류)
+        묶음을 반으로 나눠 다시 요청해(재귀), 문제가 되는 ID만 빼고 나머지 매물은 모두 받습니다.
+        401/403(권한), 429(요청 제한)와 그 밖의 5xx는 나눠 보내도 모든 요청이 같은 이유로 실패하므로 묶음 전체를 포기합니다.
+        (429는 요청 계층이 재시도하면서 이미 요청 제한기의 속도를 낮추고 Retry-After만큼 멈췄음)
+        끝내 받지 못한 ID는 failed_ids에 추가합니다.
+        """
+        responses = []
+        data = self._request_details_chunk(chunk, on_response=responses.append)
+        response = responses[-1] if responses else None
+        if data is not None:
+            # 캐시에서 꺼낸 응답은 서버 응답 시간을 알 수 없으므로 크기 조절에 쓰지 않음
+            if self.chunk_sizer and response is not None and not getattr(response, "from_cache", False):
+                self.chunk_sizer.record_success(len(chunk), response.elapsed.total_seconds())
+            return data['items'] if data and data.get('items') else []
+
+        breaker = get_circuit_breaker(urlparse(self.base_url).netloc, self.requester.circuit_breaker_config)
+        circuit_open = breaker.state == "open"
+        status = response.status_code if response is not None else None
+        # 타임아웃/연결 오류, 413, 504는 묶음이 너무 크다는 신호로 보고 줄임 (400 등은 특정 ID의 문제일 수 있으므로 크기는 그대로)
+        too_large = status is None or status in CHUNK_TOO_LARGE_STATUS_CODES
+        if self.chunk_sizer and not circuit_open and too_large:
+            self.chunk_sizer.record_failure(len(chunk))
+        # 회로 차단기가 열려 있으면 나눠서 보내도 요청이 나가지 않으므로 묶음 전체를 실패로 처리
+        if len(chunk) == 1 or circuit_open or not (too_large or status in BAD_ITEM_STATUS_CODES):
+            self.logger.error(
+                f"Giving up on details for {len(chunk)} items after the request failed "
+                f"(status: {status or 'no response'}, first ID: {chunk[0]})."
+            )
+            get_metrics().increment("detail_failed_items_total", len(chunk), platform="zigbang", status=status or "none")
+            failed_ids.extend(chunk)
+            return []
+
+        half = len(chunk) // 2
+        self.logger.warning(f"Detail request for {len(chunk)} items failed; retrying as chunks of {half} and {len(chunk) - half} items.")
+        get_metrics().increment("detail_chunk_bisections_total", platform="zigbang")
+        return self._fetch_details(chunk[:half], failed_ids) + self._fetch_details(chunk[half:], failed_ids)
+
+    def _iter_id_chunks(self, item_ids, chunk_size=None):
+        """
+        item_ids를 앞에서부터 묶음으로 나눕니다. chunk_size가 없으면 묶음을 만들 때마다 조절된 현재 크기를 사용합니다.
+        """
+        start = 0
+        while start < len(item_ids):
+            size = chunk_size or self.chunk_sizer.size
+            get_metrics().observe("detail_chunk_size", size, buckets=(10, 25, 50, 100, 200, 300, 500, 1000), platform="zigbang")
+            yield item_ids[start:start + size]
+            start += size
+
+    def iter_item_details_by_ids(self, item_ids, max_concurrency=None, chunk_size=None):
+        """
+        매물 ID를 묶어 요청하고, 묶음별 상세 정보 목록을 입력 순서대로 하나씩 생성(yield)합니다.
+        동시에 진행 중인 요청은 최대 max_concurrency개이며, 소비하는 쪽이 느리면 새 요청을 보내지 않으므로
+        메모리에는 항상 (max_concurrency + 1)개 이하의 묶음만 머무릅니다.
+        chunk_size를 지정하지 않으면 묶음 크기를 응답 시간과 실패에 맞춰 조절합니다(ZIGBANG_DETAIL_CHUNK_SIZING).
+        실패한 묶음은 반으로 나눠 다시 요청하므로, 받지 못하는 매물은 문제가 되는 ID로만 좁혀집니다.
+        (받지 못한 매물은 색인에 상세 정보를 받은 것으로 기록되지 않으므로 다음 증분 수집에서 다시 요청됨)
+        """
         if not item_ids:
             self.logger.info("No item IDs provided for detail collection.")
-            return []
+            return
 
-        # 최대 100개의 ID씩 묶어서 요청
-        # 직방 API가 한 번에 처리할 수 있는 ID 개수 제한에 따라 조정 필요
-        chunk_size = 100
+        max_concurrency = max_concurrency or self.max_concurrency
+        if chunk_size is None and self.chunk_sizer is None:
+            chunk_size = ZIGBANG_DETAIL_CHUNK_SIZE
+        first_chunk_size = chunk_size or self.chunk_sizer.size
+        chunk_count = (len(item_ids) + first_chunk_size - 1) // first_chunk_size
+        worker_count = max(1, min(max_concurrency, chunk_count))
+        self.logger.info(
+            f"Requesting details for {len(item_ids)} items in chunks of {first_chunk_size}"
+            f"{'' if chunk_size else ' (adaptive)'} with concurrency {worker_count}."
+        )
+
+        failed_ids = []
+        chunks = self._iter_id_chunks(item_ids, chunk_size)
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            pending = deque(executor.submit(self._fetch_details, chunk, failed_ids) for chunk in islice(chunks, worker_count))
+            while pending:
+                items = pending.popleft().result()
+                # 결과 하나를 꺼낼 때마다 다음 묶음 요청을 하나 보내 동시 요청 수를 유지
+                next_chunk = next(chunks, None)
+                if next_chunk is not None:
+                    pending.append(executor.submit(self._fetch_details, next_chunk, failed_ids))
+                yield items
+
+        if failed_ids:
+            self.logger.error(f"Could not fetch details for {len(failed_ids)} of {len(item_ids)} items: {failed_ids[:20]}")
+        if self.chunk_sizer:
+            self.logger.info(f"Detail chunk size is now {self.chunk_sizer.size}.")
+
+    def get_item_details_by_ids_concurrent(self, item_ids, max_concurrency=None, chunk_size=None):
+        """
+        매물 ID를 묶어 최대 max_concurrency개의 요청을 동시에 보냅니다.
+        결과는 요청 순서와 관계없이 입력된 ID(묶음) 순서대로 반환합니다.
+        """
         all_details = []
-        for i in range(0, len(item_ids), chunk_size):
-            chunk = item_ids[i:i + chunk_size]
-            # API URL 구성
-            url = f"{self.base_url}/v3/items/list"
-            self.logger.debug(f"DEBUG_GET_DETAILS: Requesting URL constructed as: {url} with {len(chunk)} item IDs")
-
-            # POST 요청 본문에 itemIds 포함
-            json_data = {"itemIds": chunk}
-
-            self.logger.info(f"Requesting details for {len(chunk)} items.")
-            data = self._make_request("POST", url, json_data=json_data)
-            if data and data.get('items'):
-                all_details.extend(data['items'])
-            
-            # 요청 간격 늘리기 (선택 사항)
-            import time
-            time.sleep(0.1)
-
-        self.logger.info(f"Collected details for {len(all_details)} items.")
+        for chunk_items in self.iter_item_details_by_ids(item_ids, max_concurrency=max_concurrency, chunk_size=chunk_size):
+            all_details.extend(chunk_items)
+
+        if item_ids:
+            self.logger.info(f"Collected details for {len(all_details)} items.")
         return all_details
+
+    def get_item_details_by_ids(self, item_ids):
+        # 동시 요청 버전을 그대로 사용 (기존 호출부 호환용)
+        return self.get_item_details_by_ids_concurrent(item_ids)
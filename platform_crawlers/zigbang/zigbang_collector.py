@@ -1,82 +1,148 @@
 # platform_crawlers/zigbang/zigbang_collector.py
-import sys
-print("sys.path:", sys.path)
-import geohash2 as geohash
 import time
 from common_utils.logger_setup import setup_logger
+from common_utils.geohash_utils import geohashes_covering_bbox
+from common_utils.geohash_tiler import GeohashTiler
+from common_utils.id_set import IdSet
+from common_utils.metrics import get_metrics
 from platform_crawlers.zigbang.zigbang_api_client import ZigbangApiClient
+from platform_configs.zigbang_config import (
+    ZIGBANG_GEOHASH_MIN_PRECISION, ZIGBANG_GEOHASH_MAX_PRECISION, ZIGBANG_SEARCH_ITEM_CAP
+)
 
 class ZigbangCollector:
     def __init__(self, log_level="INFO", log_file=None):
         self.logger = setup_logger(self.__class__.__name__, log_level, log_file)
         self.api_client = ZigbangApiClient(log_level=log_level, log_file=log_file)
+        self.last_tiling_stats = {}
         self.logger.info("ZigbangCollector initialized.")
 
     def _generate_geohashes_in_bbox(self, lat_min, lat_max, lng_min, lng_max, precision=6):
         """
-        주어진 BBOX 내에서 Geohash들을 생성합니다.
-        직방 API가 특정 Geohash를 기반으로 데이터를 반환하는 방식에 맞춰야 합니다.
-        현재는 BBOX의 중심 Geohash 하나만 생성하는 예시입니다.
-        실제 서비스의 Geohash 사용 방식에 따라 더 정교한 그리드 생성 로직이 필요할 수 있습니다.
+        주어진 BBOX 전체를 덮는 특정 정밀도의 Geohash들을 균일 격자로 생성합니다.
+        실제 수집은 포화된 셀만 분할하는 GeohashTiler를 사용합니다.
         """
-        geohashes = set()
-        
-        # BBOX의 중심 좌표로 Geohash 생성
-        center_lat = (lat_min + lat_max) / 2
-        center_lng = (lng_min + lng_max) / 2
-        
-        # geohash.encode는 (위도, 경도, 정밀도) 순서입니다.
-        geohash_str = geohash.encode(center_lat, center_lng, precision=precision)
-        geohashes.add(geohash_str)
-
+        geohashes = geohashes_covering_bbox(lat_min, lat_max, lng_min, lng_max, precision)
         self.logger.info(f"Generated {len(geohashes)} unique geohashes for the BBOX at precision {precision}.")
-        return list(geohashes)
+        return geohashes
 
-    def collect_item_ids_by_area(self, lat_min, lat_max, lng_min, lng_max, item_type="villa"):
-        self.logger.info(f"Collecting item IDs for {item_type} in Lat:[{lat_min}-{lat_max}], Lng:[{lng_min}-{lng_max}]")
-        
-        # BBOX 정보를 _generate_geohashes_in_bbox로 전달
-        geohashes_to_crawl = self._generate_geohashes_in_bbox(
-            lat_min=lat_min,
-            lat_max=lat_max,
-            lng_min=lng_min,
-            lng_max=lng_max,
-            precision=6 # 이 정밀도는 ZIGBANG_DEFAULT_PARAMS에 있는 zoom과 연관될 수 있음
+    def _extract_item_ids(self, data):
+        item_ids = []
+        if data and data.get('items'):
+            for item_group in data['items']:
+                if 'itemIds' in item_group:
+                    item_ids.extend(item_group['itemIds'])
+        return item_ids
+
+    def _is_search_response_saturated(self, data):
+        """
+        응답에 담긴 매물 수가 API 반환 상한에 도달했으면 해당 셀에 누락된 매물이 있을 수 있다고 판단합니다.
+        """
+        return len(self._extract_item_ids(data)) >= ZIGBANG_SEARCH_ITEM_CAP
+
+    def collect_item_fingerprints_by_area(self, lat_min, lat_max, lng_min, lng_max, item_type="villa", checkpoint=None,
+                                          failed_cells=None):
+        """
+        증분 수집용으로 {매물 ID: 지문}을 반환합니다.
+        /v2/search 응답에는 매물 ID만 있고 매물별 내용이 없으므로 지문은 항상 None이며,
+        이 경우 ListingIndex는 새로 발견된 매물만 상세 정보 수집 대상으로 돌려줍니다.
+        """
+        item_ids = self.collect_item_ids_by_area(
+            lat_min, lat_max, lng_min, lng_max, item_type=item_type, checkpoint=checkpoint, failed_cells=failed_cells
         )
-        
-        all_item_ids = set()
-        for geohash_code in geohashes_to_crawl:
-            self.logger.debug(f"Requesting item IDs for geohash: {geohash_code}")
+        return dict.fromkeys(item_ids)
+
+    def collect_item_ids_by_area(self, lat_min, lat_max, lng_min, lng_max, item_type="villa", checkpoint=None,
+                                 failed_cells=None):
+        """
+        checkpoint(CheckpointScope)가 주어지면 조회를 마친 셀마다 매물 ID를 기록하고,
+        이미 기록된 셀은 다시 요청하지 않고 기록된 값을 사용합니다.
+        failed_cells(리스트)가 주어지면 요청이 실패한 셀의 Geohash를 추가합니다.
+        하나라도 추가되었다면 반환된 ID는 BBOX의 일부 매물만 담고 있으므로 사라진 매물 판단에 쓰면 안 됩니다.
+
+        매물 ID는 IdSet(정렬된 uint64 배열)으로 반환합니다. 셀마다 받은 ID 목록은 그대로 모아 두었다가
+        마지막에 한 번에 합치므로, 수집 중에도 ID마다 파이썬 set 항목을 만들지 않습니다.
+        """
+        self.logger.info(f"Collecting item IDs for {item_type} in Lat:[{lat_min}-{lat_max}], Lng:[{lng_min}-{lng_max}]")
+        known_cells = checkpoint.load() if checkpoint else {}
+        if known_cells:
+            self.logger.info(f"Resuming from checkpoint: {len(known_cells)} geohash cells already collected.")
+
+        def fetch_cell(geohash_code, cell_bbox):
+            self.logger.debug("Requesting item IDs for geohash: %s", geohash_code)
+            cell_lat_min, cell_lat_max, cell_lng_min, cell_lng_max = cell_bbox
             data = self.api_client.get_items_by_geohash(
                 geohash=geohash_code,
                 item_type=item_type,
-                lat_min=lat_min,
-                lat_max=lat_max,
-                lng_min=lng_min,
-                lng_max=lng_max
+                lat_min=cell_lat_min,
+                lat_max=cell_lat_max,
+                lng_min=cell_lng_min,
+                lng_max=cell_lng_max
             )
-            if data and data.get('items'):
-                for item_group in data['items']:
-                    if 'itemIds' in item_group:
-                        all_item_ids.update(item_group['itemIds'])
-            
-            # 요청 간격 늘리기
-            time.sleep(0.5)
-            
+            return data
+
+        tiler = GeohashTiler(
+            fetch_cell,
+            self._is_search_response_saturated,
+            min_precision=ZIGBANG_GEOHASH_MIN_PRECISION,
+            max_precision=ZIGBANG_GEOHASH_MAX_PRECISION,
+            logger=self.logger
+        )
+
+        metrics = get_metrics()
+        cell_item_ids = []
+        with metrics.track_stage("list", platform="zigbang") as stage:
+            for geohash_code, cell_bbox, data in tiler.tile(lat_min, lat_max, lng_min, lng_max, known_cells=known_cells):
+                if data is None and failed_cells is not None:
+                    failed_cells.append(geohash_code)
+                item_ids = self._extract_item_ids(data)
+                cell_item_ids.append(item_ids)
+                # 실패한 셀(data가 None)은 기록하지 않아 이어하기 때 다시 요청
+                if checkpoint and data is not None and geohash_code not in known_cells:
+                    # 포화 여부 판단에 필요한 매물 ID만 응답과 같은 모양으로 저장
+                    checkpoint.record(geohash_code, {"items": [{"itemIds": item_ids}]})
+            if checkpoint:
+                checkpoint.flush()
+            all_item_ids = IdSet.union_all(cell_item_ids)
+            stage.add(len(all_item_ids))
+        self.last_tiling_stats = tiler.stats
+        for result in ("requests", "saturated_cells", "truncated_cells", "resumed_cells", "failed_cells"):
+            metrics.increment("geohash_tiler_cells_total", tiler.stats.get(result, 0), platform="zigbang", result=result)
+
+        if tiler.stats["failed_cells"]:
+            self.logger.warning(f"{tiler.stats['failed_cells']} geohash cells failed; the Zigbang item ID list is incomplete.")
         self.logger.info(f"Collected {len(all_item_ids)} unique item IDs for Zigbang.")
-        return list(all_item_ids)
+        return all_item_ids
 
     def collect_item_details(self, item_ids):
         """
         수집된 item_ids를 기반으로 상세 정보를 가져옵니다.
-        이 부분은 실제 상세 API 호출 로직으로 채워져야 합니다.
+        상세 요청은 ZigbangApiClient에서 청크 단위로 동시에 처리됩니다.
         """
         if not item_ids:
             self.logger.info("No item IDs to collect details for.")
             return []
 
         self.logger.info(f"Collecting details for {len(item_ids)} Zigbang items...")
-        detailed_items = []
-        # API 클라이언트를 사용하여 상세 정보를 가져오는 로직 구현
-        self.logger.warning("Zigbang item detail collection is not fully implemented. Please implement `get_item_details_by_ids` in ZigbangApiClient.")
+        detailed_items = self.api_client.get_item_details_by_ids(item_ids)
+        self.logger.info(f"Collected details for {len(detailed_items)} Zigbang items.")
         return detailed_items
+
+    def iter_item_details(self, item_ids):
+        """
+        상세 정보를 청크 단위로 생성(yield)합니다. 전체 결과를 메모리에 모으지 않는 스트리밍 수집에 사용합니다.
+        """
+        if not item_ids:
+            self.logger.info("No item IDs to collect details for.")
+            return
+        self.logger.info(f"Streaming details for {len(item_ids)} Zigbang items...")
+        # 다음 청크를 기다린 시간을 상세 정보 수집 단계 시간으로 기록 (소비하는 쪽이 처리하는 시간은 제외)
+        metrics = get_metrics()
+        chunks = self.api_client.iter_item_details_by_ids(item_ids)
+        while True:
+            started = time.perf_counter()
+            chunk = next(chunks, None)
+            if chunk is None:
+                return
+            metrics.record_stage("fetch", time.perf_counter() - started, len(chunk), platform="zigbang")
+            yield chunk
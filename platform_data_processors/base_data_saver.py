@@ -0,0 +1,213 @@
+# platform_data_processors/base_data_saver.py
+import os
+import time
+
+import pandas as pd
+
+from common_utils.logger_setup import setup_logger
+from common_utils.metrics import get_metrics
+from platform_configs.general_config import (
+    DEFAULT_OUTPUT_FORMAT, PARQUET_OUTPUT_DIR, PARQUET_FLUSH_ROWS, CSV_CARRY_OVER_CHUNK_ROWS
+)
+from platform_data_processors.parquet_store import write_partitioned_parquet, is_parquet_available
+
+
+class BaseDataSaver:
+    """
+    플랫폼별 저장기가 공통으로 쓰는 CSV/Parquet 저장과 청크 단위 스트리밍 저장 기능입니다.
+    하위 클래스는 platform(Parquet 파티션과 지표에 쓰는 플랫폼 이름)과 parquet_fields(명시적 스키마)를 지정합니다.
+    """
+    platform = None
+    parquet_fields = None
+
+    def __init__(self, output_filename, log_level="INFO", log_file=None, output_format=DEFAULT_OUTPUT_FORMAT,
+                 parquet_dir=PARQUET_OUTPUT_DIR):
+        self.output_filename = output_filename
+        self.partial_filename = f"{output_filename}.part"
+        self.streamed_records = 0
+        self.carried_over_records = 0
+        self.parquet_dir = parquet_dir
+        self._parquet_buffer = []
+        self._parquet_buffer_rows = 0
+        self._carry_over_ids = None
+        # 스트리밍 저장 중 청크가 실제로 파일에 기록될 때마다 저장된 매물 ID 목록으로 호출됨 (체크포인트/증분 색인 기록용)
+        self.on_flushed = None
+        self.logger = setup_logger(self.__class__.__name__, log_level, log_file)
+        if output_format == "parquet" and not is_parquet_available():
+            self.logger.warning("pyarrow is not installed. Falling back to CSV output.")
+            output_format = "csv"
+        self.output_format = output_format
+
+    def save_dataframe_to_csv(self, dataframe):
+        """
+        DataFrame을 CSV 파일로 저장합니다.
+        """
+        if dataframe.empty:
+            self.logger.warning("No data to save to CSV.")
+            return
+
+        # 출력 디렉토리 확인 및 생성
+        output_dir = os.path.dirname(self.output_filename)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+        try:
+            dataframe.to_csv(self.output_filename, index=False, encoding='utf-8-sig')
+            self.logger.info(f"Successfully saved {len(dataframe)} records to {self.output_filename}")
+        except Exception as e:
+            self.logger.error(f"Failed to save data to {self.output_filename}: {e}")
+
+    def save_dataframe_to_parquet(self, dataframe, crawl_date=None):
+        """
+        DataFrame을 플랫폼/수집일/geohash 앞자리로 파티션된 Parquet 데이터셋에 추가합니다.
+        """
+        if dataframe.empty:
+            self.logger.warning("No data to save to Parquet.")
+            return
+
+        try:
+            written = write_partitioned_parquet(
+                dataframe, self.platform, self.parquet_fields, base_dir=self.parquet_dir, crawl_date=crawl_date
+            )
+            self.logger.info(f"Successfully saved {written} records to Parquet dataset {self.parquet_dir}")
+        except Exception as e:
+            self.logger.error(f"Failed to save data to Parquet dataset {self.parquet_dir}: {e}")
+            raise
+
+    def save_dataframe(self, dataframe):
+        """
+        설정된 출력 형식(output_format)에 맞춰 DataFrame을 저장합니다.
+        """
+        if self.output_format == "parquet":
+            self.save_dataframe_to_parquet(dataframe)
+        else:
+            self.save_dataframe_to_csv(dataframe)
+
+    def start_stream(self, resume=False, carry_over_ids=None):
+        """
+        청크 단위 스트리밍 저장을 시작합니다. 출력 형식에 따라 CSV 또는 Parquet으로 저장합니다.
+        resume이 True면 중단된 이전 실행이 남긴 CSV '.part' 파일에 이어서 씁니다.
+
+        carry_over_ids는 증분 수집처럼 바뀐 매물만 스트리밍할 때 지정합니다. CSV는 파일 하나가 전체 결과를 담으므로,
+        저장을 마칠 때 이전 출력 파일에서 이 ID에 해당하면서 이번에 다시 저장하지 않은 행을 옮겨 와 함께 교체합니다.
+        (Parquet은 수집일 파티션에 새 파일로 추가되므로 영향 없음)
+        """
+        self.streamed_records = 0
+        self.carried_over_records = 0
+        if self.output_format == "parquet":
+            self._parquet_buffer = []
+            self._parquet_buffer_rows = 0
+        else:
+            self._carry_over_ids = carry_over_ids
+            self.start_csv_stream(resume=resume)
+
+    def append_dataframe(self, dataframe):
+        if dataframe is None or dataframe.empty:
+            return
+        started = time.perf_counter()
+        if self.output_format != "parquet":
+            self.append_dataframe_to_csv(dataframe)
+        else:
+            # 청크마다 파일을 만들면 작은 파일이 너무 많아지므로 PARQUET_FLUSH_ROWS만큼 모아서 기록
+            self._parquet_buffer.append(dataframe)
+            self._parquet_buffer_rows += len(dataframe)
+            self.streamed_records += len(dataframe)
+            if self._parquet_buffer_rows >= PARQUET_FLUSH_ROWS:
+                self._flush_parquet_buffer()
+        get_metrics().record_stage("save", time.perf_counter() - started, len(dataframe), platform=self.platform)
+
+    def _flush_parquet_buffer(self):
+        if not self._parquet_buffer:
+            return
+        dataframe = pd.concat(self._parquet_buffer, ignore_index=True)
+        self.save_dataframe_to_parquet(dataframe)
+        self._parquet_buffer = []
+        self._parquet_buffer_rows = 0
+        self._notify_flushed(dataframe)
+
+    def _notify_flushed(self, dataframe):
+        if self.on_flushed:
+            self.on_flushed(dataframe['매물ID'].tolist())
+
+    def finish_stream(self):
+        if self.output_format == "parquet":
+            self._flush_parquet_buffer()
+            self.logger.info(f"Successfully streamed {self.streamed_records} records to Parquet dataset {self.parquet_dir}")
+        else:
+            self.finish_csv_stream()
+
+    def start_csv_stream(self, resume=False):
+        """
+        청크 단위 스트리밍 저장을 시작합니다.
+        저장이 끝나기 전까지는 '<출력 파일>.part'에 이어 쓰므로, 중간에 중단되어도
+        그때까지 저장된 청크는 남고 이전 실행의 완성된 출력 파일은 덮어쓰지 않습니다.
+        resume이 True면 남아 있는 '.part' 파일을 지우지 않고 그 뒤에 이어 씁니다.
+        """
+        self.partial_filename = f"{self.output_filename}.part"
+        output_dir = os.path.dirname(self.output_filename)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        if os.path.exists(self.partial_filename) and not resume:
+            os.remove(self.partial_filename)
+        self.streamed_records = 0
+
+    def _write_csv_chunk(self, dataframe):
+        write_header = not os.path.exists(self.partial_filename) or os.path.getsize(self.partial_filename) == 0
+        dataframe.to_csv(
+            self.partial_filename, mode='a', header=write_header, index=False,
+            # 엑셀 호환을 위한 BOM은 파일 첫 부분에만 기록
+            encoding='utf-8-sig' if write_header else 'utf-8'
+        )
+
+    def append_dataframe_to_csv(self, dataframe):
+        """
+        DataFrame 하나(청크)를 스트리밍 파일 끝에 이어 씁니다. 헤더는 파일이 처음 만들어질 때만 씁니다.
+        """
+        if dataframe is None or dataframe.empty:
+            return
+        self._write_csv_chunk(dataframe)
+        self.streamed_records += len(dataframe)
+        self.logger.debug("Appended %d records to %s", len(dataframe), self.partial_filename)
+        self._notify_flushed(dataframe)
+
+    def _carry_over_previous_rows(self):
+        """
+        이전 출력 파일에서 carry_over_ids에 속하고 '.part'에 아직 없는 행을 '.part' 끝에 옮겨 씁니다.
+        값은 문자열 그대로 읽고 쓰므로 이전 파일의 내용이 바뀌지 않습니다.
+        """
+        keep_ids = {str(listing_id) for listing_id in self._carry_over_ids}
+        columns = None
+        if os.path.exists(self.partial_filename) and os.path.getsize(self.partial_filename) > 0:
+            # 이어하기로 이전 실행이 쓴 행까지 포함해, '.part'에 이미 있는 매물은 새로 받은 값을 사용
+            written = pd.read_csv(self.partial_filename, usecols=['매물ID'], dtype=str, encoding='utf-8-sig')
+            keep_ids.difference_update(written['매물ID'])
+            columns = pd.read_csv(self.partial_filename, nrows=0, encoding='utf-8-sig').columns
+        if keep_ids:
+            for previous in pd.read_csv(self.output_filename, dtype=str, keep_default_na=False, encoding='utf-8-sig',
+                                        chunksize=CSV_CARRY_OVER_CHUNK_ROWS):
+                previous = previous[previous['매물ID'].isin(keep_ids)]
+                if previous.empty:
+                    continue
+                if columns is not None:
+                    previous = previous.reindex(columns=columns, fill_value="")
+                self._write_csv_chunk(previous)
+                self.carried_over_records += len(previous)
+        if not os.path.exists(self.partial_filename):
+            # 남길 행이 하나도 없으면(모두 내려감) 헤더만 있는 파일로 교체
+            self._write_csv_chunk(pd.read_csv(self.output_filename, nrows=0, encoding='utf-8-sig'))
+
+    def finish_csv_stream(self):
+        """
+        스트리밍 저장을 마치고 '.part' 파일을 최종 출력 파일로 교체합니다.
+        carry_over_ids가 지정되었으면 교체하기 전에 이전 출력 파일의 바뀌지 않은 행을 옮겨 옵니다.
+        """
+        if self._carry_over_ids is not None and os.path.exists(self.output_filename):
+            self._carry_over_previous_rows()
+        if not os.path.exists(self.partial_filename):
+            self.logger.warning("No data to save to CSV.")
+            return
+        os.replace(self.partial_filename, self.output_filename)
+        self.logger.info(
+            f"Successfully saved {self.streamed_records} records to {self.output_filename}"
+            + (f" ({self.carried_over_records} unchanged records kept from the previous file)" if self.carried_over_records else "")
+        )
@@ -1,31 +1,27 @@
 # platform_data_processors/dabang/dabang_data_saver.py
-import pandas as pd
-import logging
-import os
-from common_utils.logger_setup import setup_logger
+from platform_data_processors.base_data_saver import BaseDataSaver
 
-class DabangDataSaver:
-    def __init__(self, output_filename, log_level="INFO", log_file=None):
-        self.output_filename = output_filename
-        self.logger = setup_logger(self.__class__.__name__, log_level, log_file)
-        self.logger.info("DabangDataSaver initialized.")
-
-    def save_dataframe_to_csv(self, dataframe):
-        """
-        DataFrame을 CSV 파일로 저장합니다.
-        """
-        if dataframe.empty:
-            self.logger.warning("No data to save to CSV.")
-            return
+# Parquet 저장 시 사용할 명시적 스키마 (컬럼명, 타입)
+DABANG_PARQUET_FIELDS = [
+    ('매물ID', 'string'),
+    ('방유형', 'string'),
+    ('건물유형', 'string'),
+    ('거래유형', 'string'),
+    ('보증금(만원)', 'float64'),
+    ('월세(만원)', 'float64'),
+    ('매매가(만원)', 'float64'),
+    ('도로명주소', 'string'),
+    ('지번주소', 'string'),
+    ('위도', 'float64'),
+    ('경도', 'float64'),
+    ('층수', 'string'),
+    ('면적(m2)', 'float64'),
+]
 
-        # 출력 디렉토리 확인 및 생성
-        output_dir = os.path.dirname(self.output_filename)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-
-        try:
-            dataframe.to_csv(self.output_filename, index=False, encoding='utf-8-sig')
-            self.logger.info(f"Successfully saved {len(dataframe)} records to {self.output_filename}")
-        except Exception as e:
-            self.logger.error(f"Failed to save data to {self.output_filename}: {e}")
+class DabangDataSaver(BaseDataSaver):
+    platform = "dabang"
+    parquet_fields = DABANG_PARQUET_FIELDS
 
+    def __init__(self, output_filename, log_level="INFO", log_file=None, **kwargs):
+        super().__init__(output_filename, log_level=log_level, log_file=log_file, **kwargs)
+        self.logger.info("DabangDataSaver initialized.")
@@ -0,0 +1,58 @@
+# platform_data_processors/listing_aggregation.py
+import pandas as pd
+
+from common_utils.geohash_utils import encode_geohashes, geohash_bbox
+from platform_configs.general_config import MAP_ZOOM_GEOHASH_PRECISION, MAP_MARKER_MIN_ZOOM, MAP_MAX_MARKERS
+
+
+def geohash_precision_for_zoom(zoom):
+    """
+    지도 줌 레벨에 맞는 Geohash 정밀도를 반환합니다. (MAP_ZOOM_GEOHASH_PRECISION 기준)
+    """
+    precision = min(MAP_ZOOM_GEOHASH_PRECISION.values())
+    for min_zoom, zoom_precision in sorted(MAP_ZOOM_GEOHASH_PRECISION.items()):
+        if zoom >= min_zoom:
+            precision = zoom_precision
+    return precision
+
+
+def aggregate_listings_by_geohash(dataframe, precision, price_column="보증금(만원)"):
+    """
+    매물을 Geohash 셀 단위로 묶어 셀마다 매물 수와 가격 중앙값을 계산합니다.
+    지도에는 매물 수와 관계없이 셀 개수만큼의 도형만 그리면 되므로, 데이터가 늘어나도 페이지 크기가 거의 일정합니다.
+
+    반환 컬럼: geohash, count, median_price, lat_min, lat_max, lng_min, lng_max
+    """
+    columns = ["geohash", "count", "median_price", "lat_min", "lat_max", "lng_min", "lng_max"]
+    if dataframe.empty:
+        return pd.DataFrame(columns=columns)
+
+    geohashes = encode_geohashes(dataframe["위도"].to_numpy(dtype="float64", na_value=float("nan")),
+                                 dataframe["경도"].to_numpy(dtype="float64", na_value=float("nan")), precision)
+    prices = pd.to_numeric(dataframe[price_column], errors="coerce") if price_column in dataframe else pd.Series(float("nan"), index=dataframe.index)
+    cells = (
+        pd.DataFrame({"geohash": geohashes, "price": prices.to_numpy()})
+        .query("geohash != ''")
+        .groupby("geohash", sort=True)["price"]
+        .agg(count="size", median_price="median")
+        .reset_index()
+    )
+    bounds = [geohash_bbox(code) for code in cells["geohash"]]
+    cells[["lat_min", "lat_max", "lng_min", "lng_max"]] = pd.DataFrame(bounds, index=cells.index, columns=columns[3:])
+    return cells[columns]
+
+
+def listings_in_view(dataframe, view_bbox):
+    """
+    지도 화면(view_bbox: lat_min, lat_max, lng_min, lng_max) 안에 있는 매물만 반환합니다.
+    """
+    lat_min, lat_max, lng_min, lng_max = view_bbox
+    inside = dataframe["위도"].between(lat_min, lat_max) & dataframe["경도"].between(lng_min, lng_max)
+    return dataframe[inside]
+
+
+def should_show_markers(zoom, listing_count):
+    """
+    충분히 확대했고 화면 안 매물 수가 적을 때만 개별 마커를 그립니다.
+    """
+    return zoom >= MAP_MARKER_MIN_ZOOM and listing_count <= MAP_MAX_MARKERS
@@ -0,0 +1,239 @@
+# platform_data_processors/listing_dedup.py
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from common_utils.logger_setup import setup_logger
+from common_utils.geohash_utils import encode_geohashes, geohash_cell_size, GEOHASH_NEIGHBOR_OFFSETS
+from platform_configs.general_config import (
+    DEDUP_GEOHASH_PRECISION, DEDUP_MAX_DISTANCE_M, DEDUP_AREA_TOLERANCE, DEDUP_PRICE_TOLERANCE,
+    DEDUP_SCORE_WEIGHTS, DEDUP_MIN_EVIDENCE_WEIGHT, DEDUP_MATCH_THRESHOLD
+)
+from platform_data_processors.listing_store import haversine_m
+
+LISTING_COLUMNS = ["platform", "매물ID", "거래유형", "보증금(만원)", "월세(만원)", "매매가(만원)", "면적(m2)", "층수", "주소", "위도", "경도"]
+UNIFIED_COLUMNS = ["cluster_id", "cluster_size", "match_score", *LISTING_COLUMNS]
+_PRICE_COLUMNS = ["보증금(만원)", "월세(만원)", "매매가(만원)"]
+# 한 번에 후보 쌍을 만드는 왼쪽 매물 수 (후보 쌍 배열의 메모리 상한)
+_PAIR_BATCH_SIZE = 100000
+_FLOOR_PATTERN = r"^\s*(B|b|지하)?\s*(\d+)"
+_ADDRESS_REPLACEMENTS = [("서울특별시", "서울시"), ("특별시", "시"), ("광역시", "시")]
+
+
+def parse_floors(floor_values):
+    """
+    층수 문자열('3', '3층', '10/20층', 'B1')에서 해당 층을 뽑아 float 배열로 반환합니다.
+    지하는 음수, '고층'처럼 숫자가 없는 값은 NaN입니다.
+    """
+    extracted = pd.Series(floor_values, dtype="object").astype("string").str.extract(_FLOOR_PATTERN)
+    floors = pd.to_numeric(extracted[1], errors="coerce")
+    return floors.where(extracted[0].isna(), -floors).to_numpy(dtype="float64", na_value=np.nan)
+
+
+def address_tokens(address):
+    """
+    주소를 비교용 토큰 집합으로 바꿉니다. ('서울특별시'와 '서울시'처럼 표기만 다른 시 이름은 통일)
+    """
+    if not isinstance(address, str):
+        return frozenset()
+    for old, new in _ADDRESS_REPLACEMENTS:
+        address = address.replace(old, new)
+    return frozenset(token for token in address.split() if token.lower() != "none")
+
+
+def _closeness(left, right, tolerance):
+    """
+    두 값의 상대 차이를 0~1 점수로 바꿉니다. 같으면 1, tolerance 비율 이상 차이나면 0이며,
+    어느 한쪽이라도 값이 없거나 0이면 비교할 수 없으므로 NaN입니다.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        score = np.clip(1.0 - np.abs(left - right) / np.maximum(left, right) / tolerance, 0.0, 1.0)
+    return np.where((left > 0) & (right > 0), score, np.nan)
+
+
+class ListingDeduplicator:
+    """
+    여러 플랫폼에 함께 올라온 같은 매물을 찾아 하나의 클러스터 ID로 묶습니다.
+
+    1. 블로킹: 매물을 Geohash 셀(DEDUP_GEOHASH_PRECISION)로 나누고, 거래유형이 같으면서
+       같은 셀 또는 주변 8개 셀에 있는 다른 플랫폼 매물끼리만 후보 쌍으로 만듭니다.
+       후보 수는 셀당 매물 밀도에만 비례하므로 전체 매물 수에 대해 거의 선형으로 늘어납니다.
+    2. 점수: 거리, 주소, 면적, 층, 가격을 각각 0~1로 점수화해 가중 평균합니다. (DEDUP_SCORE_WEIGHTS)
+    3. 매칭: 플랫폼 쌍마다 점수가 높은 후보부터 1:1로 짝짓고, 짝지어진 매물을 이어 클러스터를 만듭니다.
+    """
+    def __init__(self, precision=DEDUP_GEOHASH_PRECISION, max_distance_m=DEDUP_MAX_DISTANCE_M,
+                 match_threshold=DEDUP_MATCH_THRESHOLD, log_level="INFO", log_file=None):
+        self.logger = setup_logger(self.__class__.__name__, log_level, log_file)
+        self.precision = precision
+        self.max_distance_m = max_distance_m
+        self.match_threshold = match_threshold
+        self.logger.info("ListingDeduplicator initialized.")
+
+    def deduplicate(self, dataframe):
+        """
+        LISTING_COLUMNS 형식의 매물 DataFrame(SpatialListingStore 조회 결과)을 받아
+        cluster_id, cluster_size, match_score 컬럼을 붙인 통합 매물 테이블을 반환합니다.
+        같은 매물은 같은 cluster_id를 가지며, match_score는 짝지어진 매물과의 점수입니다. (짝이 없으면 NaN)
+        """
+        if dataframe.empty:
+            return pd.DataFrame(columns=UNIFIED_COLUMNS)
+        listings = dataframe.reset_index(drop=True)
+        features = self._features(listings)
+
+        matches = []
+        platforms = sorted(listings["platform"].astype(str).unique())
+        for left_platform, right_platform in combinations(platforms, 2):
+            pairs = self._match_platform_pair(features, left_platform, right_platform)
+            self.logger.info(f"Matched {len(pairs[0])} listings between {left_platform} and {right_platform}.")
+            matches.append(pairs)
+
+        cluster_ids, match_scores = self._clusters(len(listings), matches)
+        unified = listings[LISTING_COLUMNS].copy()
+        unified.insert(0, "match_score", match_scores)
+        unified.insert(0, "cluster_size", pd.Series(cluster_ids).map(pd.Series(cluster_ids).value_counts()).to_numpy())
+        unified.insert(0, "cluster_id", cluster_ids)
+        self.logger.info(
+            f"Deduplicated {len(unified)} listings into {unified['cluster_id'].nunique()} clusters "
+            f"({int((unified['cluster_size'] > 1).sum())} listings appear on more than one platform)."
+        )
+        return unified.sort_values(["cluster_id", "platform"], kind="stable").reset_index(drop=True)
+
+    def _features(self, listings):
+        address_codes, unique_addresses = pd.factorize(listings["주소"].astype("string").fillna(""))
+        features = {
+            "platform": listings["platform"].astype(str).to_numpy(),
+            "deal_type": listings["거래유형"].astype("string").fillna("").str.strip().to_numpy(dtype=object),
+            "lat": pd.to_numeric(listings["위도"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan),
+            "lng": pd.to_numeric(listings["경도"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan),
+            "area": pd.to_numeric(listings["면적(m2)"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan),
+            "floor": parse_floors(listings["층수"].to_numpy()),
+            "prices": [pd.to_numeric(listings[column], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+                       for column in _PRICE_COLUMNS],
+            "address_code": address_codes,
+            # 같은 주소는 한 번만 토큰화
+            "address_tokens": [address_tokens(address) for address in unique_addresses],
+        }
+        features["cell"] = encode_geohashes(features["lat"], features["lng"], self.precision)
+        return features
+
+    def _candidate_pairs(self, features, left_rows, right_rows):
+        """
+        왼쪽 매물마다 자기 셀과 주변 8개 셀을 키로 만들어, 오른쪽 매물의 (셀, 거래유형)과 조인한 후보 쌍을 배치 단위로 반환합니다.
+        """
+        lat_step, lng_step = geohash_cell_size(self.precision)
+        right_keys = pd.DataFrame({
+            "right": right_rows, "cell": features["cell"][right_rows], "deal_type": features["deal_type"][right_rows]
+        })
+        for start in range(0, len(left_rows), _PAIR_BATCH_SIZE):
+            rows = left_rows[start:start + _PAIR_BATCH_SIZE]
+            lats, lngs, deal_types = features["lat"][rows], features["lng"][rows], features["deal_type"][rows]
+            cells = [features["cell"][rows]]
+            cells.extend(
+                encode_geohashes(lats + lat_offset * lat_step, lngs + lng_offset * lng_step, self.precision)
+                for lat_offset, lng_offset in GEOHASH_NEIGHBOR_OFFSETS
+            )
+            left_keys = pd.DataFrame({
+                "left": np.tile(rows, len(cells)), "cell": np.concatenate(cells), "deal_type": np.tile(deal_types, len(cells))
+            })
+            pairs = left_keys.merge(right_keys, on=["cell", "deal_type"])
+            if not pairs.empty:
+                yield pairs["left"].to_numpy(), pairs["right"].to_numpy()
+
+    def _score_pairs(self, features, left, right):
+        """
+        후보 쌍의 점수를 계산해 (left, right, score) 중 임계값을 넘는 쌍만 반환합니다.
+        주소 비교는 파이썬 연산이므로, 주소 점수가 만점이어도 임계값에 못 미치는 쌍은 미리 걸러냅니다.
+        """
+        distance = haversine_m(features["lat"][left], features["lng"][left], features["lat"][right], features["lng"][right])
+        near = distance <= self.max_distance_m
+        left, right, distance = left[near], right[near], distance[near]
+
+        floors_known = np.isfinite(features["floor"][left]) & np.isfinite(features["floor"][right])
+        price_scores = np.vstack([_closeness(prices[left], prices[right], DEDUP_PRICE_TOLERANCE) for prices in features["prices"]])
+        price_known = np.isfinite(price_scores).any(axis=0)
+        scores = {
+            "distance": 1.0 - distance / self.max_distance_m,
+            "area": _closeness(features["area"][left], features["area"][right], DEDUP_AREA_TOLERANCE),
+            "floor": np.where(floors_known, features["floor"][left] == features["floor"][right], np.nan),
+            "price": np.where(price_known, np.nansum(price_scores, axis=0) / np.maximum(np.isfinite(price_scores).sum(axis=0), 1), np.nan),
+        }
+        numerator = np.zeros(len(left))
+        evidence = np.zeros(len(left))
+        for name, score in scores.items():
+            known = np.isfinite(score)
+            numerator += np.where(known, score, 0.0) * DEDUP_SCORE_WEIGHTS[name]
+            evidence += known * DEDUP_SCORE_WEIGHTS[name]
+
+        address_weight = DEDUP_SCORE_WEIGHTS["address"]
+        possible = (numerator + address_weight) / (evidence + address_weight) >= self.match_threshold
+        possible &= evidence + address_weight >= DEDUP_MIN_EVIDENCE_WEIGHT
+        left, right, numerator, evidence = left[possible], right[possible], numerator[possible], evidence[possible]
+
+        # 주소 점수: 짧은 주소의 토큰이 긴 주소에 얼마나 포함되는지 (동 단위 주소와 번지까지 있는 주소 비교)
+        tokens, codes = features["address_tokens"], features["address_code"]
+        address_scores = np.array([
+            len(tokens[a] & tokens[b]) / min(len(tokens[a]), len(tokens[b])) if tokens[a] and tokens[b] else np.nan
+            for a, b in zip(codes[left], codes[right])
+        ], dtype="float64")
+        known = np.isfinite(address_scores)
+        numerator += np.where(known, address_scores, 0.0) * address_weight
+        evidence += known * address_weight
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            total = numerator / evidence
+        accepted = (evidence >= DEDUP_MIN_EVIDENCE_WEIGHT) & (total >= self.match_threshold)
+        return left[accepted], right[accepted], total[accepted]
+
+    def _match_platform_pair(self, features, left_platform, right_platform):
+        """
+        두 플랫폼 사이의 후보를 점수순으로 1:1 매칭합니다. (한 매물은 다른 플랫폼의 매물 하나와만 짝지어짐)
+        """
+        valid = features["cell"] != ""
+        left_rows = np.flatnonzero(valid & (features["platform"] == left_platform))
+        right_rows = np.flatnonzero(valid & (features["platform"] == right_platform))
+
+        scored = [self._score_pairs(features, left, right) for left, right in self._candidate_pairs(features, left_rows, right_rows)]
+        if not scored:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([], dtype="float64")
+        left, right, scores = (np.concatenate(parts) for parts in zip(*scored))
+
+        order = np.argsort(-scores, kind="stable")
+        matched_left, matched_right = set(), set()
+        keep = []
+        for index in order:
+            if left[index] in matched_left or right[index] in matched_right:
+                continue
+            matched_left.add(left[index])
+            matched_right.add(right[index])
+            keep.append(index)
+        keep = np.array(keep, dtype=np.int64)
+        return left[keep], right[keep], scores[keep]
+
+    @staticmethod
+    def _clusters(count, matches):
+        """
+        짝지어진 매물을 union-find로 이어 클러스터 ID(0부터 시작하는 정수)와 매물별 최고 매칭 점수를 반환합니다.
+        """
+        parent = np.arange(count)
+
+        def find(row):
+            while parent[row] != row:
+                parent[row] = parent[parent[row]]
+                row = parent[row]
+            return row
+
+        match_scores = np.full(count, np.nan)
+        for left, right, scores in matches:
+            for a, b, score in zip(left, right, scores):
+                root_a, root_b = find(a), find(b)
+                if root_a != root_b:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+                match_scores[a] = np.fmax(match_scores[a], score)
+                match_scores[b] = np.fmax(match_scores[b], score)
+
+        matched_rows = np.flatnonzero(np.isfinite(match_scores))
+        roots = np.arange(count)
+        roots[matched_rows] = [find(row) for row in matched_rows]
+        cluster_ids, _ = pd.factorize(roots)
+        return cluster_ids, match_scores
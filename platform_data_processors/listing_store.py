@@ -0,0 +1,228 @@
+# platform_data_processors/listing_store.py
+import json
+import math
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from platform_configs.general_config import LISTING_STORE_PATH
+
+EARTH_RADIUS_M = 6371008.8
+# 위도 1도의 거리(m). 경도 1도의 거리는 여기에 cos(위도)를 곱한 값
+METERS_PER_DEGREE_LAT = 111320.0
+
+# 검색 결과로 돌려주는 컬럼 (두 플랫폼 변환 결과에서 공통으로 뽑아 별도 컬럼으로 저장)
+STORE_COLUMNS = [
+    "platform", "매물ID", "거래유형", "보증금(만원)", "월세(만원)", "매매가(만원)", "면적(m2)", "층수", "주소", "위도", "경도"
+]
+# 공통 컬럼이 아닌 나머지 필드는 data(JSON)에 그대로 저장
+_SQL_COLUMNS = [
+    "platform", "listing_id", "deal_type", "deposit", "rent", "sale_price", "area_m2", "floor", "address", "lat", "lng"
+]
+_FIXED_DATAFRAME_COLUMNS = set(STORE_COLUMNS) | {"도로명주소", "지번주소"}
+
+
+def haversine_m(lat, lng, lats, lngs):
+    """
+    두 지점(또는 같은 길이의 지점 배열) 사이의 대원 거리(m)를 numpy로 한 번에 계산합니다.
+    한 점에서 여러 점까지의 거리도 브로드캐스팅으로 계산할 수 있습니다.
+    """
+    lat1, lng1 = np.radians(lat), np.radians(lng)
+    lat2, lng2 = np.radians(lats), np.radians(lngs)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+
+def _radius_bbox(lat, lng, radius_m):
+    lat_delta = radius_m / METERS_PER_DEGREE_LAT
+    lng_delta = radius_m / (METERS_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 1e-6))
+    return lat - lat_delta, lat + lat_delta, lng - lng_delta, lng + lng_delta
+
+
+def _clean(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)) or value is pd.NA:
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class SpatialListingStore:
+    """
+    변환된 매물을 위도/경도로 공간 색인해 저장하는 SQLite 저장소입니다. (R*Tree 가상 테이블 사용)
+
+    - upsert_dataframe(): 변환기가 만든 DataFrame을 (플랫폼, 매물ID) 기준으로 추가/갱신
+    - query_bbox(): BBOX 안의 매물
+    - query_radius(): 한 지점에서 반경 N미터 안의 매물 (가까운 순)
+    - query_knn(): 한 지점에서 가장 가까운 k개 매물
+
+    R*Tree는 BBOX와 겹치는 노드만 따라 내려가므로 매물이 수백만 개여도 조회가 수 밀리초에 끝나며,
+    반경/kNN 조회는 R*Tree로 후보를 좁힌 뒤 후보에 대해서만 정확한 거리를 계산합니다.
+    """
+    def __init__(self, db_path=LISTING_STORE_PATH):
+        self.db_path = db_path
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # listing_id는 타입을 지정하지 않아 API가 준 값(정수/문자열)을 그대로 저장
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS listings (
+                id INTEGER PRIMARY KEY,
+                platform TEXT NOT NULL,
+                listing_id NOT NULL,
+                deal_type TEXT,
+                deposit REAL,
+                rent REAL,
+                sale_price REAL,
+                area_m2 REAL,
+                floor TEXT,
+                address TEXT,
+                lat REAL NOT NULL,
+                lng REAL NOT NULL,
+                data TEXT,
+                updated_at TEXT NOT NULL,
+                UNIQUE (platform, listing_id)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS listings_rtree USING rtree(id, lat_min, lat_max, lng_min, lng_max)"
+        )
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _rows_from_dataframe(platform, dataframe, updated_at):
+        extra_columns = [column for column in dataframe.columns if column not in _FIXED_DATAFRAME_COLUMNS]
+        # 다방은 직방 주소(동 단위 지번 주소)와 비교하기 쉬운 지번 주소를 우선 사용
+        address = dataframe["주소"] if "주소" in dataframe else (
+            dataframe["지번주소"].fillna(dataframe["도로명주소"]) if "지번주소" in dataframe else pd.Series(None, index=dataframe.index)
+        )
+        lats = pd.to_numeric(dataframe["위도"], errors="coerce")
+        lngs = pd.to_numeric(dataframe["경도"], errors="coerce")
+
+        def column(name):
+            return dataframe[name] if name in dataframe else pd.Series(None, index=dataframe.index)
+
+        rows = []
+        for values in zip(
+            dataframe["매물ID"], column("거래유형"), column("보증금(만원)"), column("월세(만원)"), column("매매가(만원)"),
+            column("면적(m2)"), column("층수"), address, lats, lngs,
+            dataframe[extra_columns].itertuples(index=False, name=None) if extra_columns else [()] * len(dataframe)
+        ):
+            listing_id, deal_type, deposit, rent, sale_price, area, floor, addr, lat, lng, extra = values
+            if listing_id is None or pd.isna(lat) or pd.isna(lng):
+                # 좌표가 없는 매물은 공간 색인에 넣을 수 없으므로 건너뜀
+                continue
+            data = {name: _clean(value) for name, value in zip(extra_columns, extra)}
+            rows.append((
+                platform, _clean(listing_id), _clean(deal_type), _clean(deposit), _clean(rent), _clean(sale_price),
+                _clean(area), None if _clean(floor) is None else str(floor), _clean(addr), float(lat), float(lng),
+                json.dumps(data, ensure_ascii=False, default=str) if data else None, updated_at
+            ))
+        return rows
+
+    def upsert_dataframe(self, platform, dataframe):
+        """
+        변환된 DataFrame을 저장하고 공간 색인을 갱신합니다. 저장한 행 수를 반환합니다.
+        같은 (플랫폼, 매물ID)가 이미 있으면 내용과 좌표를 새 값으로 바꿉니다.
+        """
+        if dataframe is None or dataframe.empty:
+            return 0
+        rows = self._rows_from_dataframe(platform, dataframe, datetime.now().isoformat(timespec="seconds"))
+        if not rows:
+            return 0
+
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.executemany(
+                f"""
+                INSERT INTO listings ({", ".join(_SQL_COLUMNS)}, data, updated_at)
+                VALUES ({", ".join("?" * (len(_SQL_COLUMNS) + 2))})
+                ON CONFLICT (platform, listing_id) DO UPDATE SET
+                    deal_type = excluded.deal_type, deposit = excluded.deposit, rent = excluded.rent,
+                    sale_price = excluded.sale_price, area_m2 = excluded.area_m2, floor = excluded.floor,
+                    address = excluded.address, lat = excluded.lat, lng = excluded.lng,
+                    data = excluded.data, updated_at = excluded.updated_at
+                """,
+                rows,
+            )
+            # 방금 저장한 매물의 id로 R*Tree를 갱신 (점이므로 min과 max가 같음)
+            cur.execute("CREATE TEMP TABLE IF NOT EXISTS upserted (listing_id PRIMARY KEY)")
+            cur.execute("DELETE FROM upserted")
+            cur.executemany("INSERT OR IGNORE INTO upserted VALUES (?)", [(row[1],) for row in rows])
+            cur.execute(
+                """
+                INSERT OR REPLACE INTO listings_rtree (id, lat_min, lat_max, lng_min, lng_max)
+                SELECT l.id, l.lat, l.lat, l.lng, l.lng FROM listings l JOIN upserted u ON l.listing_id = u.listing_id
+                WHERE l.platform = ?
+                """,
+                (platform,),
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def _select_in_bbox(self, lat_min, lat_max, lng_min, lng_max, platform=None):
+        query = f"""
+            SELECT {", ".join("l." + column for column in _SQL_COLUMNS)}
+            FROM listings_rtree r JOIN listings l ON l.id = r.id
+            WHERE r.lat_min >= ? AND r.lat_max <= ? AND r.lng_min >= ? AND r.lng_max <= ?
+        """
+        params = [lat_min, lat_max, lng_min, lng_max]
+        if platform:
+            query += " AND l.platform = ?"
+            params.append(platform)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return pd.DataFrame(rows, columns=STORE_COLUMNS)
+
+    def query_bbox(self, lat_min, lat_max, lng_min, lng_max, platform=None):
+        """
+        BBOX 안의 매물을 DataFrame으로 반환합니다.
+        """
+        return self._select_in_bbox(lat_min, lat_max, lng_min, lng_max, platform=platform)
+
+    def query_radius(self, lat, lng, radius_m, platform=None):
+        """
+        (lat, lng)에서 radius_m 미터 안의 매물을 가까운 순으로 반환합니다. distance_m 컬럼이 추가됩니다.
+        """
+        candidates = self._select_in_bbox(*_radius_bbox(lat, lng, radius_m), platform=platform)
+        if candidates.empty:
+            return candidates.assign(distance_m=pd.Series(dtype="float64"))
+        candidates["distance_m"] = haversine_m(lat, lng, candidates["위도"].to_numpy(), candidates["경도"].to_numpy())
+        return candidates[candidates["distance_m"] <= radius_m].sort_values("distance_m", kind="stable").reset_index(drop=True)
+
+    def query_knn(self, lat, lng, k, platform=None, initial_radius_m=200.0, max_radius_m=50000.0):
+        """
+        (lat, lng)에서 가장 가까운 k개 매물을 반환합니다.
+        반경을 두 배씩 넓혀 가며 반경 안에 k개 이상이 들어오면 멈추므로, 반경 안의 후보만 거리 계산을 합니다.
+        (반경 안에 k개가 있으면 그보다 먼 매물이 더 가까울 수는 없으므로 결과는 정확합니다)
+        """
+        radius_m = initial_radius_m
+        while True:
+            nearby = self.query_radius(lat, lng, radius_m, platform=platform)
+            if len(nearby) >= k or radius_m >= max_radius_m:
+                return nearby.head(k)
+            radius_m *= 2
+
+    def count(self, platform=None):
+        query = "SELECT COUNT(*) FROM listings"
+        params = []
+        if platform:
+            query += " WHERE platform = ?"
+            params.append(platform)
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
@@ -0,0 +1,191 @@
+# platform_data_processors/parquet_store.py
+import math
+import os
+import time
+import uuid
+from datetime import date
+
+import geohash2 as geohash
+import pandas as pd
+
+from common_utils.geohash_utils import geohashes_covering_bbox
+from platform_configs.general_config import (
+    PARQUET_OUTPUT_DIR, PARQUET_COMPRESSION, PARQUET_GEOHASH_PREFIX_PRECISION
+)
+
+# 모든 플랫폼 데이터셋에 공통으로 붙는 파티션 컬럼
+PARTITION_COLUMNS = ["platform", "crawl_date", "geohash_prefix"]
+# 좌표가 없는 매물이 들어갈 geohash 파티션 값
+UNKNOWN_GEOHASH_PREFIX = "unknown"
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet output requires pyarrow. Install it with `pip install pyarrow`.") from e
+    return pa, ds, pq
+
+
+def is_parquet_available():
+    try:
+        _import_pyarrow()
+    except ImportError:
+        return False
+    return True
+
+
+def _geohash_prefix(lat, lng, precision):
+    try:
+        lat = float(lat)
+        lng = float(lng)
+    except (TypeError, ValueError):
+        return UNKNOWN_GEOHASH_PREFIX
+    if math.isnan(lat) or math.isnan(lng):
+        return UNKNOWN_GEOHASH_PREFIX
+    return geohash.encode(lat, lng, precision=precision)
+
+
+def build_schema(fields):
+    """
+    [(컬럼명, pyarrow 타입 이름), ...] 목록으로 파티션 컬럼을 포함한 명시적 스키마를 만듭니다.
+    """
+    pa, _, _ = _import_pyarrow()
+    type_factories = {"int64": pa.int64, "float64": pa.float64, "string": pa.string}
+    schema_fields = [pa.field(name, type_factories[type_name]()) for name, type_name in fields]
+    schema_fields += [pa.field(name, pa.string()) for name in PARTITION_COLUMNS]
+    return pa.schema(schema_fields)
+
+
+def _coerce_to_schema(dataframe, fields):
+    """
+    변환기가 만든 DataFrame의 컬럼을 스키마 타입에 맞춥니다.
+    (예: 숫자와 문자열이 섞인 '층수' 컬럼은 문자열로 통일)
+    """
+    coerced = pd.DataFrame(index=dataframe.index)
+    for name, type_name in fields:
+        column = dataframe[name] if name in dataframe.columns else pd.Series(None, index=dataframe.index, dtype=object)
+        if type_name == "string":
+            coerced[name] = column.astype(object).where(column.notna(), None).map(lambda v: v if v is None else str(v))
+        elif type_name == "int64":
+            coerced[name] = pd.to_numeric(column, errors="coerce").astype("Int64")
+        else:
+            coerced[name] = pd.to_numeric(column, errors="coerce").astype("float64")
+    return coerced
+
+
+def write_partitioned_parquet(dataframe, platform, fields, base_dir=PARQUET_OUTPUT_DIR, crawl_date=None,
+                              compression=PARQUET_COMPRESSION, geohash_precision=PARQUET_GEOHASH_PREFIX_PRECISION):
+    """
+    DataFrame을 platform=/crawl_date=/geohash_prefix= 형태로 파티션된 Parquet 데이터셋에 추가합니다.
+    호출할 때마다 새 파일 이름을 사용하므로 기존 파일을 덮어쓰지 않고 이어서 쌓입니다.
+    파일 이름은 기록 시각으로 시작하므로, 같은 파티션 안에서는 이름 순서가 기록 순서입니다.
+    기록한 행 수를 반환합니다.
+    """
+    if dataframe is None or dataframe.empty:
+        return 0
+    pa, _, pq = _import_pyarrow()
+
+    table_df = _coerce_to_schema(dataframe, fields)
+    table_df["platform"] = platform
+    if crawl_date is None:
+        crawl_date = date.today()
+    table_df["crawl_date"] = crawl_date if isinstance(crawl_date, str) else crawl_date.isoformat()
+    table_df["geohash_prefix"] = [
+        _geohash_prefix(lat, lng, geohash_precision) for lat, lng in zip(dataframe["위도"], dataframe["경도"])
+    ]
+
+    table = pa.Table.from_pandas(table_df, schema=build_schema(fields), preserve_index=False)
+    pq.write_to_dataset(
+        table,
+        root_path=base_dir,
+        partition_cols=PARTITION_COLUMNS,
+        compression=compression,
+        basename_template=f"part-{time.time_ns():020d}-{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    return len(table_df)
+
+
+def _read_latest_rows(dataset, read_columns, filter_expression):
+    """
+    매물ID마다 가장 최근에 기록된 행만 남겨 읽습니다.
+    수집일(crawl_date)이 늦은 파일을, 수집일이 같으면 나중에 기록한 파일을 뒤에 오도록 순서대로 읽어 이어 붙인 뒤
+    매물ID별로 마지막 행을 사용합니다. (한 파일 안에서는 행 순서가 기록 순서)
+    """
+    _, ds, _ = _import_pyarrow()
+    extra_columns = [] if read_columns is None else [name for name in ("매물ID", "crawl_date") if name not in read_columns]
+    fragment_columns = None if read_columns is None else read_columns + extra_columns
+
+    def write_order(fragment):
+        partition_keys = ds.get_partition_keys(fragment.partition_expression)
+        return partition_keys.get("crawl_date", ""), os.path.basename(fragment.path)
+
+    frames = [
+        fragment.to_table(columns=fragment_columns, filter=filter_expression, schema=dataset.schema).to_pandas()
+        for fragment in sorted(dataset.get_fragments(filter=filter_expression), key=write_order)
+    ]
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=fragment_columns)
+    dataframe = pd.concat(frames, ignore_index=True).drop_duplicates(subset="매물ID", keep="last")
+    return dataframe.drop(columns=extra_columns).reset_index(drop=True)
+
+
+def read_listings(platform, base_dir=PARQUET_OUTPUT_DIR, columns=None, crawl_dates=None, geohash_prefixes=None,
+                  latest_only=False):
+    """
+    저장된 Parquet 데이터셋에서 한 플랫폼의 필요한 파티션과 컬럼만 읽어 DataFrame으로 반환합니다.
+    플랫폼마다 스키마가 다르므로(예: 매물ID 타입) 플랫폼 디렉토리 단위로 읽으며,
+    파티션 조건(crawl_dates, geohash_prefixes)에 맞지 않는 디렉토리는 열지 않습니다.
+
+    수집할 때마다 행이 추가되므로 같은 매물이 여러 수집일(또는 한 수집일의 여러 파일)에 들어 있을 수 있습니다.
+    latest_only가 True면 매물ID마다 가장 최근에 기록된 행만 반환합니다.
+    """
+    pa, ds, _ = _import_pyarrow()
+    platform_dir = os.path.join(base_dir, f"platform={platform}")
+    if not os.path.isdir(platform_dir):
+        return pd.DataFrame(columns=columns)
+
+    partitioning = ds.partitioning(
+        pa.schema([pa.field(name, pa.string()) for name in PARTITION_COLUMNS[1:]]), flavor="hive"
+    )
+    dataset = ds.dataset(platform_dir, format="parquet", partitioning=partitioning)
+
+    filter_expression = None
+    for name, values in (("crawl_date", crawl_dates), ("geohash_prefix", geohash_prefixes)):
+        if values:
+            condition = ds.field(name).isin(list(values))
+            filter_expression = condition if filter_expression is None else filter_expression & condition
+
+    read_columns = None if columns is None else [name for name in columns if name != "platform"]
+    if latest_only:
+        dataframe = _read_latest_rows(dataset, read_columns, filter_expression)
+    else:
+        dataframe = dataset.to_table(columns=read_columns, filter=filter_expression).to_pandas()
+    if columns is None or "platform" in columns:
+        dataframe["platform"] = platform
+    return dataframe[columns] if columns is not None else dataframe
+
+
+def read_listings_in_bbox(platform, bbox, base_dir=PARQUET_OUTPUT_DIR, columns=None, crawl_dates=None,
+                          geohash_precision=PARQUET_GEOHASH_PREFIX_PRECISION, latest_only=False):
+    """
+    BBOX (lat_min, lat_max, lng_min, lng_max) 안의 매물만 읽습니다.
+    BBOX를 덮는 geohash_prefix 파티션만 열고, 읽은 뒤 위도/경도로 정확히 걸러 냅니다.
+    latest_only는 read_listings와 같습니다.
+    """
+    lat_min, lat_max, lng_min, lng_max = bbox
+    prefixes = geohashes_covering_bbox(lat_min, lat_max, lng_min, lng_max, geohash_precision)
+    read_columns = None if columns is None else list(dict.fromkeys(list(columns) + ["위도", "경도"]))
+    dataframe = read_listings(
+        platform, base_dir=base_dir, columns=read_columns, crawl_dates=crawl_dates, geohash_prefixes=prefixes,
+        latest_only=latest_only
+    )
+    if dataframe.empty:
+        return dataframe if columns is None else dataframe.reindex(columns=columns)
+    inside = dataframe["위도"].between(lat_min, lat_max) & dataframe["경도"].between(lng_min, lng_max)
+    dataframe = dataframe[inside].reset_index(drop=True)
+    return dataframe[columns] if columns is not None else dataframe
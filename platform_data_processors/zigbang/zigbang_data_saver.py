@@ -1,41 +1,109 @@
 # platform_data_processors/zigbang/zigbang_data_saver.py
-import pandas as pd
-import logging
 import os
+import shutil
+import tempfile
+import threading
 import requests
-from common_utils.logger_setup import setup_logger
-from platform_configs.zigbang_config import ZIGBANG_IMAGE_BASE_DIR
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+from common_utils.http_transport import get_shared_session
+from platform_data_processors.base_data_saver import BaseDataSaver
+from platform_configs.zigbang_config import (
+    ZIGBANG_IMAGE_BASE_DIR, ZIGBANG_IMAGE_DOWNLOAD_WORKERS, ZIGBANG_IMAGE_PER_HOST_CONCURRENCY,
+    ZIGBANG_IMAGE_STREAM_CHUNK_SIZE
+)
 
-class ZigbangDataSaver:
-    def __init__(self, output_filename, log_level="INFO", log_file=None):
-        self.output_filename = output_filename
-        self.logger = setup_logger(self.__class__.__name__, log_level, log_file)
+# Parquet 저장 시 사용할 명시적 스키마 (컬럼명, 타입)
+ZIGBANG_PARQUET_FIELDS = [
+    ('매물ID', 'int64'),
+    ('매물명', 'string'),
+    ('주소', 'string'),
+    ('거래유형', 'string'),
+    ('보증금(만원)', 'float64'),
+    ('월세(만원)', 'float64'),
+    ('매매가(만원)', 'float64'),
+    ('방유형', 'string'),
+    ('층수', 'string'),
+    ('면적(m2)', 'float64'),
+    ('위도', 'float64'),
+    ('경도', 'float64'),
+    ('건물명', 'string'),
+    ('이미지_URL', 'string'),
+]
+
+class ZigbangDataSaver(BaseDataSaver):
+    platform = "zigbang"
+    parquet_fields = ZIGBANG_PARQUET_FIELDS
+
+    def __init__(self, output_filename, log_level="INFO", log_file=None, **kwargs):
+        super().__init__(output_filename, log_level=log_level, log_file=log_file, **kwargs)
+        self._host_semaphores = {}
+        self._host_semaphores_lock = threading.Lock()
         self.logger.info("ZigbangDataSaver initialized.")
 
-    def save_dataframe_to_csv(self, dataframe):
+    def _host_semaphore(self, url):
+        host = urlparse(url).netloc
+        with self._host_semaphores_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(ZIGBANG_IMAGE_PER_HOST_CONCURRENCY)
+                self._host_semaphores[host] = semaphore
+            return semaphore
+
+    @staticmethod
+    def _copy_atomically(source_path, destination_path):
         """
-        DataFrame을 CSV 파일로 저장합니다.
+        이미 받은 이미지를 다른 매물 디렉토리에 둡니다. 가능하면 하드 링크, 아니면 임시 파일에 복사 후 이름을 바꿉니다.
         """
-        if dataframe.empty:
-            self.logger.warning("No data to save to CSV.")
+        try:
+            os.link(source_path, destination_path)
             return
+        except FileExistsError:
+            return
+        except OSError:
+            pass
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(destination_path), suffix=".part")
+        os.close(fd)
+        try:
+            shutil.copyfile(source_path, temp_path)
+            os.replace(temp_path, destination_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
 
-        # 출력 디렉토리 확인 및 생성
-        output_dir = os.path.dirname(self.output_filename)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-
+    def _download_image(self, session, img_url, destination_paths):
+        """
+        이미지 하나를 받아 destination_paths[0]에 저장하고, 같은 URL을 쓰는 나머지 경로에는 복사합니다.
+        본문은 조각 단위로 임시 파일(.part)에 쓴 뒤 원자적으로 이름을 바꾸므로,
+        중간에 중단되어도 불완전한 파일이 최종 이름으로 남지 않습니다.
+        """
+        first_path = destination_paths[0]
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(first_path), suffix=".part")
         try:
-            dataframe.to_csv(self.output_filename, index=False, encoding='utf-8-sig')
-            self.logger.info(f"Successfully saved {len(dataframe)} unique records to {self.output_filename}")
-        except Exception as e:
-            self.logger.error(f"Failed to save data to {self.output_filename}: {e}")
+            with os.fdopen(fd, 'wb') as f, self._host_semaphore(img_url):
+                with session.get(img_url, timeout=10, stream=True) as img_response:
+                    img_response.raise_for_status()
+                    for chunk in img_response.iter_content(chunk_size=ZIGBANG_IMAGE_STREAM_CHUNK_SIZE):
+                        f.write(chunk)
+            os.replace(temp_path, first_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        for other_path in destination_paths[1:]:
+            self._copy_atomically(first_path, other_path)
 
-    def save_images(self, item_ids_with_image_urls):
+    def save_images(self, item_ids_with_image_urls, max_workers=ZIGBANG_IMAGE_DOWNLOAD_WORKERS):
         """
         매물 ID와 이미지 URL을 바탕으로 이미지를 저장합니다.
         item_ids_with_image_urls는 리스트 내 딕셔너리 형태: 
         [{'item_id': '12345', 'image_urls': ['url1', 'url2']}, ...]
+
+        - 커넥션을 재사용하는 세션으로 최대 max_workers개를 동시에 받으며, 호스트별 동시 다운로드 수를 제한합니다.
+        - 이미 저장된 파일은 건너뛰므로 중단된 작업을 다시 실행하면 남은 파일만 받습니다.
+        - 여러 매물에서 같은 이미지 URL을 쓰면 한 번만 받고 나머지는 복사합니다.
         """
         self.logger.info(f"Starting image saving process for {len(item_ids_with_image_urls)} items.")
         
@@ -43,6 +111,9 @@ class ZigbangDataSaver:
         if not os.path.exists(ZIGBANG_IMAGE_BASE_DIR):
             os.makedirs(ZIGBANG_IMAGE_BASE_DIR)
 
+        # URL별로 저장해야 할 경로들을 모음 (같은 URL은 한 번만 다운로드)
+        destinations_by_url = {}
+        skipped_count = 0
         for item_info in item_ids_with_image_urls:
             item_id = item_info.get('item_id')
             image_urls = item_info.get('image_urls', [])
@@ -52,27 +123,44 @@ class ZigbangDataSaver:
                 continue
 
             img_item_dir = os.path.join(ZIGBANG_IMAGE_BASE_DIR, str(item_id))
-
-            # 디렉토리가 있으면 이미 이미지가 저장된 상태로 간주
-            if os.path.exists(img_item_dir):
-                # self.logger.debug(f"Image directory for item {item_id} already exists. Skipping.")
-                continue
-            
             os.makedirs(img_item_dir, exist_ok=True) # 디렉토리 생성
+            # 이전 실행이 중단되며 남긴 임시 파일 정리
+            for file_name in os.listdir(img_item_dir):
+                if file_name.endswith(".part"):
+                    os.remove(os.path.join(img_item_dir, file_name))
 
             for idx, img_url in enumerate(image_urls):
+                img_name = os.path.join(img_item_dir, f"{idx+1}.jpg")
+                # 파일 단위로 이어받기: 최종 파일이 있으면 이전 실행에서 완전히 저장된 것
+                if os.path.exists(img_name):
+                    skipped_count += 1
+                    continue
+                destinations_by_url.setdefault(img_url, []).append(img_name)
+
+        downloaded_count = 0
+        failed_count = 0
+        # API 클라이언트와 같은 공용 세션을 사용해 이미지 호스트와의 커넥션도 재사용
+        session = get_shared_session()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._download_image, session, img_url, destination_paths): img_url
+                for img_url, destination_paths in destinations_by_url.items()
+            }
+            for future in as_completed(futures):
+                img_url = futures[future]
                 try:
-                    img_response = requests.get(img_url, timeout=10)
-                    img_response.raise_for_status()
-                    img_name = os.path.join(img_item_dir, f"{idx+1}.jpg")
-                    with open(img_name, 'wb') as f:
-                        f.write(img_response.content)
-                    self.logger.debug(f"Saved image {idx+1} for item {item_id}")
+                    future.result()
+                    downloaded_count += 1
+                    self.logger.debug("Saved image %s to %d location(s)", img_url, len(destinations_by_url[img_url]))
                 except requests.exceptions.RequestException as e:
-                    self.logger.error(f"Failed to download image from {img_url} for item {item_id}: {e}")
+                    failed_count += 1
+                    self.logger.error(f"Failed to download image from {img_url}: {e}")
                 except Exception as e:
-                    self.logger.critical(f"An unhandled error occurred during image save for {item_id}: {e}")
-            self.logger.info(f"Finished saving images for item {item_id}.")
-        
-        self.logger.info("All image saving processes completed.")
+                    failed_count += 1
+                    self.logger.critical(f"An unhandled error occurred during image save for {img_url}: {e}")
 
+        self.logger.info(
+            f"All image saving processes completed: {downloaded_count} downloaded, "
+            f"{skipped_count} already saved, {failed_count} failed."
+        )
+        return {"downloaded": downloaded_count, "skipped": skipped_count, "failed": failed_count}
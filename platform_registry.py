@@ -0,0 +1,103 @@
+# platform_registry.py
+"""
+수집 대상 플랫폼 목록입니다. 플랫폼마다 수집기/변환기/저장기 클래스의 위치("모듈:클래스")만 적어 두고,
+해당 플랫폼을 실제로 수집할 때 처음 import합니다. 그래서 직방만 수집하면 다방 모듈은 읽지 않고,
+pandas처럼 무거운 의존성도 변환기를 처음 만들 때까지 읽지 않습니다.
+
+새 플랫폼은 register_platform(PlatformSpec(...))으로 추가하며, 다른 플랫폼의 시작 시간에는 영향을 주지 않습니다.
+"""
+import importlib
+import threading
+
+from platform_configs.zigbang_config import ZIGBANG_OUTPUT_CSV_PATH, ZIGBANG_DEFAULT_ITEM_TYPE
+from platform_configs.dabang_config import DABANG_OUTPUT_CSV_PATH
+
+
+class PlatformSpec:
+    """
+    플랫폼 하나의 구성 요소 위치와 수집 방식입니다.
+
+    - collector/converter/saver: "모듈 경로:클래스 이름"
+    - output_path: 저장 경로 형식 문자열 ({item_type}, {region} 사용 가능)
+    - item_types: 선택할 수 있는 매물 유형. None이면 매물 유형 구분 없이 all_item_type 하나로 수집
+    - crawl_method: 작업 하나를 실행할 MainContainer 메서드 이름
+    """
+    def __init__(self, name, collector, converter, saver, output_path, crawl_method,
+                 item_types=None, default_item_types=None, all_item_type="all"):
+        self.name = name
+        self.collector = collector
+        self.converter = converter
+        self.saver = saver
+        self.output_path = output_path
+        self.crawl_method = crawl_method
+        self.item_types = item_types
+        self.default_item_types = default_item_types or ([all_item_type] if item_types is None else item_types[:1])
+        self.all_item_type = all_item_type
+        self._classes = {}
+        self._lock = threading.Lock()
+
+    def load(self, component):
+        """
+        "collector", "converter", "saver" 중 하나의 클래스를 반환합니다. 처음 호출할 때 모듈을 import합니다.
+        """
+        with self._lock:
+            cls = self._classes.get(component)
+            if cls is None:
+                module_path, class_name = getattr(self, component).split(":")
+                cls = getattr(importlib.import_module(module_path), class_name)
+                self._classes[component] = cls
+            return cls
+
+    def output_path_for(self, item_type, region):
+        return self.output_path.format(item_type=item_type, region=region)
+
+    def job_item_types(self, item_types=None):
+        """
+        요청한 매물 유형 중 이 플랫폼이 지원하는 것만 반환합니다. (매물 유형 구분이 없는 플랫폼은 all_item_type 하나)
+        """
+        if self.item_types is None:
+            return [self.all_item_type]
+        if item_types is None:
+            return list(self.default_item_types)
+        return [item_type for item_type in item_types if item_type in self.item_types]
+
+
+_platforms = {}
+
+
+def register_platform(spec):
+    _platforms[spec.name] = spec
+    return spec
+
+
+def get_platform(name):
+    try:
+        return _platforms[name]
+    except KeyError:
+        raise ValueError(f"Unknown platform '{name}'. Available platforms: {', '.join(available_platforms())}") from None
+
+
+def available_platforms():
+    return list(_platforms)
+
+
+register_platform(PlatformSpec(
+    "zigbang",
+    collector="platform_crawlers.zigbang.zigbang_collector:ZigbangCollector",
+    converter="platform_data_processors.zigbang.zigbang_data_converter:ZigbangDataConverter",
+    saver="platform_data_processors.zigbang.zigbang_data_saver:ZigbangDataSaver",
+    output_path=ZIGBANG_OUTPUT_CSV_PATH,
+    crawl_method="crawl_zigbang",
+    item_types=["villa", "apt", "oneroom", "officetel"],
+    default_item_types=[ZIGBANG_DEFAULT_ITEM_TYPE],
+))
+
+# 다방은 목록 API 하나로 모든 방 유형을 함께 받으므로 매물 유형 구분이 없음
+register_platform(PlatformSpec(
+    "dabang",
+    collector="platform_crawlers.dabang.dabang_collector:DabangCollector",
+    converter="platform_data_processors.dabang.dabang_data_converter:DabangDataConverter",
+    saver="platform_data_processors.dabang.dabang_data_saver:DabangDataSaver",
+    output_path=DABANG_OUTPUT_CSV_PATH,
+    crawl_method="crawl_dabang",
+))